@@ -0,0 +1,43 @@
+"""Shared setup for the PGVA example scripts.
+
+Configures logging and builds the PGVA instance used by every example, so
+examples run in the same interpreter share one instance and one connection.
+The device is set with the PGVA_IP, PGVA_PORT and PGVA_UNIT environment variables.
+"""
+
+from os import getenv
+
+from pgva import PGVA, PGVATCPConfig
+
+try:
+    from festo_python_logging import configure_logging
+
+    configure_logging(verbose=True, silence=["pymodbus.logging"])
+except Exception:
+    import logging
+
+    logging.basicConfig(
+        level=logging.INFO,  # Set minimum level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    logger = logging.getLogger("pgva")
+    logger.warning("Festo Logger not in current working environment. Falling back to default")
+
+# TCP/IP configuration of the example device, read from the environment once at import.
+_CONFIG = PGVATCPConfig(
+    interface="tcp/ip",
+    unit_id=int(getenv("PGVA_UNIT", "1")),
+    ip=getenv("PGVA_IP", "192.168.0.1"),
+    port=int(getenv("PGVA_PORT", "502")),
+)
+
+_pgva: PGVA | None = None
+
+
+def get_pgva() -> PGVA:
+    """Return the PGVA instance for the configured device, creating it on first use."""
+    global _pgva
+    if _pgva is None:
+        # Initialize the PGVA instance.
+        _pgva = PGVA(config=_CONFIG)
+    return _pgva
@@ -0,0 +1,38 @@
+"""Example script to drive two PGVA instances concurrently with asyncio."""
+
+import asyncio
+from os import getenv
+
+from pgva import AsyncPGVA, PGVATCPConfig
+
+try:
+    from festo_python_logging import configure_logging
+
+    configure_logging(verbose=True, silence=["pymodbus.logging"])
+except Exception:
+    import logging
+
+    logging.basicConfig(
+        level=logging.INFO,  # Set minimum level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    logger = logging.getLogger("pgva")
+    logger.warning("Festo Logger not in current working environment. Falling back to default")
+
+ip_1 = getenv("PGVA_IP", "192.168.0.1")
+ip_2 = getenv("PGVA_IP_2", "192.168.0.2")
+
+
+async def main():
+    """Set the output pressure on both devices at the same time and read them back."""
+    async with (
+        AsyncPGVA(config=PGVATCPConfig(interface="tcp/ip", unit_id=1, ip=ip_1, port=502)) as pgva_1,
+        AsyncPGVA(config=PGVATCPConfig(interface="tcp/ip", unit_id=1, ip=ip_2, port=502)) as pgva_2,
+    ):
+        await asyncio.gather(pgva_1.set_output_pressure(100), pgva_2.set_output_pressure(-100))
+        data_1, data_2 = await asyncio.gather(pgva_1.get_internal_sensor_data(), pgva_2.get_internal_sensor_data())
+        print(f"PGVA 1 sensor data: {data_1}")
+        print(f"PGVA 2 sensor data: {data_2}")
+
+
+asyncio.run(main())
@@ -1,34 +1,12 @@
 """Example script to run timed pressure on a PGVA instance."""
 
-from os import getenv
+from _common import get_pgva
 
-from pgva import PGVA, PGVATCPConfig
-
-try:
-    from festo_python_logging import configure_logging
-
-    configure_logging(verbose=True, silence=["pymodbus.logging"])
-except Exception:
-    import logging
-
-    logging.basicConfig(
-        level=logging.INFO,  # Set minimum level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    )
-    logger = logging.getLogger("pgva")
-    logger.warning("Festo Logger not in current working environment. Falling back to default")
-
-
-ip = getenv("PGVA_IP", "192.168.0.1")
-
-"""Create a PGVA instance with TCP/IP configuration."""
-pgva_config = PGVATCPConfig(interface="tcp/ip", unit_id=1, ip=ip, port=502)
-"""Initialize the PGVA instance."""
-pgva = PGVA(config=pgva_config)
+"""Get the shared PGVA instance."""
+pgva = get_pgva()
 
 """Run a timed pressure process."""
 actuation_time_ms = 100
 target_pressure_mbar = 100
-pgva.set_output_pressure(target_pressure_mbar)
-pgva.trigger_actuation_valve(actuation_time_ms)
+pgva.run_timed_pressure(target_pressure_mbar, actuation_time_ms)
 print(f"Timed pressure set to {target_pressure_mbar} mbar for {actuation_time_ms} ms")
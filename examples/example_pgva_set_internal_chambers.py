@@ -1,34 +1,11 @@
 """Example script to set internal pressure and vacuum chambers on a PGVA instance."""
 
-from os import getenv
+from _common import get_pgva
 
-from pgva import PGVA, PGVATCPConfig
+"""Get the shared PGVA instance."""
+pgva = get_pgva()
 
-try:
-    from festo_python_logging import configure_logging
-
-    configure_logging(verbose=True, silence=["pymodbus.logging"])
-except Exception:
-    import logging
-
-    logging.basicConfig(
-        level=logging.INFO,  # Set minimum level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    )
-    logger = logging.getLogger("pgva")
-    logger.warning("Festo Logger not in current working environment. Falling back to default")
-
-ip = getenv("PGVA_IP", "192.168.0.1")
-
-"""Create a PGVA instance with TCP/IP configuration."""
-pgva_config = PGVATCPConfig(interface="tcp/ip", unit_id=1, ip=ip, port=502)
-"""Initialize the PGVA instance."""
-pgva = PGVA(config=pgva_config)
-
-"""Set the internal pressure chamber to a specified value (e.g., 100 mbar)."""
+"""Set the internal pressure and vacuum chambers together in a single Modbus request."""
 internal_pressure_mbar = 200
-pgva.set_pressure_chamber(internal_pressure_mbar)
-
-"""Set the internal vacuum chamber to a specified value (e.g., -100 mbar)."""
 internal_vacuum_mbar = -200
-pgva.set_vacuum_chamber(internal_vacuum_mbar)
+pgva.set_chambers(internal_pressure_mbar, internal_vacuum_mbar)
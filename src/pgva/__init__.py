@@ -1,13 +1,39 @@
+import importlib
 import logging
+from typing import TYPE_CHECKING
 
-from .pgva import PGVA
 from .pgva_config import PGVASerialConfig, PGVATCPConfig
 
+if TYPE_CHECKING:
+    from .pgva import PGVA, AsyncPGVA
+    from .pgva_batch import PGVABatchClient
+
 # Ensure the package logger is silent by default when used as a library.
 logging.getLogger("pgva").addHandler(logging.NullHandler())
 
 __all__ = [
     "PGVA",
+    "AsyncPGVA",
+    "PGVABatchClient",
     "PGVATCPConfig",
     "PGVASerialConfig",
 ]
+
+# Front ends pull in pymodbus, so they are only imported on first attribute access (PEP 562).
+_LAZY_ATTRIBUTES = {
+    "PGVA": ".pgva",
+    "AsyncPGVA": ".pgva",
+    "PGVABatchClient": ".pgva_batch",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_ATTRIBUTES.keys())
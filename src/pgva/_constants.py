@@ -4,6 +4,9 @@ These values are derived from the PGVA-1 operation manual and are used
 internally by the driver. They are not part of the public API.
 """
 
+# Firmware version without the pump enable register and the external sensor input
+LEGACY_FIRMWARE_VERSION = (2, 1, 3)
+
 # Output pressure limits (mBar)
 MAXIMUM_OUTPUT_PRESSURE_MBAR = 450
 MINIMUM_OUTPUT_PRESSURE_MBAR = -450
@@ -16,6 +19,34 @@ MINIMUM_PRESSURE_CHAMBER_MBAR = 200
 MAXIMUM_VACUUM_CHAMBER_MBAR = -200
 MINIMUM_VACUUM_CHAMBER_MBAR = -900
 
+# Valid set point ranges (mBar), built once so validation is a single membership test
+OUTPUT_PRESSURE_RANGE = range(MINIMUM_OUTPUT_PRESSURE_MBAR, MAXIMUM_OUTPUT_PRESSURE_MBAR + 1)
+PRESSURE_CHAMBER_RANGE = range(MINIMUM_PRESSURE_CHAMBER_MBAR, MAXIMUM_PRESSURE_CHAMBER_MBAR + 1)
+VACUUM_CHAMBER_RANGE = range(MINIMUM_VACUUM_CHAMBER_MBAR, MAXIMUM_VACUUM_CHAMBER_MBAR + 1)
+
+# Valid valve actuation times (ms); 65535 is rejected by the driver
+MINIMUM_ACTUATION_TIME_MS = 5
+MAXIMUM_ACTUATION_TIME_MS = 65534
+ACTUATION_TIME_RANGE = range(MINIMUM_ACTUATION_TIME_MS, MAXIMUM_ACTUATION_TIME_MS + 1)
+
+# Bounds of the exponential backoff between busy polls after a write (s)
+POLL_DELAY_MIN_S = 0.001
+POLL_DELAY_MAX_S = 0.020
+
+# Modbus RTU characters on the line for one status poll: 8 byte request, 7 byte
+# response and the 3.5 character silent interval after each frame
+RTU_STATUS_POLL_CHARS = 22
+# Bits per RTU character: start bit, 8 data bits, parity or second stop bit, stop bit
+RTU_BITS_PER_CHAR = 11
+
+# Extra time slept after a valve actuation so the device has closed the valve before returning (s)
+VALVE_ACTUATION_MARGIN_S = 0.01
+
 # Scaling factors derived from the PGVA-1 operation manual
 PRESSURE_CHAMBER_CONVERSION_FACTOR = 1 / 0.5543
 VACUUM_CHAMBER_CONVERSION_FACTOR = 1 / -0.277
+
+# Raw threshold register values for every whole-mBar chamber set point, precomputed so
+# setting a chamber is a table lookup instead of a float multiply and int() cast
+PRESSURE_MBAR_TO_RAW = {mbar: int(mbar * PRESSURE_CHAMBER_CONVERSION_FACTOR) for mbar in PRESSURE_CHAMBER_RANGE}
+VACUUM_MBAR_TO_RAW = {mbar: int(mbar * VACUUM_CHAMBER_CONVERSION_FACTOR) for mbar in VACUUM_CHAMBER_RANGE}
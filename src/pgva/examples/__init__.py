@@ -0,0 +1 @@
+"""Example workflows for the PGVA driver, runnable with ``python -m pgva.examples``."""
@@ -0,0 +1,134 @@
+"""
+PGVA example workflows command line.
+
+Runs the workflows from the example scripts as subcommands of a single interpreter
+sharing one PGVA instance, so several workflows can be chained without paying the
+interpreter start-up and pymodbus import for each one.
+
+Example:
+    python -m pgva.examples --ip 192.168.0.1 print-info set-output-pressure --mbar 100 read-sensors
+"""
+
+import argparse
+import logging
+import sys
+from collections.abc import Callable
+from os import getenv
+
+from pgva import PGVA, PGVATCPConfig
+
+
+def _print_info(pgva: PGVA, args: argparse.Namespace) -> None:
+    pgva.print_driver_information()
+
+
+def _read_sensors(pgva: PGVA, args: argparse.Namespace) -> None:
+    print(f"Internal sensor data: {pgva.get_internal_sensor_data()}")
+
+
+def _set_output_pressure(pgva: PGVA, args: argparse.Namespace) -> None:
+    reading = pgva.set_and_read_output_pressure(args.mbar)
+    print(f"Output Pressure set to: {reading} mbar")
+
+
+def _run_timed_pressure(pgva: PGVA, args: argparse.Namespace) -> None:
+    pgva.run_timed_pressure(args.mbar, args.ms)
+    print(f"Timed pressure set to {args.mbar} mbar for {args.ms} ms")
+
+
+def _set_chambers(pgva: PGVA, args: argparse.Namespace) -> None:
+    pgva.set_chambers(args.pressure, args.vacuum)
+
+
+def _toggle_pump(pgva: PGVA, args: argparse.Namespace) -> None:
+    pgva.toggle_pump(args.state == "on")
+
+
+# Workflow per subcommand name, in the order they are listed in the help text
+_COMMANDS: dict[str, Callable[[PGVA, argparse.Namespace], None]] = {
+    "print-info": _print_info,
+    "read-sensors": _read_sensors,
+    "set-output-pressure": _set_output_pressure,
+    "run-timed-pressure": _run_timed_pressure,
+    "set-chambers": _set_chambers,
+    "toggle-pump": _toggle_pump,
+}
+
+
+def _build_parsers() -> tuple[argparse.ArgumentParser, argparse.ArgumentParser]:
+    """
+    Builds the parser for the connection options and the parser for a single subcommand.
+
+    Args:
+        None
+
+    Returns:
+        Tuple of the connection option parser and the subcommand parser
+    """
+    connection = argparse.ArgumentParser(
+        prog="python -m pgva.examples",
+        description="Run PGVA example workflows. Several subcommands can be given in one call.",
+    )
+    connection.add_argument("--ip", default=getenv("PGVA_IP", "192.168.0.1"), help="PGVA IP address (env PGVA_IP)")
+    connection.add_argument("--port", type=int, default=int(getenv("PGVA_PORT", "502")), help="ModbusTCP port")
+    connection.add_argument("--unit-id", type=int, default=int(getenv("PGVA_UNIT", "1")), help="Modbus unit ID")
+    connection.add_argument("-v", "--verbose", action="store_true", help="Log at DEBUG instead of INFO")
+    connection.add_argument("commands", nargs="*", metavar="command", help=", ".join(_COMMANDS))
+
+    command = argparse.ArgumentParser(prog="python -m pgva.examples", add_help=False)
+    subparsers = command.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("print-info", help="Log the driver information")
+    subparsers.add_parser("read-sensors", help="Print the internal sensor data")
+    output = subparsers.add_parser("set-output-pressure", help="Set the output pressure and read it back")
+    output.add_argument("--mbar", type=int, required=True, help="Output pressure in mBar, -450 ... 450")
+    timed = subparsers.add_parser("run-timed-pressure", help="Set the output pressure and open the valve")
+    timed.add_argument("--mbar", type=int, required=True, help="Output pressure in mBar, -450 ... 450")
+    timed.add_argument("--ms", type=int, required=True, help="Valve actuation time in ms")
+    chambers = subparsers.add_parser("set-chambers", help="Set the internal pressure and vacuum chambers")
+    chambers.add_argument("--pressure", type=int, required=True, help="Pressure chamber in mBar, 200 ... 1000")
+    chambers.add_argument("--vacuum", type=int, required=True, help="Vacuum chamber in mBar, -900 ... -200")
+    pump = subparsers.add_parser("toggle-pump", help="Switch the pump on or off")
+    pump.add_argument("state", choices=("on", "off"))
+    return connection, command
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Parses the command line and runs each requested workflow against one PGVA instance.
+
+    Args:
+        argv (list[str] | None): Arguments without the program name. Defaults to sys.argv[1:]
+
+    Returns:
+        Process exit code
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    # Split the arguments at every subcommand name so each workflow is parsed on its own
+    groups: list[list[str]] = [[]]
+    for arg in argv:
+        if arg in _COMMANDS:
+            groups.append([])
+        groups[-1].append(arg)
+    connection_parser, command_parser = _build_parsers()
+    options = connection_parser.parse_args(groups[0])
+    if options.commands:
+        connection_parser.error(f"unknown command: {options.commands[0]}")
+    if len(groups) == 1:
+        connection_parser.error("at least one command is required")
+    commands = [command_parser.parse_args(group) for group in groups[1:]]
+
+    logging.basicConfig(
+        level=logging.DEBUG if options.verbose else logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    pgva = PGVA(config=PGVATCPConfig(interface="tcp/ip", ip=options.ip, port=options.port, unit_id=options.unit_id))
+    try:
+        for args in commands:
+            _COMMANDS[args.command](pgva, args)
+    finally:
+        pgva.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,17 +2,42 @@
 PGVA interface Front end.
 
 Unified driver front-end exposing standard PGVA control API for both ModbusSerial and ModbusTCP
- communication clients
+ communication clients, plus an asyncio front-end for ModbusTCP
 """
 
 import logging
+from collections.abc import Callable, Sequence
 
-from .pgva_communication import PGVAModbusClient, PGVAModbusSerial, PGVAModbusTCP
+from .pgva_communication import PGVAAsyncModbusTCP, PGVAModbusClient, PGVAModbusTCP
 from .pgva_config import PGVAConfig, PGVASerialConfig, PGVATCPConfig
 
 logger = logging.getLogger(__name__)
 
 
+def _raise_serial_experimental(config: PGVAConfig) -> PGVAModbusClient:
+    """
+    Rejects serial configurations passed through the PGVA front end.
+
+    Args:
+        config (PGVASerialConfig): The rejected serial configuration
+
+    Raises:
+        NotImplementedError: Always, serial support must be invoked through PGVAModbusSerial directly.
+    """
+    logger.error(
+        "Serial support for PGVA communication is currently experimental. The serial connection can be tested "
+        "explicitly by instantiating PGVAModbusSerial and passing in the communication backend explicitly."
+    )
+    raise NotImplementedError("Serial communication is experimental and must be invoked directly")
+
+
+# Backend factory per configuration type. The TCP entry looks PGVAModbusTCP up at call time.
+_BACKENDS: dict[type, Callable[[PGVAConfig], PGVAModbusClient]] = {
+    PGVATCPConfig: lambda config: PGVAModbusTCP(config=config),
+    PGVASerialConfig: _raise_serial_experimental,
+}
+
+
 class PGVA:
     """
     PGVA driver class.
@@ -21,6 +46,8 @@ class PGVA:
     to control the PGVA-1 device.
     """
 
+    __slots__ = ("_config", "_backend")
+
     _backend: PGVAModbusClient
 
     def __init__(self, config: PGVAConfig):
@@ -39,23 +66,16 @@ class PGVA:
             NotImplementedError: If a serial configuration is passed through PGVA.
             TypeError: If config is not a supported PGVAConfig type for this driver.
         """
-        if isinstance(config, PGVAConfig):
-            self._config = config
-            match config:
-                case PGVASerialConfig():
-                    logger.error("""
-                        Serial support for PGVA communication is currently experimental.
-                        The serial connected can be tested explicitly by instantiating PGVAModbusSerial and passing in the communication backend explicitly.
-                    """)
-                    raise NotImplementedError("Serial communication is experimental and must be invoked directly")
-                    self._backend = PGVAModbusSerial(config=self._config)
-                    logger.debug("PGVA front-end initialised with serial backend")
-                case PGVATCPConfig():
-                    self._backend = PGVAModbusTCP(config=self._config)
-                    logger.debug("PGVA front-end initialised with TCP backend")
-        else:
+        backend_factory = _BACKENDS.get(type(config))
+        if backend_factory is None:
+            # Fall back to the closest supported base class for config subclasses
+            backend_factory = next((_BACKENDS[cls] for cls in type(config).__mro__ if cls in _BACKENDS), None)
+        if backend_factory is None:
             logger.error("Unsupported configuration type passed to PGVA: %s", type(config).__name__)
             raise TypeError("Error, configuration passed in is not supported by driver")
+        self._config = config
+        self._backend = backend_factory(self._config)
+        logger.debug("PGVA front-end initialised with %s backend", type(self._backend).__name__)
 
     def set_output_pressure(self, pressure: int) -> None:
         """
@@ -69,17 +89,58 @@ class PGVA:
         """
         self._backend.set_output_pressure(pressure)
 
-    def trigger_actuation_valve(self, actuation_time: int) -> None:
+    def set_and_read_output_pressure(self, pressure: int) -> int | None:
+        """
+        Sets the output pressure and reads it back without a separate request.
+
+        Args:
+            pressure (int): Pressure in mBar between -450 ... 450
+
+        Returns:
+            Output pressure reading in mBar, or None if it could not be set
+        """
+        return self._backend.set_and_read_output_pressure(pressure)
+
+    def set_output_pressure_ramp(self, values: Sequence[int], dwell_ms: int = 0) -> None:
+        """
+        Steps the output pressure through a sequence of set points.
+
+        Args:
+            values (Sequence[int]): Set points in mBar, each between -450 ... 450
+            dwell_ms (int): Time in ms to hold each set point before writing the next. Defaults to 0.
+
+        Returns:
+            None
+        """
+        self._backend.set_output_pressure_ramp(values, dwell_ms=dwell_ms)
+
+    def trigger_actuation_valve(self, actuation_time: int, wait: bool = True) -> None:
         """
         Opens the actuation valve for a certain amount of time.
 
         Args:
             actuation_time (int): Time in milliseconds
+            wait (bool): Block until the valve has closed again. Pass False to
+                return straight after the write and overlap other work. Defaults to True.
+
+        Returns:
+            None
+        """
+        self._backend.set_actuation_time(actuation_time=actuation_time, wait=wait)
+
+    def run_timed_pressure(self, pressure_mbar: int, time_ms: int, wait: bool = True) -> None:
+        """
+        Sets the output pressure and opens the actuation valve for a certain amount of time.
+
+        Args:
+            pressure_mbar (int): Pressure in mBar between -450 ... 450
+            time_ms (int): Time in milliseconds
+            wait (bool): Block until the valve has closed again. Defaults to True.
 
         Returns:
             None
         """
-        self._backend.set_actuation_time(actuation_time=actuation_time)
+        self._backend.run_timed_pressure(pressure_mbar, time_ms, wait=wait)
 
     def set_pressure_chamber(self, pressure: int) -> None:
         """
@@ -105,7 +166,20 @@ class PGVA:
         """
         self._backend.set_vacuum_chamber(vacuum)
 
-    def get_pressure_chamber(self) -> int:
+    def set_chambers(self, pressure: int, vacuum: int) -> None:
+        """
+        Sets the internal pressure and vacuum chambers in one Modbus transaction.
+
+        Args:
+            pressure (int): Range between 200 and 1000 mBar
+            vacuum (int): Range between -900 and -200 mBar
+
+        Returns:
+            None
+        """
+        self._backend.set_chambers(pressure, vacuum)
+
+    def get_pressure_chamber(self) -> int | None:
         """
         Returns the current reading of the pressure chamber in mBar.
 
@@ -113,11 +187,11 @@ class PGVA:
             None
 
         Returns:
-            Pressure chamber pressure in mBar
+            Pressure chamber pressure in mBar, or None if the read failed
         """
         return self._backend.get_pressure_chamber()
 
-    def get_vacuum_chamber(self) -> int:
+    def get_vacuum_chamber(self) -> int | None:
         """
         Returns the current reading of the vacuum chamber in mBar.
 
@@ -125,11 +199,11 @@ class PGVA:
             None
 
         Returns:
-            Vacuum chamber pressure in mBar
+            Vacuum chamber pressure in mBar, or None if the read failed
         """
         return self._backend.get_vacuum_chamber()
 
-    def get_output_pressure(self) -> int:
+    def get_output_pressure(self) -> int | None:
         """
         Returns the output port pressure in mBar.
 
@@ -137,7 +211,7 @@ class PGVA:
             None
 
         Returns:
-            Positive or negative pressure in mBar
+            Positive or negative pressure in mBar, or None if the read failed
         """
         return self._backend.get_output_pressure()
 
@@ -165,53 +239,76 @@ class PGVA:
         """
         self._backend.toggle_pump(toggle)
 
-    def get_status_word(self) -> dict:
+    def invalidate_pump_cache(self) -> None:
+        """
+        Forgets the cached pump state, so the next pressure set reads it from the PGVA.
+
+        Call this when the pump may have been switched by another client or on the device.
+
+        Returns:
+            None
+        """
+        self._backend.invalidate_pump_cache()
+
+    def get_status_word(self, copy: bool = True) -> dict:
         """
         Gets the status word from the PGVA.
 
         Args:
-            None
+            copy (bool): Return an independent dictionary instead of the shared decoded one. Defaults to True.
 
         Returns:
            Dictionary of the status word
         """
-        return self._backend.get_status_word()
+        return self._backend.get_status_word(copy=copy)
 
-    def get_warning_word(self) -> dict:
+    def get_warning_word(self, copy: bool = True) -> dict:
         """
         Gets the warning word from the PGVA-1.
 
         Args:
-            None
+            copy (bool): Return an independent dictionary instead of the shared decoded one. Defaults to True.
 
         Returns:
             Dictionary of warning word
         """
-        return self._backend.get_warning_word()
+        return self._backend.get_warning_word(copy=copy)
 
-    def get_error_word(self) -> dict:
+    def get_error_word(self, copy: bool = True) -> dict:
         """
         Gets the error word from the PGVA-1.
 
         Args:
-            None
+            copy (bool): Return an independent dictionary instead of the shared decoded one. Defaults to True.
 
         Returns:
             Dictionary of error word
         """
-        return self._backend.get_error_word()
+        return self._backend.get_error_word(copy=copy)
 
-    def get_modbus_error_word(self) -> dict:
+    def get_modbus_error_word(self, copy: bool = True) -> dict:
         """
         Get the error word from the PGVA-1.
 
         Args:
-            None
+            copy (bool): Return an independent dictionary instead of the shared decoded one. Defaults to True.
 
         Returns:
             Dictionary of modbus error word
         """
-        return self._backend.get_modbus_error_word()
+        return self._backend.get_modbus_error_word(copy=copy)
+
+    def get_all_words(self, copy: bool = True) -> dict:
+        """
+        Get the status, warning, error and modbus error words from the PGVA-1 in one request.
+
+        Args:
+            copy (bool): Return independent dictionaries instead of the shared decoded ones. Defaults to True.
+
+        Returns:
+            Dictionary of the four words keyed by "Status", "Warning", "Error" and "ModbusError"
+        """
+        return self._backend.get_all_words(copy=copy)
 
     def toggle_trigger(self, trigger: bool) -> None:
         """
@@ -236,3 +333,246 @@ class PGVA:
             None
         """
         self._backend.print_driver_information()
+
+    def close(self) -> None:
+        """
+        Closes the connection to the PGVA.
+
+        Connections shared with other PGVA instances for the same device stay open
+        until the last of those instances is closed.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self._backend.close()
+
+
+class AsyncPGVA:
+    """
+    Asyncio PGVA driver class.
+
+    Exposes the PGVA-1 control API as coroutines over ModbusTCP, so several devices
+    can be driven concurrently, e.g. with ``asyncio.gather``. Use it as an async
+    context manager or await ``connect()`` before the first call. Create it inside
+    a running event loop, as the underlying Modbus client requires one.
+    """
+
+    __slots__ = ("_config", "_backend")
+
+    _backend: PGVAAsyncModbusTCP
+
+    def __init__(self, config: PGVAConfig):
+        """
+        Asyncio PGVA driver class constructor.
+
+        Args:
+            config (PGVAConfig): A ModbusTCP config for the device
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: If config is not a PGVATCPConfig.
+        """
+        if not isinstance(config, PGVATCPConfig):
+            logger.error("Unsupported configuration type passed to AsyncPGVA: %s", type(config).__name__)
+            raise TypeError("Error, configuration passed in is not supported by the async driver")
+        self._config = config
+        self._backend = PGVAAsyncModbusTCP(config=self._config)
+
+    async def __aenter__(self) -> "AsyncPGVA":
+        """Connects to the PGVA when entering an ``async with`` block."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Closes the connection when leaving an ``async with`` block."""
+        self.close()
+
+    async def connect(self) -> None:
+        """
+        Opens the connection to the PGVA.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        await self._backend.connect()
+
+    def close(self) -> None:
+        """
+        Closes the connection to the PGVA.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self._backend.close()
+
+    async def set_output_pressure(self, pressure: int) -> None:
+        """
+        Sets the output pressure to PGVA.
+
+        Args:
+            pressure (int): Pressure in mBar between -450 ... 450
+
+        Returns:
+            None
+        """
+        await self._backend.set_output_pressure(pressure)
+
+    async def set_output_pressure_ramp(self, values: Sequence[int], dwell_ms: int = 0) -> None:
+        """
+        Steps the output pressure through a sequence of set points.
+
+        Args:
+            values (Sequence[int]): Set points in mBar, each between -450 ... 450
+            dwell_ms (int): Time in ms to hold each set point before writing the next. Defaults to 0.
+
+        Returns:
+            None
+        """
+        await self._backend.set_output_pressure_ramp(values, dwell_ms=dwell_ms)
+
+    async def trigger_actuation_valve(self, actuation_time: int, wait: bool = True) -> None:
+        """
+        Opens the actuation valve for a certain amount of time.
+
+        Args:
+            actuation_time (int): Time in milliseconds
+            wait (bool): Suspend until the valve has closed again. Pass False to
+                return straight after the write and overlap other work. Defaults to True.
+
+        Returns:
+            None
+        """
+        await self._backend.set_actuation_time(actuation_time=actuation_time, wait=wait)
+
+    async def run_timed_pressure(self, pressure_mbar: int, time_ms: int, wait: bool = True) -> None:
+        """
+        Sets the output pressure and opens the actuation valve for a certain amount of time.
+
+        Args:
+            pressure_mbar (int): Pressure in mBar between -450 ... 450
+            time_ms (int): Time in milliseconds
+            wait (bool): Suspend until the valve has closed again. Defaults to True.
+
+        Returns:
+            None
+        """
+        await self._backend.run_timed_pressure(pressure_mbar, time_ms, wait=wait)
+
+    async def set_pressure_chamber(self, pressure: int) -> None:
+        """
+        Sets the internal pressure chamber.
+
+        Args:
+            pressure (int): Range between 200 and 1000 mBar
+
+        Returns:
+            None
+        """
+        await self._backend.set_pressure_chamber(pressure)
+
+    async def set_vacuum_chamber(self, vacuum: int) -> None:
+        """
+        Sets the internal vacuum chamber.
+
+        Args:
+            vacuum (int): Range between -900 and -200 mBar
+
+        Returns:
+            None
+        """
+        await self._backend.set_vacuum_chamber(vacuum)
+
+    async def set_chambers(self, pressure: int, vacuum: int) -> None:
+        """
+        Sets the internal pressure and vacuum chambers in one Modbus transaction.
+
+        Args:
+            pressure (int): Range between 200 and 1000 mBar
+            vacuum (int): Range between -900 and -200 mBar
+
+        Returns:
+            None
+        """
+        await self._backend.set_chambers(pressure, vacuum)
+
+    async def get_pressure_chamber(self) -> int | None:
+        """
+        Returns the current reading of the pressure chamber in mBar.
+
+        Args:
+            None
+
+        Returns:
+            Pressure chamber pressure in mBar, or None if the read failed
+        """
+        return await self._backend.get_pressure_chamber()
+
+    async def get_vacuum_chamber(self) -> int | None:
+        """
+        Returns the current reading of the vacuum chamber in mBar.
+
+        Args:
+            None
+
+        Returns:
+            Vacuum chamber pressure in mBar, or None if the read failed
+        """
+        return await self._backend.get_vacuum_chamber()
+
+    async def get_output_pressure(self) -> int | None:
+        """
+        Returns the output port pressure in mBar.
+
+        Args:
+            None
+
+        Returns:
+            Positive or negative pressure in mBar, or None if the read failed
+        """
+        return await self._backend.get_output_pressure()
+
+    async def get_internal_sensor_data(self) -> dict:
+        """
+        Returns all the internal sensor data in mBar.
+
+        Args:
+            None
+
+        Returns:
+            All current readings of internal sensors
+        """
+        return await self._backend.get_internal_sensor_data()
+
+    async def toggle_pump(self, toggle: bool) -> None:
+        """
+        Enable / Disables the pump.
+
+        Args:
+            toggle (bool): 1 for on, 0 for off
+
+        Returns:
+            None
+        """
+        await self._backend.toggle_pump(toggle)
+
+    def invalidate_pump_cache(self) -> None:
+        """
+        Forgets the cached pump state, so the next pressure set reads it from the PGVA.
+
+        Call this when the pump may have been switched by another client or on the device.
+
+        Returns:
+            None
+        """
+        self._backend.invalidate_pump_cache()
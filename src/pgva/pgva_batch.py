@@ -0,0 +1,212 @@
+"""
+PGVA batch front end.
+
+Synchronous front end for driving several PGVA-1 devices at once. Requests to
+independent devices are issued together on one event loop, whose selector
+(epoll on Linux) waits for all responses instead of serialising the round trips.
+"""
+
+import asyncio
+import logging
+from collections.abc import Hashable, Mapping
+
+from .pgva import AsyncPGVA
+from .pgva_config import PGVATCPConfig
+
+logger = logging.getLogger(__name__)
+
+
+class PGVABatchClient:
+    """
+    PGVA batch driver class.
+
+    Holds one AsyncPGVA per device and a private event loop, and fans every call
+    out to all addressed devices concurrently. Devices are addressed by the keys
+    of the configuration mapping passed to the constructor. The AsyncPGVA
+    instances are created by ``connect()`` on the private loop, as their Modbus
+    clients need a running event loop. Once closed, the client cannot be reconnected.
+    """
+
+    __slots__ = ("_configs", "_devices", "_loop")
+
+    def __init__(self, configs: Mapping[Hashable, PGVATCPConfig]):
+        """
+        PGVA batch driver class constructor.
+
+        Args:
+            configs (Mapping[Hashable, PGVATCPConfig]): ModbusTCP config per device id
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: If any config is not a PGVATCPConfig.
+        """
+        for config in configs.values():
+            if not isinstance(config, PGVATCPConfig):
+                logger.error("Unsupported configuration type passed to PGVABatchClient: %s", type(config).__name__)
+                raise TypeError("Error, configuration passed in is not supported by the batch driver")
+        self._configs = dict(configs)
+        self._devices: dict[Hashable, AsyncPGVA] = {}
+        self._loop = asyncio.new_event_loop()
+
+    def __enter__(self) -> "PGVABatchClient":
+        """Connects to all devices when entering a ``with`` block."""
+        self.connect()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Closes all connections when leaving a ``with`` block."""
+        self.close()
+
+    def _check_open(self) -> None:
+        """
+        Rejects use of the batch after ``close()``.
+
+        Raises:
+            RuntimeError: If the batch has been closed.
+        """
+        if self._loop.is_closed():
+            raise RuntimeError("PGVA batch has been closed, create a new PGVABatchClient to reconnect")
+
+    def _gather(self, calls: Mapping[Hashable, tuple[str, tuple]]) -> dict:
+        """
+        Runs one AsyncPGVA method per device concurrently and waits for all of them.
+
+        A failing device does not abandon the others: every call runs to completion
+        first, each failure is logged with its device id, and then the first failure
+        in call order is raised.
+
+        Args:
+            calls (Mapping[Hashable, tuple[str, tuple]]): Method name and arguments per device id
+
+        Returns:
+            Dict of the method results keyed by device id
+
+        Raises:
+            KeyError: If a device id was not passed to the constructor.
+            RuntimeError: If the batch is not connected or has been closed.
+            Exception: The first exception raised by a device call.
+        """
+        self._check_open()
+        unknown = calls.keys() - self._configs.keys()
+        if unknown:
+            raise KeyError(f"Unknown PGVA device id(s): {sorted(map(str, unknown))}")
+        if not self._devices:
+            raise RuntimeError("PGVA batch is not connected, call connect() first")
+
+        async def run():
+            return await asyncio.gather(
+                *(getattr(self._devices[device_id], name)(*args) for device_id, (name, args) in calls.items()),
+                return_exceptions=True,
+            )
+
+        results = dict(zip(calls, self._loop.run_until_complete(run()), strict=True))
+        failures = [(device_id, result) for device_id, result in results.items() if isinstance(result, BaseException)]
+        for device_id, failure in failures:
+            logger.error("PGVA %s failed during %s: %r", device_id, calls[device_id][0], failure)
+        if failures:
+            raise failures[0][1]
+        return results
+
+    def connect(self) -> None:
+        """
+        Creates the AsyncPGVA of every device on the private event loop and opens the connections.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            RuntimeError: If the batch has been closed.
+        """
+        self._check_open()
+
+        async def create_devices():
+            return {device_id: AsyncPGVA(config=config) for device_id, config in self._configs.items()}
+
+        if not self._devices:
+            self._devices = self._loop.run_until_complete(create_devices())
+        self._gather({device_id: ("connect", ()) for device_id in self._devices})
+        logger.info("PGVA batch connected to %s devices", len(self._devices))
+
+    def close(self) -> None:
+        """
+        Closes the connections to all devices and the event loop.
+
+        Closing again has no effect.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        for device in self._devices.values():
+            device.close()
+        self._devices.clear()
+        if not self._loop.is_closed():
+            self._loop.close()
+
+    def set_output_pressure(self, pressures: Mapping[Hashable, int]) -> None:
+        """
+        Sets the output pressure on several devices at once.
+
+        Args:
+            pressures (Mapping[Hashable, int]): Pressure in mBar between -450 ... 450 per device id
+
+        Returns:
+            None
+        """
+        self._gather({device_id: ("set_output_pressure", (mbar,)) for device_id, mbar in pressures.items()})
+
+    def trigger_actuation_valve(self, actuation_times: Mapping[Hashable, int], wait: bool = True) -> None:
+        """
+        Opens the actuation valve on several devices at once.
+
+        Args:
+            actuation_times (Mapping[Hashable, int]): Time in milliseconds per device id
+            wait (bool): Block until every valve has closed again. Defaults to True.
+
+        Returns:
+            None
+        """
+        self._gather({device_id: ("trigger_actuation_valve", (ms, wait)) for device_id, ms in actuation_times.items()})
+
+    def toggle_pump(self, toggles: Mapping[Hashable, bool]) -> None:
+        """
+        Switches the pump on or off on several devices at once.
+
+        Args:
+            toggles (Mapping[Hashable, bool]): True to enable, False to disable per device id
+
+        Returns:
+            None
+        """
+        self._gather({device_id: ("toggle_pump", (toggle,)) for device_id, toggle in toggles.items()})
+
+    def get_output_pressure(self) -> dict:
+        """
+        Reads the output pressure of every device.
+
+        Args:
+            None
+
+        Returns:
+            Dict of the output pressure in mBar keyed by device id, None where the read failed
+        """
+        return self._gather({device_id: ("get_output_pressure", ()) for device_id in self._devices})
+
+    def get_internal_sensor_data(self) -> dict:
+        """
+        Reads the internal sensor data of every device.
+
+        Args:
+            None
+
+        Returns:
+            Dict of the sensor data dicts keyed by device id
+        """
+        return self._gather({device_id: ("get_internal_sensor_data", ()) for device_id in self._devices})
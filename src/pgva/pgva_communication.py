@@ -6,12 +6,17 @@ PGVA driver can use two different modes of communication to control the device,
 These are implemented here.
 """
 
+import asyncio
+import atexit
+import functools
+import inspect
 import logging
 import socket
 import time
-from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
 
-from pymodbus.client import ModbusSerialClient, ModbusTcpClient
+from pymodbus.client import AsyncModbusTcpClient, ModbusSerialClient, ModbusTcpClient
 from pymodbus.exceptions import ModbusException
 
 import pgva._constants as consts
@@ -20,40 +25,661 @@ from .pgva_config import PGVASerialConfig, PGVATCPConfig, PGVAConfig
 
 logger = logging.getLogger(__name__)
 
+# Modbus registers are 16 bits wide; masking a signed set point with _REGISTER_MASK gives its
+# two's complement wire encoding, and _REGISTER_SIGN_BIT marks negative values when reading back
+_REGISTER_MASK = 0xFFFF
+_REGISTER_SIGN_BIT = 0x8000
+
+# Raw addresses of the registers read on every status poll and sensor read
+_STATUS_WORD_ADDRESS = int(commands.STATUS_WORD)
+_SENSOR_BLOCK_ADDRESS = int(commands.VACUUM_ACTUAL_MBAR)
+_EXTERNAL_SENSOR_ADDRESS = int(commands.EXTERNAL_SENSOR_VALUE)
+
+# Offsets of the individual sensors within the sensor block starting at VACUUM_ACTUAL_MBAR
+_SENSOR_OFFSET_VACUUM = 0
+_SENSOR_OFFSET_PRESSURE = commands.PRESSURE_ACTUAL_MBAR.value - commands.VACUUM_ACTUAL_MBAR.value
+_SENSOR_OFFSET_OUTPUT = commands.OUTPUT_PRESSURE_ACTUAL_MBAR.value - commands.VACUUM_ACTUAL_MBAR.value
+
+# Length of the sensor block. EXTERNAL_SENSOR_VALUE is read on its own, as the registers between
+# it and OUTPUT_PRESSURE_ACTUAL_MBAR are not all part of the register map
+_SENSOR_BLOCK_COUNT = _SENSOR_OFFSET_OUTPUT + 1
+
+# Firmware version, subversion and build registers, read as one block
+_FIRMWARE_VERSION_COUNT = commands.FIRMWARE_BUILD.value - commands.FIRMWARE_VERSION.value + 1
+
+# Block from STATUS_WORD up to and including LAST_MODBUS_ERROR, in which every register is mapped
+_STATUS_BLOCK_COUNT = commands.LAST_MODBUS_ERROR.value - commands.STATUS_WORD.value + 1
+_WORD_OFFSET_MODBUS_ERROR = commands.LAST_MODBUS_ERROR.value - commands.STATUS_WORD.value
+
+# The adjacent warning and error words, read as a block of their own because the registers between
+# LAST_MODBUS_ERROR and WARNING_WORD are not all part of the register map
+_ALARM_BLOCK_ADDRESS = int(commands.WARNING_WORD)
+_ALARM_BLOCK_COUNT = commands.ERROR_WORD.value - commands.WARNING_WORD.value + 1
+_WORD_OFFSET_ERROR = commands.ERROR_WORD.value - commands.WARNING_WORD.value
+
+# Registers from STATUS_WORD up to and including OUTPUT_PRESSURE_ACTUAL_MBAR, so the idle poll can
+# return the output pressure reading without a separate request
+_STATUS_TO_OUTPUT_COUNT = commands.OUTPUT_PRESSURE_ACTUAL_MBAR.value - commands.STATUS_WORD.value + 1
+
+# Modbus function code of the reads kept in the read cache
+_FC_READ_INPUT_REGISTERS = 4
+
+# Modbus clients shared between backends talking to the same device, keyed by
+# ("tcp", ip, port, unit_id) or ("serial", com_port, baudrate, unit_id)
+_client_cache: dict[tuple, ModbusTcpClient | ModbusSerialClient] = {}
+_client_refcount: dict[tuple, int] = {}
+# Firmware version of each shared connection's device, so further backends skip the read
+_firmware_cache: dict[tuple, tuple] = {}
+# Read cache of each shared connection, so a write through any backend discards what all of them cached
+_read_caches: dict[tuple, dict] = {}
+# Last known pump enable state of each shared connection, so a toggle through any backend is seen by all of them.
+# Async backends have a connection each and share their state under ("async-tcp", ip, port, unit_id).
+_pump_states: dict[tuple, bool | None] = {}
+
+
+@dataclass(kw_only=True, slots=True)
+class _CachedRegisterBlock:
+    """
+    Register block kept in a connection's read cache.
+
+    Attributes:
+        expires_ns (int): time.monotonic_ns() value after which the block is read again
+        registers (tuple): Register values of the block
+    """
+
+    expires_ns: int
+    registers: tuple[int, ...]
+
+
+def _tune_tcp_socket(client: ModbusTcpClient) -> None:
+    """
+    Disables Nagle's algorithm and enables keepalive on a connected ModbusTCP client's socket.
+
+    Modbus requests are a few bytes each and wait for their response, so coalescing
+    small segments only delays every round trip.
+
+    Args:
+        client (ModbusTcpClient): Client whose connection has been opened
+    """
+    sock = getattr(client, "socket", None)
+    if sock is None:
+        return
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    except OSError as os_err:
+        logger.debug("Could not set ModbusTCP socket options: %s", os_err)
+
+
+def _open_tcp_client(key: tuple) -> ModbusTcpClient:
+    """
+    Opens a new ModbusTCP connection.
+
+    Args:
+        key (tuple): ("tcp", ip, port, unit_id) of the device
+
+    Returns:
+        Connected ModbusTCP client
+    """
+    client = ModbusTcpClient(host=key[1], port=key[2])
+    client.connect()
+    _tune_tcp_socket(client)
+    return client
+
+
+def _open_serial_client(key: tuple) -> ModbusSerialClient:
+    """
+    Creates a new ModbusSerial client.
+
+    Args:
+        key (tuple): ("serial", com_port, baudrate, unit_id) of the device
+
+    Returns:
+        ModbusSerial client
+    """
+    return ModbusSerialClient(port=key[1], baudrate=key[2])
+
+
+def _acquire_shared_state(key: tuple) -> None:
+    """
+    Takes a reference to the state shared by the backends of a device, creating it on first use.
+
+    Args:
+        key (tuple): Key of the device's shared connection
+    """
+    if key not in _client_refcount:
+        _client_refcount[key] = 0
+        _read_caches[key] = {}
+    _client_refcount[key] += 1
+
+
+def _acquire_client(key: tuple) -> ModbusTcpClient | ModbusSerialClient:
+    """
+    Returns the shared Modbus client for a device, creating it on first use.
+
+    Args:
+        key (tuple): ("tcp", ip, port, unit_id) or ("serial", com_port, baudrate, unit_id) of the device
+
+    Returns:
+        Modbus client for the device
+    """
+    client = _client_cache.get(key)
+    if client is None:
+        client = _open_tcp_client(key) if key[0] == "tcp" else _open_serial_client(key)
+        _client_cache[key] = client
+        logger.debug("Opened new Modbus connection: %s", key)
+    else:
+        logger.debug("Reusing Modbus connection: %s", key)
+    _acquire_shared_state(key)
+    return client
+
+
+def _release_client(key: tuple) -> None:
+    """
+    Releases a reference to a shared Modbus client and closes it once unused.
+
+    Args:
+        key (tuple): Key the client was acquired with
+    """
+    refcount = _client_refcount.get(key, 0) - 1
+    if refcount > 0:
+        _client_refcount[key] = refcount
+        return
+    _client_refcount.pop(key, None)
+    _firmware_cache.pop(key, None)
+    _read_caches.pop(key, None)
+    _pump_states.pop(key, None)
+    client = _client_cache.pop(key, None)
+    if client is not None:
+        logger.debug("Closing Modbus connection: %s", key)
+        client.close()
+
+
+@atexit.register
+def _close_all_clients() -> None:
+    """Closes every shared Modbus client still open at interpreter exit."""
+    for client in _client_cache.values():
+        client.close()
+    _client_cache.clear()
+    _client_refcount.clear()
+    _firmware_cache.clear()
+    _read_caches.clear()
+    _pump_states.clear()
+
+
+@functools.cache
+def _register_name(register: int) -> str:
+    """
+    Names a register for log and error messages.
+
+    Raw addresses are resolved through the register map, so prepared reads that pass
+    plain ints are logged the same way as the enum members. Cached per address, as it
+    is called for every request.
+
+    Args:
+        register (int): Register address
+
+    Returns:
+        Register name followed by its address, or only the address if it is not in the register map
+    """
+    try:
+        return f"{commands(register).name} ({int(register)})"
+    except ValueError:
+        return str(int(register))
+
+
+def _modbus_call(action: str):
+    """
+    Decorates a backend request method to log Modbus and type errors instead of raising them.
+
+    Works for both plain and coroutine methods. A failed request returns None.
+
+    Args:
+        action (str): What the method does, used in the error log messages
+
+    Returns:
+        Decorator for the request method
+    """
+
+    def decorator(method):
+        if inspect.iscoroutinefunction(method):
+
+            @functools.wraps(method)
+            async def async_wrapper(self, *args, **kwargs):
+                try:
+                    return await method(self, *args, **kwargs)
+                except ModbusException as modbus_pdu_exception:
+                    logger.error("Modbus exception while %s: %s", action, modbus_pdu_exception)
+                except TypeError as type_err:
+                    logger.error("Type error while %s: %s", action, type_err)
+                return None
+
+            return async_wrapper
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return method(self, *args, **kwargs)
+            except ModbusException as modbus_pdu_exception:
+                logger.error("Modbus exception while %s: %s", action, modbus_pdu_exception)
+            except TypeError as type_err:
+                logger.error("Type error while %s: %s", action, type_err)
+            return None
+
+        return wrapper
+
+    return decorator
+
+
+def _check_output_pressure(pressure: int) -> None:
+    """
+    Validates an output pressure set point.
+
+    Args:
+        pressure (int): Any range between -450 ... 450
+
+    Raises:
+        ValueError: If pressure is not a whole mBar value in the supported output pressure range.
+    """
+    if pressure not in consts.OUTPUT_PRESSURE_RANGE:
+        logger.error("Input pressure outside of working range: %s", pressure)
+        raise ValueError("Input pressure outside of working range")
+
+
+def _pressure_chamber_to_raw(pressure: int) -> int:
+    """
+    Validates a pressure chamber set point and scales it to the raw register value.
+
+    Args:
+        pressure (int): Range between 200 ... 1000 mBar
+
+    Returns:
+        Raw value for the pressure threshold register
+
+    Raises:
+        ValueError: If pressure is not a whole mBar value in the supported pressure chamber range.
+    """
+    if pressure not in consts.PRESSURE_CHAMBER_RANGE:
+        logger.error("Error: %s input pressure outside of PGVA-1 working conditions", pressure)
+        raise ValueError(
+            f"Error: {pressure} input pressure outside of PGVA-1 working conditions. "
+            "Please enter a value between 200 and 1000 mBar."
+        )
+    # Scaled with the pressure scaling factor provided via operation manual of the PGVA
+    return consts.PRESSURE_MBAR_TO_RAW[pressure]
+
+
+def _vacuum_chamber_to_raw(vacuum: int) -> int:
+    """
+    Validates a vacuum chamber set point and scales it to the raw register value.
+
+    Args:
+        vacuum (int): Range between -900 ... -200 mBar
+
+    Returns:
+        Raw value for the vacuum threshold register
+
+    Raises:
+        ValueError: If vacuum is not a whole mBar value in the supported vacuum chamber range.
+    """
+    if vacuum not in consts.VACUUM_CHAMBER_RANGE:
+        logger.error("Error: %s input pressure outside of PGVA-1 working conditions", vacuum)
+        raise ValueError(f"Error: {vacuum} input pressure outside of PGVA-1 working conditions.")
+    return consts.VACUUM_MBAR_TO_RAW[vacuum]
+
+
+def _check_actuation_time(actuation_time: int) -> None:
+    """
+    Validates a valve actuation time.
+
+    Args:
+        actuation_time (int): Time in ms for valve to be open
+
+    Raises:
+        ValueError: If actuation_time is not a whole ms value between 5 and 65534 ms.
+    """
+    if actuation_time not in consts.ACTUATION_TIME_RANGE:
+        logger.error("Error: acuation time out of range (5, 65534), inputted: %s", actuation_time)
+        raise ValueError("Error: Value entered for actuation time needs to be between 5 and 65534")
+
+
+def _twos_complement(val: int) -> int:
+    """
+    Converts a 16-bit 2 compliment register value into the actual signed integer value.
+
+    Args:
+        val: Raw register value between 0 ... 65535
+
+    Returns:
+        Converted signed integer value
+    """
+    # Flipping the sign bit and subtracting its weight sign-extends without a branch
+    return (val ^ _REGISTER_SIGN_BIT) - _REGISTER_SIGN_BIT
+
+
+def _decode_sensor_block(registers: Sequence[int] | None, external: bool, external_value: int | None = None) -> dict:
+    """
+    Builds the internal sensor dictionary from a sensor block read.
+
+    Args:
+        registers: Registers starting at VACUUM_ACTUAL_MBAR, or None if the read failed
+        external (bool): Whether the device has the external sensor register
+        external_value (int | None): Value read from EXTERNAL_SENSOR_VALUE, None if the read failed
+
+    Returns:
+        Dictionary of the sensor values, the pressures None if the block read failed
+    """
+    status = {}
+    if external:
+        status["Extsensor"] = external_value
+    if registers is None:
+        status["VacuumChamber"] = status["PressureChamber"] = status["OutputPressure"] = None
+        return status
+    status["VacuumChamber"] = _twos_complement(registers[_SENSOR_OFFSET_VACUUM])
+    status["PressureChamber"] = registers[_SENSOR_OFFSET_PRESSURE]
+    status["OutputPressure"] = _twos_complement(registers[_SENSOR_OFFSET_OUTPUT])
+    return status
+
+
+# (name, shift, mask, messages) of each decoded field within the status, warning, error and Modbus
+# error words; the field value masked out of the word indexes its messages
+_STATUS_FIELDS = (
+    ("Status", 0, 0b1, ("Idle", "Busy")),
+    ("Pump", 1, 0b11, ("Pump is off", "Pump is building pressure", "Pump is building vacuum", "Unknown pump state")),
+    ("Pressure", 3, 0b1, ("Pressure in the tank is nominal", "Pressure in the tank is below threshold")),
+    ("Vacuum", 4, 0b1, ("Vacuum in the tank is nominal", "Vacuum in the tank is below threshold")),
+    ("EEPROM", 5, 0b1, ("No EEPROM write pending", "EEPROM write pending")),
+    ("TargetPressure", 6, 0b1, ("Target pressure in progress", "Target pressure achieved")),
+    ("Trigger", 7, 0b1, ("Trigger is closed", "Trigger is open")),
+    ("OutputValveControl", 10, 0b1, ("Exhaust valve management disabled", "Exhaust valve management enabled")),
+    ("OutputValve", 11, 0b1, ("Exhaust valve closed", "Exhaust valve open")),
+)
+_WARNING_FIELDS = (
+    ("SupplyVoltage", 0, 0b1, ("Reset", "Abnormal supply voltage")),
+    ("VacuumThreshold", 1, 0b1, ("Reset", "Vacuum generator cannot reach threshold")),
+    ("PressureThreshold", 2, 0b1, ("Reset", "Pressure generator cannot reach threshold")),
+    ("TargetPressure", 4, 0b1, ("Reset", "Preset output pressure cannot be reached")),
+    ("VacuumChamber", 5, 0b1, ("Reset", "Vacuum chamber set below -500 mBar")),
+    ("Pump", 7, 0b1, ("Reset", "Pump ran for 9 minutes")),
+    ("ExternalSensor", 9, 0b1, ("Reset", "External Sensor Verification warning")),
+)
+_ERROR_FIELDS = (
+    ("PumpTimeout", 0, 0b1, ("Reset", "Pump ran longer than 10 minutes")),
+    ("TimeoutPressure", 1, 0b1, ("Reset", "Target output pressure not achieved in 8 minutes")),
+    ("ModbusError", 2, 0b1, ("Reset", "Modbus error occurred, please read modbus error word")),
+    ("LowVoltage", 3, 0b1, ("Reset", "Power supply too low")),
+    ("HighVoltage", 4, 0b1, ("Reset", "Power supply too high")),
+    ("TimeoutExternalSensor", 5, 0b1, ("Reset", "External sensor check timed out")),
+)
+_MODBUS_ERROR_FIELDS = (
+    (
+        "OutputActuationTime",
+        0,
+        0b1,
+        ("Reset", "Trigger time is outside of input range, The Modbus command was not executed"),
+    ),
+)
+
+
+def _decode_word(word: int, fields: tuple) -> dict:
+    """
+    Decodes the fields of a status, warning or error word into their messages.
+
+    Args:
+        word (int): Raw register value
+        fields (tuple): (name, shift, mask, messages) of each field to decode
+
+    Returns:
+        Dictionary of the message for each field in field order
+    """
+    return {name: messages[(word >> shift) & mask] for name, shift, mask, messages in fields}
+
+
+def _unknown_word(fields: tuple) -> dict:
+    """
+    Builds the decoded form of a word that could not be read.
+
+    Args:
+        fields (tuple): (name, shift, mask, messages) of each field
+
+    Returns:
+        Dictionary of None for each field in field order
+    """
+    return dict.fromkeys(field[0] for field in fields)
+
+
+def _fields_mask(fields: tuple) -> int:
+    """
+    Combines the bits of every field of a word into one mask.
+
+    Args:
+        fields (tuple): (name, shift, mask, messages) of each field
+
+    Returns:
+        Mask with every bit covered by the fields set
+    """
+    word_mask = 0
+    for _, shift, mask, _ in fields:
+        word_mask |= mask << shift
+    return word_mask
+
+
+@functools.cache
+def _shared_word(word: int, fields: tuple) -> dict:
+    """
+    Decodes a word once and keeps the result for every later read of the same value.
+
+    Callers pass the word masked with the defined bits of its fields, which bounds the cache size.
+    The returned dictionary is shared and must not be modified.
+
+    Args:
+        word (int): Raw register value masked with the defined bits of fields
+        fields (tuple): (name, shift, mask, messages) of each field to decode
+
+    Returns:
+        Shared dictionary of the message for each field in field order
+    """
+    return _decode_word(word, fields)
+
+
+# Defined bits of each word, so "nothing active" is a single AND on the raw word
+_STATUS_MASK = _fields_mask(_STATUS_FIELDS)
+_WARNING_MASK = _fields_mask(_WARNING_FIELDS)
+_ERROR_MASK = _fields_mask(_ERROR_FIELDS)
+_MODBUS_ERROR_MASK = _fields_mask(_MODBUS_ERROR_FIELDS)
+
+# Decoded words with every field reset, returned on the common path instead of decoding
+_WARNING_RESET = _decode_word(0, _WARNING_FIELDS)
+_ERROR_RESET = _decode_word(0, _ERROR_FIELDS)
+_MODBUS_ERROR_RESET = _decode_word(0, _MODBUS_ERROR_FIELDS)
+
+
+def _decode_status_word(pgva_status: int | None, copy: bool = True) -> dict:
+    """
+    Decodes the status word and outputs it to the log.
+
+    Args:
+        pgva_status: Raw status word, or None if the read failed
+        copy (bool): Return an independent dictionary instead of the shared decoded one
+
+    Returns:
+        Decoded status word, with None for every field if the read failed
+    """
+    if pgva_status is None:
+        return _unknown_word(_STATUS_FIELDS)
+    status_word = _shared_word(pgva_status & _STATUS_MASK, _STATUS_FIELDS)
+    logger.debug("Status word: %s", status_word)
+    return dict(status_word) if copy else status_word
+
+
+def _decode_warning_word(pgva_warning: int | None, copy: bool = True) -> dict:
+    """
+    Decodes the warning word and logs any active warning.
+
+    Args:
+        pgva_warning: Raw warning word, or None if the read failed
+        copy (bool): Return an independent dictionary instead of the shared decoded one
+
+    Returns:
+        Decoded warning word, with None for every field if the read failed
+    """
+    if pgva_warning is None:
+        return _unknown_word(_WARNING_FIELDS)
+    if not pgva_warning & _WARNING_MASK:
+        logger.debug("Warning word: %s", _WARNING_RESET)
+        return dict(_WARNING_RESET) if copy else _WARNING_RESET
+    warning_word = _shared_word(pgva_warning & _WARNING_MASK, _WARNING_FIELDS)
+    logger.warning("Active PGVA warning(s): %s", warning_word)
+    return dict(warning_word) if copy else warning_word
+
+
+def _decode_error_word(pgva_error: int | None, copy: bool = True) -> dict:
+    """
+    Decodes the error word and logs any active error.
+
+    Args:
+        pgva_error: Raw error word, or None if the read failed
+        copy (bool): Return an independent dictionary instead of the shared decoded one
+
+    Returns:
+        Decoded error word, with None for every field if the read failed
+    """
+    if pgva_error is None:
+        return _unknown_word(_ERROR_FIELDS)
+    if not pgva_error & _ERROR_MASK:
+        logger.debug("Error word: %s", _ERROR_RESET)
+        return dict(_ERROR_RESET) if copy else _ERROR_RESET
+    error_word = _shared_word(pgva_error & _ERROR_MASK, _ERROR_FIELDS)
+    logger.error("Active PGVA error(s): %s", error_word)
+    return dict(error_word) if copy else error_word
+
 
-class PGVAModbusClient(ABC):
-    """Modbus Client Class."""
+def _decode_modbus_error_word(modbus_error: int | None, copy: bool = True) -> dict:
+    """
+    Decodes the Modbus error word and logs any active error.
+
+    Args:
+        modbus_error: Raw Modbus error word, or None if the read failed
+        copy (bool): Return an independent dictionary instead of the shared decoded one
 
-    client: ModbusTcpClient | ModbusSerialClient
-    version: list
-    _pgva_error: dict
-    _modbus_error: dict
-    _warning: dict
-    _status: dict
+    Returns:
+        Decoded Modbus error word, with None for every field if the read failed
+    """
+    if modbus_error is None:
+        return _unknown_word(_MODBUS_ERROR_FIELDS)
+    if not modbus_error & _MODBUS_ERROR_MASK:
+        logger.debug("Modbus error word: %s", _MODBUS_ERROR_RESET)
+        return dict(_MODBUS_ERROR_RESET) if copy else _MODBUS_ERROR_RESET
+    modbus_error_word = _shared_word(modbus_error & _MODBUS_ERROR_MASK, _MODBUS_ERROR_FIELDS)
+    logger.error("Active Modbus error(s): %s", modbus_error_word)
+    return dict(modbus_error_word) if copy else modbus_error_word
+
+
+class PGVAModbusClient:
+    """Modbus Client Class, the shared base of the ModbusTCP and ModbusSerial backends."""
+
+    _client: ModbusTcpClient | ModbusSerialClient
+    # Prepared status word read, rebound whenever the client changes
+    _status_read: functools.partial
+    _version: tuple
+    _supports_pump_enable: bool
+    _has_external_sensor: bool
+    _supports_status_block: bool
+    # Recent block reads keyed by (function code, start address, count), shared by the connection's backends
+    _read_cache: dict[tuple[int, int, int], _CachedRegisterBlock]
+    # Key of the shared connection in use, None once released
+    _client_key: tuple | None = None
+    # First delay between busy polls in seconds, raised by backends on slow links
+    _poll_delay_min: float = consts.POLL_DELAY_MIN_S
 
-    @abstractmethod
     def __init__(self, config):
-        """Base abstract class init, ModbusTCP and ModbusSerial will have their own implemenation."""
+        """Base class init, storing the state common to every backend."""
         self._config = config
+        self.version = ()
+        self._read_cache = {}
+
+    @property
+    def _pump_enabled_cache(self) -> bool | None:
+        """Last known pump enable state of the connection, None until read from or written to the device."""
+        return _pump_states.get(self._client_key)
+
+    @_pump_enabled_cache.setter
+    def _pump_enabled_cache(self, enabled: bool | None) -> None:
+        # Without a connection there is nothing to track, so the state is read on every use
+        if self._client_key is not None:
+            _pump_states[self._client_key] = enabled
+
+    @property
+    def client(self) -> ModbusTcpClient | ModbusSerialClient:
+        """Modbus client used to talk to the PGVA."""
+        return self._client
+
+    @client.setter
+    def client(self, client: ModbusTcpClient | ModbusSerialClient) -> None:
+        self._client = client
+        self._status_read = functools.partial(client.read_input_registers, address=_STATUS_WORD_ADDRESS)
+
+    @property
+    def version(self) -> tuple:
+        """Firmware version of the connected PGVA as (version, subversion, build)."""
+        return self._version
+
+    @version.setter
+    def version(self, version: tuple) -> None:
+        self._version = tuple(version)
+        # Feature flags derived once per version instead of comparing the version on every call
+        legacy = self._version == consts.LEGACY_FIRMWARE_VERSION
+        self._supports_pump_enable = not legacy
+        self._has_external_sensor = not legacy
+        # Legacy firmware lacks registers between the status words, so they are read one by one
+        self._supports_status_block = not legacy
+
+    def close(self) -> None:
+        """
+        Releases this backend's reference to the shared connection.
+
+        The connection itself is only closed once every backend using it has been closed.
+
+        Args:
+            None
 
-    def get_firmware_version(self) -> list:
+        Returns:
+            None
+        """
+        if self._client_key is not None:
+            _release_client(self._client_key)
+            self._client_key = None
+
+    def get_firmware_version(self) -> tuple:
         """Gets the current firmware version located on the PGVA.
 
+        The firmware cannot change while connected, so the version is only read from
+        the device until it has been retrieved successfully, once per shared connection.
+        The version, subversion and build registers are adjacent and read in a single request.
+
         Args:
             None
 
         Returns:
-            List of the version
+            Tuple of the version
         """
-        self.version = []
-        if len(self.version) < 3:
-            self.version.append(self._get_data(commands.FIRMWARE_VERSION))
-            self.version.append(self._get_data(commands.FIRMWARE_SUBVERSION))
-            self.version.append(self._get_data(commands.FIRMWARE_BUILD))
-            logger.debug("Firmware version retrieved: %s", self.version)
+        if len(self.version) == 3 and None not in self.version:
             return self.version
-        return [0, 0, 0]
+        cached = _firmware_cache.get(self._client_key)
+        if cached is not None:
+            self.version = cached
+            return cached
+        registers = self._get_data_block(commands.FIRMWARE_VERSION, _FIRMWARE_VERSION_COUNT)
+        if registers is None or len(registers) != _FIRMWARE_VERSION_COUNT:
+            self.version = (None, None, None)
+        else:
+            self.version = tuple(registers)
+            if self._client_key is not None:
+                _firmware_cache[self._client_key] = self.version
+        logger.debug("Firmware version retrieved: %s", self.version)
+        return self.version
 
+    @_modbus_call("reading")
     def _get_data(self, register):
         """
         Method used to access data from a register.
@@ -64,38 +690,75 @@ class PGVAModbusClient(ABC):
         Returns:
             value: Value from register
         """
-        logger.debug("Reading input register: %s", str(register))
-        try:
-            data = self.client.read_input_registers(
-                address=int(register.value),
-                count=1,
-            )
-            return data.registers[0]
-        except ModbusException as modbus_pdu_exception:
-            logger.error("Error while reading : %s", str(modbus_pdu_exception))
-            return None
-        except TypeError as type_err:
-            logger.error("Error while reading: %s", str(type_err))
-            return None
-
+        logger.debug("Reading input register: %s", _register_name(register))
+        data = self.client.read_input_registers(
+            address=register,
+            count=1,
+        )
+        return data.registers[0]
+
+    @_modbus_call("reading holding")
     def _get_data_holding(self, register):
         """Method used to read the holding registers."""
-        data = 0
-        logger.debug("Reading holding register: %s", str(register))
-        try:
-            data = self.client.read_holding_registers(
-                address=int(register.value),
-                count=1,
-            )
-            return data.registers[0]
-        except ModbusException as modbus_pdu_exception:
-            logger.error("Error while reading holding: %s", str(modbus_pdu_exception))
-            return None
-        except TypeError as type_err:
-            logger.error("Error while reading holding: %s", str(type_err))
-            return None
+        logger.debug("Reading holding register: %s", _register_name(register))
+        data = self.client.read_holding_registers(
+            address=register,
+            count=1,
+        )
+        return data.registers[0]
+
+    @_modbus_call("reading block")
+    def _get_data_block(self, register, count: int):
+        """
+        Method used to read consecutive input registers in a single request.
 
-    def _set_data(self, register, val, timeout: float = 30.0):
+        Args:
+            register: Address of the first register to be read
+            count (int): Number of registers to read
+
+        Returns:
+            List of register values, or None if the read failed
+        """
+        logger.debug("Reading %s input registers from: %s", count, _register_name(register))
+        data = self.client.read_input_registers(
+            address=register,
+            count=count,
+        )
+        return data.registers
+
+    def _get_cached_block(self, register, count: int = 1):
+        """
+        Method used to read consecutive input registers, reusing recent results.
+
+        A result is reused for ``cache_ttl_ms`` milliseconds from the configuration, so
+        tight polling loops do not query the device for every call. The cache belongs to
+        the shared connection, so any register write through a backend on the same
+        connection discards all cached results. Writes from other connections or clients
+        are not seen, so a result can be up to ``cache_ttl_ms`` old.
+
+        Args:
+            register: Address of the first register to be read
+            count (int): Number of registers to read
+
+        Returns:
+            Sequence of register values, or None if the read failed
+        """
+        ttl_ms = self._config.cache_ttl_ms
+        if ttl_ms <= 0:
+            return self._get_data_block(register, count)
+        key = (_FC_READ_INPUT_REGISTERS, register, count)
+        now = time.monotonic_ns()
+        cached = self._read_cache.get(key)
+        if cached is not None and now < cached.expires_ns:
+            return cached.registers
+        registers = self._get_data_block(register, count)
+        if registers is not None:
+            registers = tuple(registers)
+            self._read_cache[key] = _CachedRegisterBlock(expires_ns=now + ttl_ms * 1_000_000, registers=registers)
+        return registers
+
+    @_modbus_call("writing data")
+    def _set_data(self, register, val, timeout: float = 30.0, wait_idle: bool = True, status_count: int = 1):
         """
         Method used to write to registers.
 
@@ -104,41 +767,88 @@ class PGVAModbusClient(ABC):
             val: Value to be written to register
             timeout (float): Maximum seconds to wait for the device to leave
                 the busy state after the write. Defaults to 30 seconds.
+            wait_idle (bool): Poll the status word until the device is idle
+                after the write. Defaults to True.
+            status_count (int): Number of registers read from STATUS_WORD onwards
+                on every idle poll. Defaults to 1.
+
+        Returns:
+            The registers from the final idle poll, True if the write succeeded and no poll
+            was made, or None if the write failed
 
         Raises:
             TimeoutError: If the device remains busy beyond ``timeout`` seconds.
         """
-        logger.debug("Writing register %s, value: %s", str(register), str(val))
-        try:
-            if val < 0:
-                val = val + 2**16
-            self.client.write_register(
-                address=int(register.value),
-                value=val,
-            )
-            deadline = time.monotonic() + timeout
-            status = self.client.read_input_registers(
-                address=int(commands.STATUS_WORD.value),
-                count=1,
-            )
-            while (status.registers[0] & 1) == 1:
-                if time.monotonic() > deadline:
-                    logger.error(
-                        "Device still busy after %.1f s following write to %s — aborting poll",
-                        timeout,
-                        str(register),
-                    )
-                    raise TimeoutError(
-                        f"PGVA device remained busy for more than {timeout}s after writing to {register}"
-                    )
-                status = self.client.read_input_registers(
-                    address=int(commands.STATUS_WORD.value),
-                    count=1,
+        logger.debug("Writing register %s, value: %s", _register_name(register), val)
+        self._read_cache.clear()
+        self.client.write_register(
+            address=register,
+            value=val & _REGISTER_MASK,
+        )
+        if wait_idle:
+            return self._wait_until_idle(register, timeout, status_count)
+        return True
+
+    @_modbus_call("writing data")
+    def _set_data_multiple(self, register, values: list, timeout: float = 30.0):
+        """
+        Method used to write consecutive registers in a single Modbus request.
+
+        Args:
+            register: Address of the first register to be written
+            values (list): Values to be written, one per register starting at ``register``
+            timeout (float): Maximum seconds to wait for the device to leave
+                the busy state after the write. Defaults to 30 seconds.
+
+        Raises:
+            TimeoutError: If the device remains busy beyond ``timeout`` seconds.
+        """
+        logger.debug("Writing registers from %s, values: %s", _register_name(register), values)
+        self._read_cache.clear()
+        values = [val & _REGISTER_MASK for val in values]
+        self.client.write_registers(
+            address=register,
+            values=values,
+        )
+        self._wait_until_idle(register, timeout)
+
+    def _wait_until_idle(self, register, timeout: float, count: int = 1) -> list:
+        """
+        Polls the status word until the device is no longer busy.
+
+        The delay between polls starts at ``_poll_delay_min`` and doubles up to
+        POLL_DELAY_MAX_S, so short busy phases are caught quickly without flooding
+        the link during long ones.
+
+        Args:
+            register: Register that was written, used for logging only
+            timeout (float): Maximum seconds to wait for the device to leave the busy state
+            count (int): Number of registers read from STATUS_WORD onwards on every poll. Defaults to 1.
+
+        Returns:
+            The registers read by the final poll, starting with the status word
+
+        Raises:
+            TimeoutError: If the device remains busy beyond ``timeout`` seconds.
+        """
+        deadline = time.monotonic() + timeout
+        read = self._status_read
+        registers = read(count=count).registers
+        delay = self._poll_delay_min
+        while registers[0] & 1:
+            if time.monotonic() > deadline:
+                logger.error(
+                    "Device still busy after %.1f s following write to %s — aborting poll",
+                    timeout,
+                    _register_name(register),
+                )
+                raise TimeoutError(
+                    f"PGVA device remained busy for more than {timeout}s after writing to {_register_name(register)}"
                 )
-        except ModbusException as modbus_pdu_exception:
-            logger.error("Modbus Exception Error : %s", str(modbus_pdu_exception))
-        except TypeError as type_err:
-            logger.error("Type error while writing data: %s", str(type_err))
+            time.sleep(delay)
+            delay = min(delay * 2, consts.POLL_DELAY_MAX_S)
+            registers = read(count=count).registers
+        return registers
 
     def set_output_pressure(self, pressure: int) -> None:
         """
@@ -154,637 +864,1123 @@ class PGVAModbusClient(ABC):
             ValueError: If pressure is outside the supported output pressure range.
         """
         if self._validate_pump_enable():
-            if consts.MINIMUM_OUTPUT_PRESSURE_MBAR <= pressure <= consts.MAXIMUM_OUTPUT_PRESSURE_MBAR:
-                logger.info("Setting output pressure to %s mBar", pressure)
-                self._set_data(commands.OUTPUT_PRESSURE_MBAR, pressure)
-            else:
-                logger.error("Input pressure outside of working range: %s", str(pressure))
-                raise ValueError("Input pressure outside of working range")
+            _check_output_pressure(pressure)
+            logger.info("Setting output pressure to %s mBar", pressure)
+            self._set_data(commands.OUTPUT_PRESSURE_MBAR, pressure)
+
+    def set_and_read_output_pressure(self, pressure: int) -> int | None:
+        """
+        Sets the output pressure and returns the output pressure reading once the device is idle.
+
+        The status poll that follows the write reads up to the output pressure register,
+        so the reading arrives with the final poll instead of in a separate request.
+
+        Args:
+            pressure (int): Any range between -450 ... 450
+
+        Returns:
+            Output pressure in mBar, or None if the pump is disabled or the write failed
+
+        Raises:
+            ValueError: If pressure is outside the supported output pressure range.
+        """
+        if not self._validate_pump_enable():
+            return None
+        _check_output_pressure(pressure)
+        logger.info("Setting output pressure to %s mBar", pressure)
+        registers = self._set_data(commands.OUTPUT_PRESSURE_MBAR, pressure, status_count=_STATUS_TO_OUTPUT_COUNT)
+        if registers is None:
+            return None
+        result = _twos_complement(registers[-1])
+        logger.debug("Output pressure reading: %s mBar", result)
+        return result
+
+    def set_output_pressure_ramp(self, values: Sequence[int], dwell_ms: int = 0) -> None:
+        """
+        Steps the output pressure through a sequence of set points.
+
+        Every set point is validated and the pump state is checked once before
+        the first write, so an invalid value never leaves a ramp half applied.
+
+        Args:
+            values (Sequence[int]): Set points in mBar, each between -450 ... 450
+            dwell_ms (int): Time in ms to hold each set point before writing the next. Defaults to 0.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If any set point is outside the supported output pressure range.
+        """
+        for pressure in values:
+            _check_output_pressure(pressure)
+        if not values or not self._validate_pump_enable():
+            return
+        logger.info("Ramping output pressure through %s set points", len(values))
+        for pressure in values:
+            self._set_data(commands.OUTPUT_PRESSURE_MBAR, pressure)
+            if dwell_ms:
+                time.sleep(dwell_ms / 1000)
+
+    def set_actuation_time(self, actuation_time: int, wait: bool = True) -> None:
+        """
+        Sets the valve actuation time which is then immediately executed.
+
+        The device opens and closes the valve on its own once the time is written,
+        so the valve window is not polled. With ``wait`` the call sleeps for the
+        known duration instead.
+
+        Args:
+            actuation_time (int): Time in ms for valve to be open
+            wait (bool): Block until the valve has closed again. Defaults to True.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If actuation_time is outside the valid range of 5 to 65534 ms.
+        """
+        _check_actuation_time(actuation_time)
+        logger.info("Triggering actuation valve for %s ms", actuation_time)
+        self._set_data(commands.VALVE_ACTUATION_TIME, actuation_time, wait_idle=False)
+        if wait:
+            time.sleep(actuation_time / 1000 + consts.VALVE_ACTUATION_MARGIN_S)
+
+    def run_timed_pressure(self, pressure_mbar: int, time_ms: int, wait: bool = True) -> None:
+        """
+        Sets the output pressure and then opens the actuation valve for a set time.
+
+        Both values are validated before anything is written, so an invalid value
+        never leaves a new output pressure applied without the valve being triggered.
+        The valve is only opened once the output pressure has been written, so a
+        disabled pump or a failed write never actuates at the previous set point.
+        The output pressure and valve actuation time registers are not adjacent, so
+        this still issues one write for each.
+
+        Args:
+            pressure_mbar (int): Any range between -450 ... 450
+            time_ms (int): Time in ms for valve to be open
+            wait (bool): Block until the valve has closed again. Defaults to True.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If either value is outside of its supported range.
+        """
+        _check_output_pressure(pressure_mbar)
+        _check_actuation_time(time_ms)
+        if not self._validate_pump_enable():
+            return
+        logger.info("Setting output pressure to %s mBar", pressure_mbar)
+        if self._set_data(commands.OUTPUT_PRESSURE_MBAR, pressure_mbar) is None:
+            logger.error("Output pressure was not set, skipping the valve actuation")
+            return
+        self.set_actuation_time(time_ms, wait=wait)
+
+    def toggle_manual_trigger(self, toggle: bool) -> None:
+        """
+        Toggles the manual trigger to either on or off.
+
+        Args:
+            toggle (int): Bool value, 1 for on, 0 for off
+
+        Returns:
+            None
+
+        Raises:
+            NotImplementedError: Manual trigger is not implemented due to a firmware limitation.
+        """
+        # self._set_data(commands.MANUAL_TRIGGER, int(toggle))
+        logger.warning("toggle_manual_trigger() is not implemented: known firmware bug in PGVA-1 firmware <= 2.0.45")
+        raise NotImplementedError("""
+                                  Manual trigger not implemented. There is a bug that exists in the PGVA-1 firmware <=2.0.45
+                                  that prevents this function from working as intended
+                                  """)
+
+    def _read_sensor_block(self) -> list | None:
+        """
+        Reads the vacuum, pressure and output pressure registers with a single Modbus request.
+
+        The three registers are contiguous, so one read covers all of them. Recent
+        results are reused so back-to-back getters share a request.
+
+        Args:
+            None
+
+        Returns:
+            Registers starting at VACUUM_ACTUAL_MBAR, or None if the read failed
+        """
+        return self._get_cached_block(_SENSOR_BLOCK_ADDRESS, _SENSOR_BLOCK_COUNT)
+
+    def _read_external_sensor(self) -> int | None:
+        """
+        Reads the external sensor register.
+
+        Args:
+            None
+
+        Returns:
+            External sensor value, or None if the read failed
+        """
+        registers = self._get_cached_block(_EXTERNAL_SENSOR_ADDRESS)
+        return None if registers is None else registers[0]
+
+    def get_internal_sensor_data(self) -> dict:
+        """
+        Reads the internal Vacuum and Pressure chambers as well as the output pressure sensor.
+
+        Args:
+            None
+
+        Returns:
+            Dictionary of the sensor values
+        """
+        external = self._read_external_sensor() if self._has_external_sensor else None
+        status = _decode_sensor_block(self._read_sensor_block(), self._has_external_sensor, external)
+        logger.debug("Internal sensor data: %s", status)
+        return status
+
+    def get_vacuum_chamber(self) -> int | None:
+        """
+        Reads the internal vacuum chamber pressure.
+
+        Args:
+            None
+
+        Returns:
+            Vacuum chamber pressure in mBar, or None if the read failed
+        """
+        registers = self._read_sensor_block()
+        if registers is None:
+            return None
+        result = _twos_complement(registers[_SENSOR_OFFSET_VACUUM])
+        logger.debug("Vacuum chamber reading: %s mBar", result)
+        return result
+
+    def get_pressure_chamber(self) -> int | None:
+        """
+        Reads the internal pressure chamber pressure.
+
+        Args:
+            None
+
+        Returns:
+            Pressure chamber pressure in mBar, or None if the read failed
+        """
+        registers = self._read_sensor_block()
+        if registers is None:
+            return None
+        result = registers[_SENSOR_OFFSET_PRESSURE]
+        logger.debug("Pressure chamber reading: %s mBar", result)
+        return result
+
+    def get_output_pressure(self) -> int | None:
+        """
+        Reads the output port pressure.
+
+        Args:
+            None
+
+        Returns:
+            Output pressure in mBar, or None if the read failed
+        """
+        registers = self._read_sensor_block()
+        if registers is None:
+            return None
+        result = _twos_complement(registers[_SENSOR_OFFSET_OUTPUT])
+        logger.debug("Output pressure reading: %s mBar", result)
+        return result
+
+    def set_pressure_chamber(self, pressure: int) -> None:
+        """
+        Sets the internal pressure chamber.
+
+        Args:
+            pressure (int): Range between 200 ... 1000 mBar
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If pressure is outside the supported pressure chamber range.
+        """
+        raw_pressure = _pressure_chamber_to_raw(pressure)
+        logger.info("Setting pressure chamber to %s mBar", pressure)
+        self._set_data(commands.PRESSURE_THRESHOLD, raw_pressure)
+
+    def set_vacuum_chamber(self, vacuum: int) -> None:
+        """
+        Sets the internal vacuum chamber.
+
+        Args:
+            vacuum (int): Range between -200 ... -620 mBar
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If vacuum is outside the supported vacuum chamber range.
+        """
+        raw_vacuum = _vacuum_chamber_to_raw(vacuum)
+        logger.info("Setting vacuum chamber to %s mBar", vacuum)
+        self._set_data(commands.VACUUM_THRESHOLD, raw_vacuum)
+
+    def set_chambers(self, pressure: int, vacuum: int) -> None:
+        """
+        Sets both internal chambers with a single Modbus request.
+
+        The vacuum and pressure threshold registers are adjacent, so both set points
+        are written in one multiple-register write instead of two separate writes.
+
+        Args:
+            pressure (int): Range between 200 ... 1000 mBar
+            vacuum (int): Range between -900 ... -200 mBar
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If either value is outside of its supported chamber range.
+        """
+        raw_pressure = _pressure_chamber_to_raw(pressure)
+        raw_vacuum = _vacuum_chamber_to_raw(vacuum)
+        logger.info("Setting pressure chamber to %s mBar and vacuum chamber to %s mBar", pressure, vacuum)
+        # VACUUM_THRESHOLD (4097) is directly followed by PRESSURE_THRESHOLD (4098)
+        self._set_data_multiple(commands.VACUUM_THRESHOLD, [raw_vacuum, raw_pressure])
+
+    def toggle_pump(self, toggle: bool) -> None:
+        """
+        Enables or disables the pump for creating pressure / vacuum.
+
+        Args:
+            toggle (bool): 1 for on, 0 for off
+
+        Returns:
+            None
+        """
+        logger.info("Toggling pump: %s", "ON" if toggle else "OFF")
+        if self._supports_pump_enable:
+            written = self._set_data(commands.PUMP_ENABLE, toggle, wait_idle=False)
+            # A failed write may or may not have reached the device, so the state is read again on next use
+            self._pump_enabled_cache = bool(toggle) if written else None
+        else:
+            logger.info("PGVA firmware does not support the enable/disable pump function")
+
+    def invalidate_pump_cache(self) -> None:
+        """
+        Forgets the cached pump enable state, so the next pressure set reads it from the device.
+
+        Needed when the pump may have been switched by another client or on the device itself.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self._pump_enabled_cache = None
+
+    def _validate_pump_enable(self):
+        """
+        Validates that the pump is enabled for creating pressure.
+
+        The enable state is read from the device once and then tracked through the pump
+        toggles of every backend sharing the connection until ``invalidate_pump_cache`` is called.
+
+        Args:
+            None
+
+        Returns:
+            Bool: True if enabled, False if disabled
+        """
+        if self._supports_pump_enable:
+            enabled = self._pump_enabled_cache
+            if enabled is None:
+                pump_enable = self._get_data_holding(commands.PUMP_ENABLE)
+                enabled = pump_enable == 1
+                if pump_enable is not None:
+                    self._pump_enabled_cache = enabled
+            if enabled:
+                logger.debug("Pump validation: pump is enabled")
+                return True
+            logger.warning("Pump is NOT enabled — call toggle_pump(True) before setting pressure")
+            return False
+        logger.info("PGVA firmware version does not support the enable/disable pump function")
+        return True
+
+    def _enable_pump(self):
+        """
+        Enables the pump.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self._supports_pump_enable:
+            logger.info("Enabling pump")
+            written = self._set_data(commands.PUMP_ENABLE, 1, wait_idle=False)
+            self._pump_enabled_cache = True if written else None
+        else:
+            logger.info("PGVA firmware does not support the enable/disable pump function")
+
+    def _disable_pump(self):
+        """
+        Disables the pump.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self._supports_pump_enable:
+            logger.info("Disabling pump")
+            written = self._set_data(commands.PUMP_ENABLE, 0, wait_idle=False)
+            self._pump_enabled_cache = False if written else None
+        else:
+            logger.info("connected PGVA device version does not support this function ")
+
+    def print_driver_information(self) -> None:
+        """
+        Logs all driver parameters at INFO level.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if not logger.isEnabledFor(logging.INFO):
+            # Nothing would be emitted, so skip the sensor read that only feeds the log
+            return
+        internal_data = self.get_internal_sensor_data()
+        logger.info("Driver Information:")
+        logger.info("  Firmware version: %s", self.version)
+        logger.info("  Connection type: %s", self._config.interface)
+        logger.info("  Sensor data: %s", internal_data)
+
+    def _read_word_block(self, register) -> tuple[int, tuple | None]:
+        """
+        Reads the block of words holding a status, warning or error word register.
+
+        The status and Modbus error words share the block starting at STATUS_WORD, the warning and
+        error words the one starting at WARNING_WORD. Recent results are reused, so back-to-back
+        word getters share a request.
+
+        Args:
+            register: Address of the word register
+
+        Returns:
+            Start address of the block and its registers, or None if the read failed
+        """
+        if register >= _ALARM_BLOCK_ADDRESS:
+            return _ALARM_BLOCK_ADDRESS, self._get_cached_block(_ALARM_BLOCK_ADDRESS, _ALARM_BLOCK_COUNT)
+        return _STATUS_WORD_ADDRESS, self._get_cached_block(_STATUS_WORD_ADDRESS, _STATUS_BLOCK_COUNT)
+
+    def _read_word(self, register) -> int | None:
+        """
+        Reads a single status, warning or error word register, reusing recent results.
+
+        Args:
+            register: Address of the word register
+
+        Returns:
+            Raw register value, or None if the read failed
+        """
+        if self._supports_status_block:
+            start, registers = self._read_word_block(register)
+            return None if registers is None else registers[register - start]
+        registers = self._get_cached_block(register)
+        return None if registers is None else registers[0]
+
+    def get_status_word(self, copy: bool = True) -> dict:
+        """
+        Reads the status word and outputs it to the log.
+
+        Args:
+            copy (bool): Return an independent dictionary instead of the shared decoded one. Defaults to True.
+
+        Returns:
+            Current status of the PGVA-1, with None for every field if the read failed
+        """
+        return _decode_status_word(self._read_word(commands.STATUS_WORD), copy=copy)
+
+    def get_warning_word(self, copy: bool = True) -> dict:
+        """
+        Reads the warning word and outputs it to the log.
+
+        Args:
+            copy (bool): Return an independent dictionary instead of the shared decoded one. Defaults to True.
+
+        Returns:
+           Current warning word of the PGVA-1, with None for every field if the read failed
+        """
+        return _decode_warning_word(self._read_word(commands.WARNING_WORD), copy=copy)
+
+    def get_error_word(self, copy: bool = True) -> dict:
+        """
+        Reads the error word and outputs it to the log.
+
+        Args:
+            copy (bool): Return an independent dictionary instead of the shared decoded one. Defaults to True.
+
+        Returns:
+            Current error word of the PGVA-1, with None for every field if the read failed
+        """
+        return _decode_error_word(self._read_word(commands.ERROR_WORD), copy=copy)
+
+    def get_modbus_error_word(self, copy: bool = True) -> dict:
+        """
+        Reads the modbus error word and outputs it to the log.
+
+        Args:
+            copy (bool): Return an independent dictionary instead of the shared decoded one. Defaults to True.
+
+        Returns:
+            Current modbus error word of the PGVA-1, with None for every field if the read failed
+        """
+        return _decode_modbus_error_word(self._read_word(commands.LAST_MODBUS_ERROR), copy=copy)
+
+    def get_all_words(self, copy: bool = True) -> dict:
+        """
+        Reads the status, warning, error and Modbus error words together.
+
+        On current firmware the four words come from two Modbus requests, one for the status and
+        Modbus error words and one for the adjacent warning and error words.
+
+        Args:
+            copy (bool): Return independent dictionaries instead of the shared decoded ones. Defaults to True.
+
+        Returns:
+            Dictionary of the decoded words keyed by "Status", "Warning", "Error" and "ModbusError"
+        """
+        if self._supports_status_block:
+            _, block = self._read_word_block(commands.STATUS_WORD)
+            _, alarms = self._read_word_block(commands.WARNING_WORD)
+            if block is None:
+                status = modbus_error = None
+            else:
+                status = block[0]
+                modbus_error = block[_WORD_OFFSET_MODBUS_ERROR]
+            if alarms is None:
+                warning = error = None
+            else:
+                warning = alarms[0]
+                error = alarms[_WORD_OFFSET_ERROR]
+        else:
+            status = self._read_word(commands.STATUS_WORD)
+            warning = self._read_word(commands.WARNING_WORD)
+            error = self._read_word(commands.ERROR_WORD)
+            modbus_error = self._read_word(commands.LAST_MODBUS_ERROR)
+        return {
+            "Status": _decode_status_word(status, copy=copy),
+            "Warning": _decode_warning_word(warning, copy=copy),
+            "Error": _decode_error_word(error, copy=copy),
+            "ModbusError": _decode_modbus_error_word(modbus_error, copy=copy),
+        }
+
+
+class PGVAModbusTCP(PGVAModbusClient):
+    """
+    This class is the interface backend for using Modbus TCP communication.
+
+    Backends configured for the same (ip, port, unit_id) share one connection,
+    which is closed once the last of them is closed.
+
+    TODO: Add typical usage example
+    """
+
+    def __init__(self, config: PGVAConfig) -> None:
+        """
+        TCP Client Interface Constructor.
+
+        Args:
+            config (PGVATCPConfig): A configuration class designated for ModbusTCP
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: If config is not an instance of PGVATCPConfig.
+        """
+        super().__init__(config)
+        if not isinstance(config, PGVATCPConfig):
+            raise TypeError(
+                f"Error: Config does not match the ModbusTCP backend. The type passed in was: {type(config)}"
+            )
+        try:
+            self._config = config
+            key = ("tcp", self._config.ip, self._config.port, self._config.unit_id)
+            client = _acquire_client(key)
+            self._client_key = key
+            try:
+                self.client = client
+                self._read_cache = _read_caches[key]
+                self.version = self.get_firmware_version()
+            except BaseException:
+                # Give the reference back, so a failed construction does not keep the connection open
+                self.close()
+                raise
+            logger.info(
+                "PGVA connected via TCP — host: %s, port: %s, unit_id: %s, firmware: %s",
+                self._config.ip,
+                self._config.port,
+                self._config.unit_id,
+                self.version,
+            )
+        except OSError as socket_error:
+            logger.error("Socket error: %s. ", socket_error)
+            logger.info("%s", self._config)
+
+    def print_driver_information(self) -> None:
+        """
+        Display all available information about the PGVA driver.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        super().print_driver_information()
+        logger.info("  IP Address: %s", self._config.ip)
+        logger.info("  Port: %s", self._config.port)
+        logger.info("  Modbus Slave ID: %s", self._config.unit_id)
+
+
+class PGVAModbusSerial(PGVAModbusClient):
+    """
+    This class is the interface backend for using Modbus Serial communication.
+
+    Backends configured for the same (com_port, baudrate, unit_id) share one client,
+    which is closed once the last of them is closed.
+    """
+
+    def __init__(self, config: PGVAConfig) -> None:
+        """
+        Serial Client Interface Constructor.
+
+        Args:
+            config (PGVASerialConfig): A configuration class designated for ModbusSerial
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: If config is not an instance of PGVASerialConfig.
+        """
+        logger.warning(
+            "The Modbus Serial connection mode is currently experimental and under active development. "
+            "It can currently only be instantiated directly. Use at your own risk."
+        )
+        super().__init__(config)
+        if not isinstance(config, PGVASerialConfig):
+            raise TypeError(
+                f"Error: Config does not match the ModbusSerial backend. The type passed in was: {type(config)}"
+            )
+        try:
+            self._config = config
+            key = ("serial", self._config.com_port, self._config.baudrate, self._config.unit_id)
+            client = _acquire_client(key)
+            self._client_key = key
+            try:
+                self.client = client
+                self._read_cache = _read_caches[key]
+                # A status poll cannot complete faster than its frames take on the line
+                self._poll_delay_min = max(
+                    consts.POLL_DELAY_MIN_S,
+                    consts.RTU_STATUS_POLL_CHARS * consts.RTU_BITS_PER_CHAR / self._config.baudrate,
+                )
+                self.version = self.get_firmware_version()
+            except BaseException:
+                # Give the reference back, so a failed construction does not keep the port open
+                self.close()
+                raise
+            logger.info(
+                "PGVA connected via Serial — port: %s, baudrate: %s, unit_id: %s, firmware: %s",
+                self._config.com_port,
+                self._config.baudrate,
+                self._config.unit_id,
+                self.version,
+            )
+        except RuntimeError as run_err:
+            logger.error("Error with serial connection: %s", run_err)
+            logger.info("%s", self._config)
 
-    def set_actuation_time(self, actuation_time: int) -> None:
+    def print_driver_information(self) -> None:
         """
-        Sets the valve actuation time which is then immediately executed.
+        Display all available information about the PGVA driver.
 
         Args:
-            actuation_time (int): Time in ms for valve to be open
+            None
 
         Returns:
             None
-
-        Raises:
-            ValueError: If actuation_time is outside the valid range of 5 to 65535 ms.
         """
-        if actuation_time in range(5, 65535):
-            logger.info("Triggering actuation valve for %s ms", actuation_time)
-            self._set_data(commands.VALVE_ACTUATION_TIME, actuation_time)
-            # time.sleep(actuation_time / 1000)
-        else:
-            logger.error(
-                "Error: acuation time out of range (5, 65535), inputted: %s",
-                str(actuation_time),
-            )
-            raise ValueError("Error: Value entered for actuation time needs to be between 5 and 65535")
+        super().print_driver_information()
+        logger.info("  Serial Port: %s", self._config.com_port)
+        logger.info("  Baudrate: %s", self._config.baudrate)
+        logger.info("  Modbus Slave ID: %s", self._config.unit_id)
 
-    def toggle_manual_trigger(self, toggle: bool) -> None:
-        """
-        Toggles the manual trigger to either on or off.
 
-        Args:
-            toggle (int): Bool value, 1 for on, 0 for off
+class PGVAAsyncModbusTCP:
+    """
+    This class is the asyncio interface backend for using Modbus TCP communication.
 
-        Returns:
-            None
+    Every device operation is a coroutine, so requests to several PGVA-1 devices can be
+    awaited concurrently. The connection is opened by awaiting ``connect()``.
+    """
 
-        Raises:
-            NotImplementedError: Manual trigger is not implemented due to a firmware limitation.
-        """
-        # self._set_data(commands.MANUAL_TRIGGER, int(toggle))
-        logger.warning("toggle_manual_trigger() is not implemented: known firmware bug in PGVA-1 firmware <= 2.0.45")
-        raise NotImplementedError("""
-                                  Manual trigger not implemented. There is a bug that exists in the PGVA-1 firmware <=2.0.45
-                                  that prevents this function from working as intended
-                                  """)
+    client: AsyncModbusTcpClient
+    _version: tuple
+    _supports_pump_enable: bool
+    _has_external_sensor: bool
+    # Key of the pump state shared with the other async backends of the device, None while closed
+    _client_key: tuple | None = None
 
-    def get_internal_sensor_data(self) -> dict:
+    def __init__(self, config: PGVAConfig) -> None:
         """
-        Reads the internal Vacuum and Pressure chambers as well as the output pressure sensor.
+        Async TCP Client Interface Constructor.
 
         Args:
-            None
+            config (PGVATCPConfig): A configuration class designated for ModbusTCP
 
         Returns:
-            Dictionary of the sensor values
-        """
-        status = {}
-        if self.version[0:3] != [2, 1, 3]:
-            status["Extsensor"] = self._get_data(commands.EXTERNAL_SENSOR_VALUE)
-        status["VacuumChamber"] = self.get_vacuum_chamber()
-        status["PressureChamber"] = self.get_pressure_chamber()
-        status["OutputPressure"] = self.get_output_pressure()
-        logger.debug("Internal sensor data: %s", status)
-        return status
+            None
 
-    def get_vacuum_chamber(self) -> int:
+        Raises:
+            TypeError: If config is not an instance of PGVATCPConfig.
         """
-        Reads the internal vacuum chamber pressure.
+        if not isinstance(config, PGVATCPConfig):
+            raise TypeError(
+                f"Error: Config does not match the ModbusTCP backend. The type passed in was: {type(config)}"
+            )
+        self._config = config
+        self.version = ()
+        self.client = AsyncModbusTcpClient(host=self._config.ip, port=self._config.port)
+        self._status_read = functools.partial(self.client.read_input_registers, address=_STATUS_WORD_ADDRESS, count=1)
+
+    @property
+    def version(self) -> tuple:
+        """Firmware version of the connected PGVA as (version, subversion, build)."""
+        return self._version
+
+    @version.setter
+    def version(self, version: tuple) -> None:
+        self._version = tuple(version)
+        # Feature flags derived once per version instead of comparing the version on every call
+        legacy = self._version == consts.LEGACY_FIRMWARE_VERSION
+        self._supports_pump_enable = not legacy
+        self._has_external_sensor = not legacy
+
+    @property
+    def _pump_enabled_cache(self) -> bool | None:
+        """Last known pump enable state of the device, None until read from or written to the device."""
+        return _pump_states.get(self._client_key)
+
+    @_pump_enabled_cache.setter
+    def _pump_enabled_cache(self, enabled: bool | None) -> None:
+        # Without a connection there is nothing to track, so the state is read on every use
+        if self._client_key is not None:
+            _pump_states[self._client_key] = enabled
+
+    async def connect(self) -> None:
+        """
+        Opens the connection and reads the firmware version of the PGVA.
 
         Args:
             None
 
         Returns:
-            Vacuum chamber pressure in mBar
+            None
         """
-        vacuum = self._get_data(commands.VACUUM_ACTUAL_MBAR)
-        result = self._convert_twos_comp(vacuum, len(bin(vacuum)[2:]))
-        logger.debug("Vacuum chamber reading: %s mBar", result)
-        return result
-
-    def get_pressure_chamber(self) -> int:
+        await self.client.connect()
+        if self._client_key is None:
+            self._client_key = ("async-tcp", self._config.ip, self._config.port, self._config.unit_id)
+            _acquire_shared_state(self._client_key)
+        self.version = await self.get_firmware_version()
+        logger.info(
+            "PGVA connected via async TCP — host: %s, port: %s, unit_id: %s, firmware: %s",
+            self._config.ip,
+            self._config.port,
+            self._config.unit_id,
+            self.version,
+        )
+
+    def close(self) -> None:
         """
-        Reads the internal pressure chamber pressure.
+        Closes the connection to the PGVA.
 
         Args:
             None
 
         Returns:
-            Pressure chamber pressure in mBar
+            None
         """
-        result = self._get_data(commands.PRESSURE_ACTUAL_MBAR)
-        logger.debug("Pressure chamber reading: %s mBar", result)
-        return result
+        self.client.close()
+        if self._client_key is not None:
+            _release_client(self._client_key)
+            self._client_key = None
 
-    def get_output_pressure(self) -> int:
+    async def get_firmware_version(self) -> tuple:
         """
-        Reads the output port pressure.
+        Gets the current firmware version located on the PGVA.
 
         Args:
             None
 
         Returns:
-            Output pressure in mBar
+            Tuple of the version
         """
-        pressure = self._get_data(commands.OUTPUT_PRESSURE_ACTUAL_MBAR)
-        if pressure > 500:
-            result = self._convert_twos_comp(pressure, len(bin(pressure)[2:]))
-            logger.debug("Output pressure reading: %s mBar", result)
-            return result
-        logger.debug("Output pressure reading: %s mBar", pressure)
-        return pressure
+        registers = await self._get_data_block(commands.FIRMWARE_VERSION, _FIRMWARE_VERSION_COUNT)
+        if registers is None or len(registers) != _FIRMWARE_VERSION_COUNT:
+            version = (None, None, None)
+        else:
+            version = tuple(registers)
+        logger.debug("Firmware version retrieved: %s", version)
+        return version
 
-    def set_pressure_chamber(self, pressure: int) -> None:
+    @_modbus_call("reading block")
+    async def _get_data_block(self, register, count: int, holding: bool = False):
         """
-        Sets the internal pressure chamber.
+        Method used to read consecutive registers in a single request.
 
         Args:
-            pressure (int): Range between 200 ... 1000 mBar
+            register: Address of the first register to be read
+            count (int): Number of registers to read
+            holding (bool): Read holding registers instead of input registers
 
         Returns:
-            None
-
-        Raises:
-            ValueError: If pressure is outside the supported pressure chamber range.
+            List of register values, or None if the read failed
         """
-        if consts.MINIMUM_PRESSURE_CHAMBER_MBAR <= pressure <= consts.MAXIMUM_PRESSURE_CHAMBER_MBAR:
-            # Using the pressure scaling factor provided via operation manual of the PGVA
-            logger.info("Setting pressure chamber to %s mBar", pressure)
-            pressure = int(pressure * consts.PRESSURE_CHAMBER_CONVERSION_FACTOR)
-            self._set_data(commands.PRESSURE_THRESHOLD, pressure)
-        else:
-            err = f"Error: {pressure} input pressure outside of PGVA-1 working conditions. Please enter a value between 200 and 1000 mBar."
-            logger.error(err)
-            raise ValueError(err)
+        logger.debug("Reading %s registers from: %s", count, _register_name(register))
+        read = self.client.read_holding_registers if holding else self.client.read_input_registers
+        data = await read(address=register, count=count)
+        return data.registers
 
-    def set_vacuum_chamber(self, vacuum: int) -> None:
+    @_modbus_call("writing data")
+    async def _set_data(self, register, values: list, timeout: float = 30.0, wait_idle: bool = True):
         """
-        Sets the internal vacuum chamber.
+        Method used to write one or more consecutive registers and wait until the device is idle.
 
         Args:
-            vacuum (int): Range between -200 ... -620 mBar
+            register: Address of the first register to be written
+            values (list): Values to be written, one per register starting at ``register``
+            timeout (float): Maximum seconds to wait for the device to leave
+                the busy state after the write. Defaults to 30 seconds.
+            wait_idle (bool): Poll the status word until the device is idle
+                after the write. Defaults to True.
 
         Returns:
-            None
+            True if the write succeeded, or None if it failed
 
         Raises:
-            ValueError: If vacuum is outside the supported vacuum chamber range.
+            TimeoutError: If the device remains busy beyond ``timeout`` seconds.
         """
-        if consts.MINIMUM_VACUUM_CHAMBER_MBAR <= vacuum <= consts.MAXIMUM_VACUUM_CHAMBER_MBAR:
-            logger.info("Setting vacuum chamber to %s mBar", vacuum)
-            vacuum = int(vacuum * consts.VACUUM_CHAMBER_CONVERSION_FACTOR)
-            self._set_data(commands.VACUUM_THRESHOLD, vacuum)
+        logger.debug("Writing registers from %s, values: %s", _register_name(register), values)
+        values = [val & _REGISTER_MASK for val in values]
+        if len(values) == 1:
+            await self.client.write_register(address=register, value=values[0])
         else:
-            err = f"Error: {vacuum} input pressure outside of PGVA-1 working conditions."
-            logger.error(err)
-            raise ValueError(err)
+            await self.client.write_registers(address=register, values=values)
+        if not wait_idle:
+            return True
+        deadline = time.monotonic() + timeout
+        read = self._status_read
+        status_word = (await read()).registers[0]
+        delay = consts.POLL_DELAY_MIN_S
+        while status_word & 1:
+            if time.monotonic() > deadline:
+                logger.error(
+                    "Device still busy after %.1f s following write to %s — aborting poll",
+                    timeout,
+                    _register_name(register),
+                )
+                raise TimeoutError(
+                    f"PGVA device remained busy for more than {timeout}s after writing to {_register_name(register)}"
+                )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, consts.POLL_DELAY_MAX_S)
+            status_word = (await read()).registers[0]
+        return True
 
-    def toggle_pump(self, toggle: bool) -> None:
+    def invalidate_pump_cache(self) -> None:
         """
-        Enables or disables the pump for creating pressure / vacuum.
+        Forgets the cached pump enable state, so the next pressure set reads it from the device.
+
+        Needed when the pump may have been switched by another client or on the device itself.
 
         Args:
-            toggle (bool): 1 for on, 0 for off
+            None
 
         Returns:
             None
         """
-        logger.info("Toggling pump: %s", "ON" if toggle else "OFF")
-        if self.version[0:3] != [2, 1, 3]:
-            self._set_data(commands.PUMP_ENABLE, toggle)
-        else:
-            logger.info("PGVA firmware does not support the enable/disable pump function")
+        self._pump_enabled_cache = None
 
-    def _validate_pump_enable(self):
+    async def _validate_pump_enable(self) -> bool:
         """
         Validates that the pump is enabled for creating pressure.
 
+        The enable state is read from the device once and then tracked through the pump
+        toggles of every backend sharing the connection until ``invalidate_pump_cache`` is called.
+
         Args:
             None
 
         Returns:
             Bool: True if enabled, False if disabled
         """
-        if self.version[0:3] != [2, 1, 3]:
-            if self._get_data_holding(commands.PUMP_ENABLE) == 1:
-                logger.debug("Pump validation: pump is enabled")
-                return True
-            logger.warning("Pump is NOT enabled — call toggle_pump(True) before setting pressure")
-            return False
-        logger.info("PGVA firmware version does not support the enable/disable pump function")
-        return True
-
-    def _enable_pump(self):
+        if not self._supports_pump_enable:
+            return True
+        enabled = self._pump_enabled_cache
+        if enabled is None:
+            registers = await self._get_data_block(commands.PUMP_ENABLE, 1, holding=True)
+            enabled = registers is not None and registers[0] == 1
+            if registers is not None:
+                self._pump_enabled_cache = enabled
+        if enabled:
+            return True
+        logger.warning("Pump is NOT enabled — call toggle_pump(True) before setting pressure")
+        return False
+
+    async def set_output_pressure(self, pressure: int) -> None:
         """
-        Enables the pump.
+        Sets the output pressure for the PGVA.
 
         Args:
-            None
+            pressure (int): Any range between -450 ... 450
 
         Returns:
             None
+
+        Raises:
+            ValueError: If pressure is outside the supported output pressure range.
         """
-        if self.version[0:3] != [2, 1, 3]:
-            logger.info("Enabling pump")
-            self._set_data(commands.PUMP_ENABLE, 1)
-        else:
-            logger.info("PGVA firmware does not support the enable/disable pump function")
+        if await self._validate_pump_enable():
+            _check_output_pressure(pressure)
+            logger.info("Setting output pressure to %s mBar", pressure)
+            await self._set_data(commands.OUTPUT_PRESSURE_MBAR, [pressure])
 
-    def _disable_pump(self):
+    async def set_output_pressure_ramp(self, values: Sequence[int], dwell_ms: int = 0) -> None:
         """
-        Disables the pump.
+        Steps the output pressure through a sequence of set points.
 
         Args:
-            None
+            values (Sequence[int]): Set points in mBar, each between -450 ... 450
+            dwell_ms (int): Time in ms to hold each set point before writing the next. Defaults to 0.
 
         Returns:
             None
-        """
-        if self.version[0:3] != [2, 1, 3]:
-            logger.info("Disabling pump")
-            self._set_data(commands.PUMP_ENABLE, 0)
-        else:
-            logger.info("connected PGVA device version does not support this function ")
 
-    def print_driver_information(self) -> None:
+        Raises:
+            ValueError: If any set point is outside the supported output pressure range.
         """
-        Logs all driver parameters at INFO level.
+        for pressure in values:
+            _check_output_pressure(pressure)
+        if not values or not await self._validate_pump_enable():
+            return
+        logger.info("Ramping output pressure through %s set points", len(values))
+        for pressure in values:
+            await self._set_data(commands.OUTPUT_PRESSURE_MBAR, [pressure])
+            if dwell_ms:
+                await asyncio.sleep(dwell_ms / 1000)
+
+    async def set_actuation_time(self, actuation_time: int, wait: bool = True) -> None:
+        """
+        Sets the valve actuation time which is then immediately executed.
 
         Args:
-            None
+            actuation_time (int): Time in ms for valve to be open
+            wait (bool): Suspend until the valve has closed again. Defaults to True.
 
         Returns:
             None
-        """
-        internal_data = self.get_internal_sensor_data()
-        logger.info("Driver Information:")
-        logger.info("  Firmware version: %s", self.version)
-        logger.info("  Connection type: %s", self._config.interface)
-        logger.info("  Sensor data: %s", internal_data)
 
-    def get_status_word(self) -> dict:
+        Raises:
+            ValueError: If actuation_time is outside the valid range of 5 to 65534 ms.
         """
-        Reads the status word and outputs it to the log.
-
-        Args:
-            None
+        _check_actuation_time(actuation_time)
+        logger.info("Triggering actuation valve for %s ms", actuation_time)
+        await self._set_data(commands.VALVE_ACTUATION_TIME, [actuation_time], wait_idle=False)
+        if wait:
+            await asyncio.sleep(actuation_time / 1000 + consts.VALVE_ACTUATION_MARGIN_S)
 
-        Returns:
-            Current status of the PGVA-1
+    async def run_timed_pressure(self, pressure_mbar: int, time_ms: int, wait: bool = True) -> None:
         """
-        pgva_status = self._get_data(commands.STATUS_WORD)
-        status_word = {
-            "Status": self._status["Status"][pgva_status & 1],
-            "Pump": self._status["Pump"][(pgva_status >> 1) & 0b11],
-            "Pressure": self._status["Pressure"][(pgva_status >> 3) & 1],
-            "Vacuum": self._status["Vacuum"][(pgva_status >> 4) & 1],
-            "EEPROM": self._status["EEPROM"][(pgva_status >> 5) & 1],
-            "TargetPressure": self._status["TargetPressure"][(pgva_status >> 6) & 1],
-            "Trigger": self._status["Trigger"][(pgva_status >> 7) & 1],
-            "OutputValveControl": self._status["OutputValveControl"][(pgva_status >> 10) & 1],
-            "OutputValve": self._status["OutputValve"][(pgva_status >> 11) & 1],
-        }
+        Sets the output pressure and then opens the actuation valve for a set time.
 
-        logger.debug("Status word: %s", status_word)
-        return status_word
-
-    def get_warning_word(self) -> dict:
-        """
-        Reads the warning word and outputs it to the log.
+        Both values are validated before anything is written, and the valve is only
+        opened once the output pressure has been written.
 
         Args:
-            None
+            pressure_mbar (int): Any range between -450 ... 450
+            time_ms (int): Time in ms for valve to be open
+            wait (bool): Suspend until the valve has closed again. Defaults to True.
 
         Returns:
-           Current warning word of the PGVA-1
-        """
-        pgva_warning = self._get_data(commands.WARNING_WORD)
-        warning_word = {
-            "SupplyVoltage": self._warning["SupplyVoltage"][pgva_warning & 1],
-            "VacuumThreshold": self._warning["VacuumThreshold"][(pgva_warning >> 1) & 1],
-            "PressureThreshold": self._warning["PressureThreshold"][(pgva_warning >> 2) & 1],
-            "TargetPressure": self._warning["TargetPressure"][(pgva_warning >> 4) & 1],
-            "VacuumChamber": self._warning["VacuumChamber"][(pgva_warning >> 5) & 1],
-            "Pump": self._warning["Pump"][(pgva_warning >> 7) & 1],
-            "ExternalSensor": self._warning["ExternalSensor"][(pgva_warning >> 9) & 1],
-        }
-        if any(v != "Reset" for v in warning_word.values()):
-            logger.warning("Active PGVA warning(s): %s", warning_word)
-        else:
-            logger.debug("Warning word: %s", warning_word)
-        return warning_word
+            None
 
-    def get_error_word(self) -> dict:
+        Raises:
+            ValueError: If either value is outside of its supported range.
         """
-        Reads the error word and outputs it to the log.
+        _check_output_pressure(pressure_mbar)
+        _check_actuation_time(time_ms)
+        if not await self._validate_pump_enable():
+            return
+        logger.info("Setting output pressure to %s mBar", pressure_mbar)
+        if await self._set_data(commands.OUTPUT_PRESSURE_MBAR, [pressure_mbar]) is None:
+            logger.error("Output pressure was not set, skipping the valve actuation")
+            return
+        await self.set_actuation_time(time_ms, wait=wait)
+
+    async def set_pressure_chamber(self, pressure: int) -> None:
+        """
+        Sets the internal pressure chamber.
 
         Args:
-            None
+            pressure (int): Range between 200 ... 1000 mBar
 
         Returns:
-            Current error word of the PGVA-1
+            None
+
+        Raises:
+            ValueError: If pressure is outside the supported pressure chamber range.
         """
-        pgva_error = self._get_data(commands.ERROR_WORD)
-        error_word = {
-            "PumpTimeout": self._pgva_error["PumpTimeout"][pgva_error & 1],
-            "TimeoutPressure": self._pgva_error["TimeoutPressure"][(pgva_error >> 1) & 1],
-            "ModbusError": self._pgva_error["ModbusError"][(pgva_error >> 2) & 1],
-            "LowVoltage": self._pgva_error["LowVoltage"][(pgva_error >> 3) & 1],
-            "HighVoltage": self._pgva_error["HighVoltage"][(pgva_error >> 4) & 1],
-            "TimeoutExternalSensor": self._pgva_error["TimeoutExternalSensor"][(pgva_error >> 5) & 1],
-        }
-        if any(v != "Reset" for v in error_word.values()):
-            logger.error("Active PGVA error(s): %s", error_word)
-        else:
-            logger.debug("Error word: %s", error_word)
-        return error_word
+        raw_pressure = _pressure_chamber_to_raw(pressure)
+        logger.info("Setting pressure chamber to %s mBar", pressure)
+        await self._set_data(commands.PRESSURE_THRESHOLD, [raw_pressure])
 
-    def get_modbus_error_word(self) -> dict:
+    async def set_vacuum_chamber(self, vacuum: int) -> None:
         """
-        Reads the modbus error word and outputs it to the log.
+        Sets the internal vacuum chamber.
 
         Args:
-            None
+            vacuum (int): Range between -900 ... -200 mBar
 
         Returns:
-            Current modbus error word of the PGVA-1
+            None
+
+        Raises:
+            ValueError: If vacuum is outside the supported vacuum chamber range.
         """
-        modbus_error = self._get_data(commands.LAST_MODBUS_ERROR)
-        modbus_error_word = {"OutputActuationTime": self._modbus_error["OutputActuationTime"][modbus_error & 1]}
-        if any(v != "Reset" for v in modbus_error_word.values()):
-            logger.error("Active Modbus error(s): %s", modbus_error_word)
-        else:
-            logger.debug("Modbus error word: %s", modbus_error_word)
-        return modbus_error_word
+        raw_vacuum = _vacuum_chamber_to_raw(vacuum)
+        logger.info("Setting vacuum chamber to %s mBar", vacuum)
+        await self._set_data(commands.VACUUM_THRESHOLD, [raw_vacuum])
 
-    def _set_pgva_status(self):
+    async def set_chambers(self, pressure: int, vacuum: int) -> None:
         """
-        Sets the internal messages for the incoming status word.
+        Sets both internal chambers with a single Modbus request.
 
         Args:
-            None
+            pressure (int): Range between 200 ... 1000 mBar
+            vacuum (int): Range between -900 ... -200 mBar
 
         Returns:
             None
+
+        Raises:
+            ValueError: If either value is outside of its supported chamber range.
         """
-        self._status = {
-            "Status": {0: "Idle", 1: "Busy"},
-            "Pump": {
-                0: "Pump is off",
-                1: "Pump is building pressure",
-                2: "Pump is building vacuum",
-            },
-            "Pressure": {
-                0: "Pressure in the tank is nominal",
-                1: "Pressure in the tank is below threshold",
-            },
-            "Vacuum": {
-                0: "Vacuum in the tank is nominal",
-                1: "Vacuum in the tank is below threshold",
-            },
-            "EEPROM": {0: "No EEPROM write pending", 1: "EEPROM write pending"},
-            "TargetPressure": {
-                0: "Target pressure in progress",
-                1: "Target pressure achieved",
-            },
-            "Trigger": {0: "Trigger is closed", 1: "Trigger is open"},
-            "OutputValveControl": {
-                0: "Exhaust valve management disabled",
-                1: "Exhaust valve management enabled",
-            },
-            "OutputValve": {0: "Exhaust valve closed", 1: "Exhaust valve open"},
-        }
+        raw_pressure = _pressure_chamber_to_raw(pressure)
+        raw_vacuum = _vacuum_chamber_to_raw(vacuum)
+        logger.info("Setting pressure chamber to %s mBar and vacuum chamber to %s mBar", pressure, vacuum)
+        # VACUUM_THRESHOLD (4097) is directly followed by PRESSURE_THRESHOLD (4098)
+        await self._set_data(commands.VACUUM_THRESHOLD, [raw_vacuum, raw_pressure])
 
-    def _set_pgva_warning(self):
+    async def toggle_pump(self, toggle: bool) -> None:
         """
-        Sets the internal messages for the incoming warning word.
+        Enables or disables the pump for creating pressure / vacuum.
 
         Args:
-            None
+            toggle (bool): 1 for on, 0 for off
 
         Returns:
             None
         """
-        self._warning = {
-            "SupplyVoltage": {0: "Reset", 1: "Abnormal supply voltage"},
-            "VacuumThreshold": {
-                0: "Reset",
-                1: "Vacuum generator cannot reach threshold",
-            },
-            "PressureThreshold": {
-                0: "Reset",
-                1: "Pressure generator cannot reach threshold",
-            },
-            "TargetPressure": {
-                0: "Reset",
-                1: "Preset output pressure cannot be reached",
-            },
-            "VacuumChamber": {0: "Reset", 1: "Vacuum chamber set below -500 mBar"},
-            "PressureChamber": {0: "Reset", 1: "Pressure chamber set above 500 mBar"},
-            "Pump": {0: "Reset", 1: "Pump ran for 9 minutes"},
-            "ExternalSensor": {0: "Reset", 1: "External Sensor Verification warning"},
-        }
+        logger.info("Toggling pump: %s", "ON" if toggle else "OFF")
+        if self._supports_pump_enable:
+            written = await self._set_data(commands.PUMP_ENABLE, [int(toggle)], wait_idle=False)
+            # A failed write may or may not have reached the device, so the state is read again on next use
+            self._pump_enabled_cache = bool(toggle) if written else None
+        else:
+            logger.info("PGVA firmware does not support the enable/disable pump function")
 
-    def _set_pgva_error(self):
+    async def _read_sensor_block(self) -> list | None:
         """
-        Sets the internal messages for the incoming error word.
+        Reads the vacuum, pressure and output pressure registers with a single Modbus request.
 
         Args:
             None
 
         Returns:
-            None
+            Registers starting at VACUUM_ACTUAL_MBAR, or None if the read failed
         """
-        self._pgva_error = {
-            "PumpTimeout": {0: "Reset", 1: "Pump ran longer than 10 minutes"},
-            "TimeoutPressure": {
-                0: "Reset",
-                1: "Target output pressure not achieved in 8 minutes",
-            },
-            "ModbusError": {
-                0: "Reset",
-                1: "Modbus error occurred, please read modbus error word",
-            },
-            "LowVoltage": {0: "Reset", 1: "Power supply too low"},
-            "HighVoltage": {0: "Reset", 1: "Power supply too high"},
-            "TimeoutExternalSensor": {0: "Reset", 1: "External sensor check timed out"},
-        }
-
-    def _set_modbus_error(self):
-        """
-        Sets the internal messages for the incoming modbus error word.
-
-        Args:
-            None
-
-        Returns:
-            None
-        """
-        modbus_message = "The Modbus command was not executed"
-        self._modbus_error = {
-            "OutputActuationTime": {
-                0: "Reset",
-                1: f"Trigger time is outside of input range, {modbus_message}",
-            },
-            "PressureThreshold": {
-                0: "Reset",
-                1: f"Pressure threshold outside of input range, {modbus_message}",
-            },
-            "VacuumThreshold": {
-                0: "Reset",
-                1: f"Vacuum threshold outside of input range, {modbus_message}",
-            },
-            "OutputPressure": {
-                0: "Reset",
-                1: f"OutputPressure is outside of input range, {modbus_message}",
-            },
-            "ModbusID": {
-                0: "Reset",
-                1: f"Modbus Unit ID out of range, {modbus_message}",
-            },
-            "IPAddress": {
-                0: "Reset",
-                1: f"IP address does not comply with the restrictions, {modbus_message}",
-            },
-            "ManualTrigger": {
-                0: "Reset",
-                1: f"Manual trigger input is invalid, {modbus_message}",
-            },
-            "IncorrectNumberRegisters": {
-                0: "Reset",
-                1: f"Invalid number of registers can be written, {modbus_message}",
-            },
-            "Register": {
-                0: "Reset",
-                1: f"""Register is write protected and cannot be written to,
-                         {modbus_message}""",
-            },
-            "DHCP": {
-                0: "Reset",
-                1: f"""Input values are outside of the permissable range,
-                     {modbus_message}""",
-            },
-            "ExternalSensor": {
-                0: "Reset",
-                1: f"""The input values are outside of the permissable range,
-                               {modbus_message}""",
-            },
-            "ExhaustValveVolume": {
-                0: "Reset",
-                1: f"""The input values are outside of the permissable range,
-                                   {modbus_message}""",
-            },
-        }
+        return await self._get_data_block(_SENSOR_BLOCK_ADDRESS, _SENSOR_BLOCK_COUNT)
 
-    def _convert_twos_comp(self, val, bits):
+    async def _read_external_sensor(self) -> int | None:
         """
-        Converts a 2 compliment value into the actual signed integer value.
+        Reads the external sensor register.
 
         Args:
-            val: value
-            bits: number of bits
+            None
 
         Returns:
-            Converted signed integer value
+            External sensor value, or None if the read failed
         """
-        if (val & (1 << (bits - 1))) != 0:  # if sign bit is set e.g., 8bit: 128-255
-            val = val - (1 << bits)  # compute negative value
-        return val
-
-
-class PGVAModbusTCP(PGVAModbusClient):
-    """
-    This class is the interface backend for using Modbus TCP communication.
-
-    TODO: Add typical usage example
-    """
+        registers = await self._get_data_block(_EXTERNAL_SENSOR_ADDRESS, 1)
+        return None if registers is None else registers[0]
 
-    def __init__(self, config: PGVAConfig) -> None:
+    async def get_internal_sensor_data(self) -> dict:
         """
-        TCP Client Interface Constructor.
+        Reads the internal Vacuum and Pressure chambers as well as the output pressure sensor.
 
         Args:
-            config (PGVATCPConfig): A configuration class designated for ModbusTCP
-
-        Returns:
             None
 
-        Raises:
-            TypeError: If config is not an instance of PGVATCPConfig.
+        Returns:
+            Dictionary of the sensor values
         """
-        super().__init__(config)
-        if not isinstance(config, PGVATCPConfig):
-            raise TypeError(
-                f"""Error: Config does not match the ModbusTCP backend.
-                The type passed in was: {type(config)}"""
-            )
-        try:
-            self._config = config
-            self.client = ModbusTcpClient(host=self._config.ip, port=self._config.port)
-            self._set_modbus_error()
-            self._set_pgva_error()
-            self._set_pgva_status()
-            self._set_pgva_warning()
-            self.version = self.get_firmware_version()
-            logger.info(
-                "PGVA connected via TCP — host: %s, port: %s, unit_id: %s, firmware: %s",
-                self._config.ip,
-                self._config.port,
-                self._config.unit_id,
-                self.version,
-            )
-        except socket.error as socket_error:
-            logger.error("Socket error: %s. ", str(socket_error))
-            logger.info(self._config)
+        external = await self._read_external_sensor() if self._has_external_sensor else None
+        status = _decode_sensor_block(await self._read_sensor_block(), self._has_external_sensor, external)
+        logger.debug("Internal sensor data: %s", status)
+        return status
 
-    def print_driver_information(self) -> None:
+    async def get_vacuum_chamber(self) -> int | None:
         """
-        Display all available information about the PGVA driver.
+        Reads the internal vacuum chamber pressure.
 
         Args:
             None
 
         Returns:
-            None
+            Vacuum chamber pressure in mBar, or None if the read failed
         """
-        super().print_driver_information()
-        logger.info("  IP Address: %s", self._config.ip)
-        logger.info("  Port: %s", self._config.port)
-        logger.info("  Modbus Slave ID: %s", self._config.unit_id)
-
-
-class PGVAModbusSerial(PGVAModbusClient):
-    """This class is the interface backend for using Modbus Serial communication."""
+        return (await self.get_internal_sensor_data())["VacuumChamber"]
 
-    def __init__(self, config: PGVAConfig) -> None:
+    async def get_pressure_chamber(self) -> int | None:
         """
-        Serial Client Interface Constructor.
+        Reads the internal pressure chamber pressure.
 
         Args:
-            config (PGVASerialConfig): A configuration class designated for ModbusSerial
-
-        Returns:
             None
 
-        Raises:
-            TypeError: If config is not an instance of PGVASerialConfig.
+        Returns:
+            Pressure chamber pressure in mBar, or None if the read failed
         """
-        logger.warning("""The Modbus Serial connection mode is currently experimental and under active development.
-                                It can currently only be instantiated directly.
-                                Use at your own risk.""")
-        super().__init__(config)
-        if not isinstance(config, PGVASerialConfig):
-            raise TypeError(
-                f"""Error: Config does not match the ModbusSerial backend.
-                            The type passed in was: {type(config)}"""
-            )
-        try:
-            self._config = config
-            self.client = ModbusSerialClient(port=self._config.com_port, baudrate=self._config.baudrate)
-            self.version = self.get_firmware_version()
-            self._set_modbus_error()
-            self._set_pgva_error()
-            self._set_pgva_status()
-            self._set_pgva_warning()
-            logger.info(
-                "PGVA connected via Serial — port: %s, baudrate: %s, unit_id: %s, firmware: %s",
-                self._config.com_port,
-                self._config.baudrate,
-                self._config.unit_id,
-                self.version,
-            )
-        except RuntimeError as run_err:
-            logger.error("Error with serial connection: %s", str(run_err))
-            logger.info(self._config)
+        return (await self.get_internal_sensor_data())["PressureChamber"]
 
-    def print_driver_information(self) -> None:
+    async def get_output_pressure(self) -> int | None:
         """
-        Display all available information about the PGVA driver.
+        Reads the output port pressure.
 
         Args:
             None
 
         Returns:
-            None
+            Output pressure in mBar, or None if the read failed
         """
-        super().print_driver_information()
-        logger.info("  Serial Port: %s", self._config.com_port)
-        logger.info("  Baudrate: %s", self._config.baudrate)
-        logger.info("  Modbus Slave ID: %s", self._config.unit_id)
+        return (await self.get_internal_sensor_data())["OutputPressure"]
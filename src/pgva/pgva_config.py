@@ -7,7 +7,7 @@ This holds all the different PGVA-1 configurations for different backends
 from dataclasses import dataclass
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PGVAConfig:
     """
     Generic class PGVA-1 dataclass for initalization.
@@ -15,13 +15,19 @@ class PGVAConfig:
     Attributes:
         interface (str): Interface type. Ex: 'tcp/ip', 'serial', 'codes
         unit_id (int): Modbus unit ID of the PGVA-1 device
+        cache_ttl_ms (int): Milliseconds that sensor and status reads are reused for
+            before the device is queried again. Defaults to 0, which disables caching.
+            The cache is shared by the PGVA instances on the same connection and
+            cleared by their writes; changes made by other clients can be missed
+            for up to this long
     """
 
     interface: str
     unit_id: int = 1
+    cache_ttl_ms: int = 0
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PGVATCPConfig(PGVAConfig):
     """
     Class for PGVA-1 configuration class for ModbusTCP connection.
@@ -35,7 +41,7 @@ class PGVATCPConfig(PGVAConfig):
     port: int = 502
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PGVASerialConfig(PGVAConfig):
     """
     Class PGVA-1 configuration for serial connection.
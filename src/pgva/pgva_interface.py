@@ -5,6 +5,7 @@ Abstract interface description for exportation to CoDeSys libraries and other sy
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 
 class PGVAInterface(ABC):
@@ -21,10 +22,25 @@ class PGVAInterface(ABC):
         pass
 
     @abstractmethod
-    def trigger_actuation_valve(self, actuation_time: int):
+    def set_and_read_output_pressure(self, pressure: int):
+        """Abstract function for setting output pressure and reading it back."""
+        pass
+
+    @abstractmethod
+    def set_output_pressure_ramp(self, values: Sequence[int], dwell_ms: int = 0):
+        """Abstract function for stepping the output pressure through a sequence of set points."""
+        pass
+
+    @abstractmethod
+    def trigger_actuation_valve(self, actuation_time: int, wait: bool = True):
         """Abstract function for running the actuation valve."""
         pass
 
+    @abstractmethod
+    def run_timed_pressure(self, pressure_mbar: int, time_ms: int, wait: bool = True):
+        """Abstract function for setting output pressure and then running the actuation valve."""
+        pass
+
     @abstractmethod
     def set_pressure_chamber(self, pressure: int):
         """Abstract function for setting internal pressure chamber."""
@@ -40,6 +56,17 @@ class PGVAInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def set_chambers(self, pressure: int, vacuum: int):
+        """
+        Sets the internal pressure and vacuum chambers together.
+
+        Args:
+            pressure: mBar
+            vacuum: mBar
+        """
+        pass
+
     @abstractmethod
     def get_pressure_chamber(self):
         """
@@ -91,45 +118,75 @@ class PGVAInterface(ABC):
         pass
 
     @abstractmethod
-    def get_status_word(self):
+    def invalidate_pump_cache(self):
+        """Forgets the cached pump state, so the next pressure set reads it from the PGVA."""
+        pass
+
+    @abstractmethod
+    def get_status_word(self, copy: bool = True):
         """
         Gets the status word from the PGVA.
 
+        Args:
+            copy (bool): Return an independent dictionary instead of the shared decoded one
+
         Returns:
             Status word: Dictionary of status
         """
         pass
 
     @abstractmethod
-    def get_warning_word(self):
+    def get_warning_word(self, copy: bool = True):
         """
         Gets the warning word from the PGVA-1.
 
+        Args:
+            copy (bool): Return an independent dictionary instead of the shared decoded one
+
         Returns:
             Warning word: Dictionary of warning word
         """
         pass
 
     @abstractmethod
-    def get_error_word(self):
+    def get_error_word(self, copy: bool = True):
         """
         Gets the error word from the PGVA-1.
 
+        Args:
+            copy (bool): Return an independent dictionary instead of the shared decoded one
+
         Returns:
             Error word: Dictionary of error word
         """
         pass
 
     @abstractmethod
-    def get_modbus_error_word(self):
+    def get_modbus_error_word(self, copy: bool = True):
         """
         Get the error word from the PGVA-1.
 
+        Args:
+            copy (bool): Return an independent dictionary instead of the shared decoded one
+
         Returns:
             Modbus error word: Dictionary of modbus error word
         """
         pass
 
+    @abstractmethod
+    def get_all_words(self, copy: bool = True):
+        """
+        Get the status, warning, error and modbus error words from the PGVA-1 together.
+
+        Args:
+            copy (bool): Return independent dictionaries instead of the shared decoded ones
+
+        Returns:
+            Words: Dictionary of the four words keyed by "Status", "Warning", "Error" and "ModbusError"
+        """
+        pass
+
     @abstractmethod
     def toggle_trigger(self, trigger: bool):
         """
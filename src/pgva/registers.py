@@ -1,10 +1,10 @@
 """Register mapping for PGVA."""
 
-from enum import Enum, unique
+from enum import IntEnum, unique
 
 
 @unique
-class _PGVARegisters(Enum):
+class _PGVARegisters(IntEnum):
     """Enum class for PGVA register mapping."""
 
     VACUUM_ACTUAL = 256
@@ -4,51 +4,112 @@ Fixtures
 --------
 pgva_tcp_mock
     A ``PGVA`` instance whose backend is fully replaced by a
-    ``MagicMock``.  No hardware or network connection is required.
-    Use this in all unit tests.
+    ``FakeBackend``.  No hardware or network connection is required.
+    The instance is built once per test module and its recorded calls
+    and return values are reset before every test.  Use this in all
+    unit tests.
 
 pgva_hw
     A real ``PGVA`` instance connected to a live device.  The test is
     automatically skipped when the ``PGVA_IP`` environment variable is
     not set.  Mark any test that uses this fixture with
-    ``@pytest.mark.hardware``.
+    ``@pytest.mark.hardware``.  The connection is shared by the test
+    module and closed when the module finishes.
+
+hw_snapshot
+    A frozen ``HardwareSnapshot`` of the status words and sensor data,
+    read from the live device once per test module so read-only
+    structure checks do not each issue their own Modbus requests.
 """
 
+import copy
+from dataclasses import dataclass
 from os import getenv
-from unittest.mock import MagicMock
 
 import pytest
 
 from pgva import PGVA, PGVATCPConfig
 
 
+# ---------------------------------------------------------------------------
+# Fake backend — records calls in plain lists instead of MagicMock children
+# ---------------------------------------------------------------------------
+
+
+class FakeMethod:
+    """Callable standing in for one backend method.
+
+    Records every call as an ``(args, kwargs)`` tuple and returns
+    ``return_value``.  Offers the subset of the ``Mock`` assertion API
+    used by the unit tests.
+    """
+
+    __slots__ = ("name", "return_value", "calls")
+
+    def __init__(self, name: str, return_value=None):
+        self.name = name
+        self.return_value = return_value
+        self.calls: list[tuple[tuple, dict]] = []
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.return_value
+
+    def assert_called_once_with(self, *args, **kwargs) -> None:
+        assert len(self.calls) == 1, f"Expected {self.name} to be called once, called {len(self.calls)} times"
+        assert self.calls[0] == (args, kwargs), f"{self.name} called with {self.calls[0]}, expected {(args, kwargs)}"
+
+    def assert_not_called(self) -> None:
+        assert not self.calls, f"Expected {self.name} not to be called, called {len(self.calls)} times"
+
+
+class FakeBackend:
+    """Hand-written stand-in for a ``PGVAModbusClient`` backend.
+
+    Any attribute that is not set explicitly resolves to a ``FakeMethod``
+    that is created on first access and reused afterwards, so tests read
+    ``backend.<method>.return_value`` and assert on its calls as they
+    would with a ``MagicMock``.
+    """
+
+    def __init__(self, returns: dict | None = None):
+        self.version = (2, 0, 45)
+        self._returns = dict(returns or {})
+        for name, value in self._returns.items():
+            setattr(self, name, FakeMethod(name, copy.deepcopy(value)))
+
+    def reset_mock(self) -> None:
+        """Forget all recorded calls and restore fresh copies of the default return values.
+
+        The defaults are copied so a test mutating a returned dict cannot leak into the next one.
+        """
+        for name, method in vars(self).items():
+            if isinstance(method, FakeMethod):
+                method.calls.clear()
+                method.return_value = copy.deepcopy(self._returns.get(name))
+
+    def __getattr__(self, name: str) -> FakeMethod:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        method = FakeMethod(name)
+        setattr(self, name, method)
+        return method
+
+
 # ---------------------------------------------------------------------------
 # Mock fixture — no hardware required
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture()
-def pgva_tcp_mock(mocker):
-    """Return a PGVA instance with its backend replaced by a MagicMock.
+@pytest.fixture(scope="module")
+def _pgva_tcp_module(module_mocker):
+    """Return a PGVA instance with its backend replaced by a FakeBackend, shared by a test module.
 
-    The mock backend is pre-configured with plausible return values for
+    The fake backend is pre-configured with plausible return values for
     every ``get_*`` method so that tests can assert on them without
     worrying about Modbus communication.
     """
-    # Prevent PGVAModbusTCP.__init__ from opening a real socket.
-    mock_backend = MagicMock()
-    mock_backend.version = [2, 0, 45]
-
-    # Sensible default return values for all read methods.
-    mock_backend.get_pressure_chamber.return_value = 500
-    mock_backend.get_vacuum_chamber.return_value = -400
-    mock_backend.get_output_pressure.return_value = 100
-    mock_backend.get_internal_sensor_data.return_value = {
-        "VacuumChamber": -400,
-        "PressureChamber": 500,
-        "OutputPressure": 100,
-    }
-    mock_backend.get_status_word.return_value = {
+    status_word = {
         "Status": "Idle",
         "Pump": "Pump is off",
         "Pressure": "Pressure in the tank is nominal",
@@ -59,7 +120,7 @@ def pgva_tcp_mock(mocker):
         "OutputValveControl": "Exhaust valve management disabled",
         "OutputValve": "Exhaust valve closed",
     }
-    mock_backend.get_warning_word.return_value = {
+    warning_word = {
         "SupplyVoltage": "Reset",
         "VacuumThreshold": "Reset",
         "PressureThreshold": "Reset",
@@ -68,7 +129,7 @@ def pgva_tcp_mock(mocker):
         "Pump": "Reset",
         "ExternalSensor": "Reset",
     }
-    mock_backend.get_error_word.return_value = {
+    error_word = {
         "PumpTimeout": "Reset",
         "TimeoutPressure": "Reset",
         "ModbusError": "Reset",
@@ -76,21 +137,51 @@ def pgva_tcp_mock(mocker):
         "HighVoltage": "Reset",
         "TimeoutExternalSensor": "Reset",
     }
-    mock_backend.get_modbus_error_word.return_value = {
+    modbus_error_word = {
         "OutputActuationTime": "Reset",
     }
+    # Sensible default return values for all read methods.
+    fake_backend = FakeBackend(
+        returns={
+            "get_pressure_chamber": 500,
+            "get_vacuum_chamber": -400,
+            "get_output_pressure": 100,
+            # Same shape as the real backend, which decodes all sensors from one block read.
+            "get_internal_sensor_data": {
+                "Extsensor": 0,
+                "VacuumChamber": -400,
+                "PressureChamber": 500,
+                "OutputPressure": 100,
+            },
+            "get_status_word": status_word,
+            "get_warning_word": warning_word,
+            "get_error_word": error_word,
+            "get_modbus_error_word": modbus_error_word,
+            "get_all_words": {
+                "Status": status_word,
+                "Warning": warning_word,
+                "Error": error_word,
+                "ModbusError": modbus_error_word,
+            },
+        }
+    )
 
     # Patch PGVAModbusTCP so the constructor never touches the network.
-    mocker.patch(
+    module_mocker.patch(
         "pgva.pgva.PGVAModbusTCP",
-        return_value=mock_backend,
+        return_value=fake_backend,
     )
 
     config = PGVATCPConfig(interface="tcp/ip", ip="192.168.0.1", port=502, unit_id=1)
-    instance = PGVA(config=config)
-    # Expose the mock so individual tests can inspect calls or change return values.
-    instance._mock_backend = mock_backend
-    return instance
+    # The fake is the instance's ``_backend``, so tests inspect calls and return values through it.
+    return PGVA(config=config)
+
+
+@pytest.fixture()
+def pgva_tcp_mock(_pgva_tcp_module):
+    """Return the module's mocked PGVA instance with a freshly reset backend."""
+    _pgva_tcp_module._backend.reset_mock()
+    return _pgva_tcp_module
 
 
 # ---------------------------------------------------------------------------
@@ -98,9 +189,20 @@ def pgva_tcp_mock(mocker):
 # ---------------------------------------------------------------------------
 
 
+@dataclass(frozen=True, kw_only=True, slots=True)
+class HardwareSnapshot:
+    """Words and sensor data read from a live device in one pass."""
+
+    status_word: dict
+    warning_word: dict
+    error_word: dict
+    modbus_error_word: dict
+    sensor_data: dict
+
+
 @pytest.fixture(scope="module")
 def pgva_hw():
-    """Return a PGVA instance connected to a live device.
+    """Yield a PGVA instance connected to a live device and close it afterwards.
 
     The test module is skipped entirely when ``PGVA_IP`` is not set in
     the environment.  Run hardware tests with::
@@ -112,4 +214,19 @@ def pgva_hw():
         pytest.skip("PGVA_IP environment variable not set — skipping hardware tests")
 
     config = PGVATCPConfig(interface="tcp/ip", ip=ip, port=502, unit_id=1)
-    return PGVA(config=config)
+    pgva = PGVA(config=config)
+    yield pgva
+    pgva.close()
+
+
+@pytest.fixture(scope="module")
+def hw_snapshot(pgva_hw):
+    """Return the words and sensor data of the live device, read once per test module."""
+    words = pgva_hw.get_all_words()
+    return HardwareSnapshot(
+        status_word=words["Status"],
+        warning_word=words["Warning"],
+        error_word=words["Error"],
+        modbus_error_word=words["ModbusError"],
+        sensor_data=pgva_hw.get_internal_sensor_data(),
+    )
@@ -36,10 +36,13 @@ def test_config_stored(pgva_hw):
 # Read-only API — structure & type checks
 # ---------------------------------------------------------------------------
 
+# Structure checks inspect the module's hw_snapshot, so they share one read of the device;
+# the remaining tests call the getters to exercise them individually.
+
 
 @pytest.mark.hardware
-def test_get_status_word_returns_dict_with_expected_keys(pgva_hw):
-    result = pgva_hw.get_status_word()
+def test_status_word_has_expected_keys(hw_snapshot):
+    result = hw_snapshot.status_word
     assert isinstance(result, dict)
     expected_keys = {
         "Status",
@@ -56,8 +59,8 @@ def test_get_status_word_returns_dict_with_expected_keys(pgva_hw):
 
 
 @pytest.mark.hardware
-def test_get_warning_word_returns_dict_with_expected_keys(pgva_hw):
-    result = pgva_hw.get_warning_word()
+def test_warning_word_has_expected_keys(hw_snapshot):
+    result = hw_snapshot.warning_word
     assert isinstance(result, dict)
     expected_keys = {
         "SupplyVoltage",
@@ -72,8 +75,8 @@ def test_get_warning_word_returns_dict_with_expected_keys(pgva_hw):
 
 
 @pytest.mark.hardware
-def test_get_error_word_returns_dict_with_expected_keys(pgva_hw):
-    result = pgva_hw.get_error_word()
+def test_error_word_has_expected_keys(hw_snapshot):
+    result = hw_snapshot.error_word
     assert isinstance(result, dict)
     expected_keys = {
         "PumpTimeout",
@@ -87,15 +90,23 @@ def test_get_error_word_returns_dict_with_expected_keys(pgva_hw):
 
 
 @pytest.mark.hardware
-def test_get_modbus_error_word_returns_dict(pgva_hw):
-    result = pgva_hw.get_modbus_error_word()
+def test_modbus_error_word_has_expected_keys(hw_snapshot):
+    result = hw_snapshot.modbus_error_word
     assert isinstance(result, dict)
     assert "OutputActuationTime" in result
 
 
 @pytest.mark.hardware
-def test_get_internal_sensor_data_returns_dict_with_expected_keys(pgva_hw):
-    result = pgva_hw.get_internal_sensor_data()
+def test_get_all_words_matches_individual_words(pgva_hw):
+    result = pgva_hw.get_all_words()
+    assert set(result) == {"Status", "Warning", "Error", "ModbusError"}
+    assert set(result["Warning"]) == set(pgva_hw.get_warning_word())
+    assert set(result["Error"]) == set(pgva_hw.get_error_word())
+
+
+@pytest.mark.hardware
+def test_sensor_data_has_expected_keys(hw_snapshot):
+    result = hw_snapshot.sensor_data
     assert isinstance(result, dict)
     assert "VacuumChamber" in result
     assert "PressureChamber" in result
@@ -7,193 +7,145 @@ Every public method on ``PGVA`` is a thin wrapper that forwards to
 * the correct arguments are forwarded, and
 * the return value from the backend is passed back to the caller.
 
-All tests use the ``pgva_tcp_mock`` fixture (no hardware required).
+The plain delegations are parametrized over the ``SETTERS`` and
+``GETTERS`` tables, so adding a wrapper only needs a new table row.
+
+All tests use the ``pgva_tcp_mock`` fixture (no hardware required), whose
+default return values are restored as fresh copies before every test.
 """
 
+import pytest
 
 # ---------------------------------------------------------------------------
 # Setters — verify correct delegation and argument forwarding
 # ---------------------------------------------------------------------------
 
-
-class TestSetOutputPressure:
-    def test_delegates_to_backend(self, pgva_tcp_mock):
-        pgva_tcp_mock.set_output_pressure(200)
-        pgva_tcp_mock._mock_backend.set_output_pressure.assert_called_once_with(200)
-
-    def test_negative_pressure_forwarded(self, pgva_tcp_mock):
-        pgva_tcp_mock.set_output_pressure(-150)
-        pgva_tcp_mock._mock_backend.set_output_pressure.assert_called_once_with(-150)
-
-    def test_returns_none(self, pgva_tcp_mock):
-        result = pgva_tcp_mock.set_output_pressure(0)
-        assert result is None
-
-
-class TestTriggerActuationValve:
-    def test_delegates_to_set_actuation_time(self, pgva_tcp_mock):
-        pgva_tcp_mock.trigger_actuation_valve(500)
-        pgva_tcp_mock._mock_backend.set_actuation_time.assert_called_once_with(actuation_time=500)
-
-    def test_returns_none(self, pgva_tcp_mock):
-        result = pgva_tcp_mock.trigger_actuation_valve(100)
-        assert result is None
-
-
-class TestSetPressureChamber:
-    def test_delegates_to_backend(self, pgva_tcp_mock):
-        pgva_tcp_mock.set_pressure_chamber(300)
-        pgva_tcp_mock._mock_backend.set_pressure_chamber.assert_called_once_with(300)
-
-    def test_returns_none(self, pgva_tcp_mock):
-        result = pgva_tcp_mock.set_pressure_chamber(300)
-        assert result is None
-
-
-class TestSetVacuumChamber:
-    def test_delegates_to_backend(self, pgva_tcp_mock):
-        pgva_tcp_mock.set_vacuum_chamber(-300)
-        pgva_tcp_mock._mock_backend.set_vacuum_chamber.assert_called_once_with(-300)
-
-    def test_returns_none(self, pgva_tcp_mock):
-        result = pgva_tcp_mock.set_vacuum_chamber(-300)
-        assert result is None
+# (PGVA method, args, kwargs, backend method, expected backend args, expected backend kwargs)
+SETTERS = [
+    pytest.param("set_output_pressure", (200,), {}, "set_output_pressure", (200,), {}, id="set_output_pressure"),
+    pytest.param(
+        "set_output_pressure", (-150,), {}, "set_output_pressure", (-150,), {}, id="set_output_pressure-negative"
+    ),
+    pytest.param(
+        "set_output_pressure_ramp",
+        ([100, 200],),
+        {"dwell_ms": 10},
+        "set_output_pressure_ramp",
+        ([100, 200],),
+        {"dwell_ms": 10},
+        id="set_output_pressure_ramp",
+    ),
+    pytest.param(
+        "trigger_actuation_valve",
+        (500,),
+        {},
+        "set_actuation_time",
+        (),
+        {"actuation_time": 500, "wait": True},
+        id="trigger_actuation_valve",
+    ),
+    pytest.param(
+        "trigger_actuation_valve",
+        (500,),
+        {"wait": False},
+        "set_actuation_time",
+        (),
+        {"actuation_time": 500, "wait": False},
+        id="trigger_actuation_valve-no-wait",
+    ),
+    pytest.param(
+        "run_timed_pressure", (100, 500), {}, "run_timed_pressure", (100, 500), {"wait": True}, id="run_timed_pressure"
+    ),
+    pytest.param("set_pressure_chamber", (300,), {}, "set_pressure_chamber", (300,), {}, id="set_pressure_chamber"),
+    pytest.param("set_vacuum_chamber", (-300,), {}, "set_vacuum_chamber", (-300,), {}, id="set_vacuum_chamber"),
+    pytest.param("set_chambers", (300, -300), {}, "set_chambers", (300, -300), {}, id="set_chambers"),
+    pytest.param("toggle_pump", (True,), {}, "toggle_pump", (True,), {}, id="toggle_pump-enable"),
+    pytest.param("toggle_pump", (False,), {}, "toggle_pump", (False,), {}, id="toggle_pump-disable"),
+    pytest.param("invalidate_pump_cache", (), {}, "invalidate_pump_cache", (), {}, id="invalidate_pump_cache"),
+    # toggle_trigger delegates to the backend's toggle_manual_trigger (note name difference).
+    pytest.param("toggle_trigger", (True,), {}, "toggle_manual_trigger", (True,), {}, id="toggle_trigger-enable"),
+    pytest.param("toggle_trigger", (False,), {}, "toggle_manual_trigger", (False,), {}, id="toggle_trigger-disable"),
+    pytest.param("print_driver_information", (), {}, "print_driver_information", (), {}, id="print_driver_information"),
+    pytest.param("close", (), {}, "close", (), {}, id="close"),
+]
+
+
+class TestSetters:
+    @pytest.mark.parametrize("method, args, kwargs, backend_method, backend_args, backend_kwargs", SETTERS)
+    def test_delegates_to_backend(
+        self, pgva_tcp_mock, method, args, kwargs, backend_method, backend_args, backend_kwargs
+    ):
+        getattr(pgva_tcp_mock, method)(*args, **kwargs)
+        getattr(pgva_tcp_mock._backend, backend_method).assert_called_once_with(*backend_args, **backend_kwargs)
+
+    @pytest.mark.parametrize("method, args, kwargs, backend_method, backend_args, backend_kwargs", SETTERS)
+    def test_returns_none(self, pgva_tcp_mock, method, args, kwargs, backend_method, backend_args, backend_kwargs):
+        assert getattr(pgva_tcp_mock, method)(*args, **kwargs) is None
+
+
+class TestSetAndReadOutputPressure:
+    def test_returns_backend_reading(self, pgva_tcp_mock):
+        pgva_tcp_mock._backend.set_and_read_output_pressure.return_value = 100
+        assert pgva_tcp_mock.set_and_read_output_pressure(100) == 100
+        pgva_tcp_mock._backend.set_and_read_output_pressure.assert_called_once_with(100)
 
 
 # ---------------------------------------------------------------------------
 # Getters — verify delegation and return value pass-through
 # ---------------------------------------------------------------------------
 
+# (PGVA method, expected backend kwargs)
+GETTERS = [
+    pytest.param("get_pressure_chamber", {}, id="get_pressure_chamber"),
+    pytest.param("get_vacuum_chamber", {}, id="get_vacuum_chamber"),
+    pytest.param("get_output_pressure", {}, id="get_output_pressure"),
+    pytest.param("get_internal_sensor_data", {}, id="get_internal_sensor_data"),
+    pytest.param("get_status_word", {"copy": True}, id="get_status_word"),
+    pytest.param("get_warning_word", {"copy": True}, id="get_warning_word"),
+    pytest.param("get_error_word", {"copy": True}, id="get_error_word"),
+    pytest.param("get_modbus_error_word", {"copy": True}, id="get_modbus_error_word"),
+    pytest.param("get_all_words", {"copy": True}, id="get_all_words"),
+]
 
-class TestGetPressureChamber:
-    def test_delegates_to_backend(self, pgva_tcp_mock):
-        pgva_tcp_mock.get_pressure_chamber()
-        pgva_tcp_mock._mock_backend.get_pressure_chamber.assert_called_once_with()
-
-    def test_returns_backend_value(self, pgva_tcp_mock):
-        result = pgva_tcp_mock.get_pressure_chamber()
-        assert result == pgva_tcp_mock._mock_backend.get_pressure_chamber.return_value
-
+WORD_GETTERS = ["get_status_word", "get_warning_word", "get_error_word", "get_modbus_error_word", "get_all_words"]
 
-class TestGetVacuumChamber:
-    def test_delegates_to_backend(self, pgva_tcp_mock):
-        pgva_tcp_mock.get_vacuum_chamber()
-        pgva_tcp_mock._mock_backend.get_vacuum_chamber.assert_called_once_with()
 
-    def test_returns_backend_value(self, pgva_tcp_mock):
-        result = pgva_tcp_mock.get_vacuum_chamber()
-        assert result == pgva_tcp_mock._mock_backend.get_vacuum_chamber.return_value
+class TestGetters:
+    @pytest.mark.parametrize("method, backend_kwargs", GETTERS)
+    def test_delegates_to_backend(self, pgva_tcp_mock, method, backend_kwargs):
+        getattr(pgva_tcp_mock, method)()
+        getattr(pgva_tcp_mock._backend, method).assert_called_once_with(**backend_kwargs)
 
+    @pytest.mark.parametrize("method, backend_kwargs", GETTERS)
+    def test_returns_backend_value(self, pgva_tcp_mock, method, backend_kwargs):
+        result = getattr(pgva_tcp_mock, method)()
+        assert result == getattr(pgva_tcp_mock._backend, method).return_value
 
-class TestGetOutputPressure:
-    def test_delegates_to_backend(self, pgva_tcp_mock):
-        pgva_tcp_mock.get_output_pressure()
-        pgva_tcp_mock._mock_backend.get_output_pressure.assert_called_once_with()
-
-    def test_returns_backend_value(self, pgva_tcp_mock):
-        result = pgva_tcp_mock.get_output_pressure()
-        assert result == pgva_tcp_mock._mock_backend.get_output_pressure.return_value
+    @pytest.mark.parametrize("method", WORD_GETTERS)
+    def test_forwards_copy_flag(self, pgva_tcp_mock, method):
+        getattr(pgva_tcp_mock, method)(copy=False)
+        getattr(pgva_tcp_mock._backend, method).assert_called_once_with(copy=False)
 
 
 class TestGetInternalSensorData:
-    def test_delegates_to_backend(self, pgva_tcp_mock):
-        pgva_tcp_mock.get_internal_sensor_data()
-        pgva_tcp_mock._mock_backend.get_internal_sensor_data.assert_called_once_with()
-
-    def test_returns_backend_value(self, pgva_tcp_mock):
-        result = pgva_tcp_mock.get_internal_sensor_data()
-        assert result == pgva_tcp_mock._mock_backend.get_internal_sensor_data.return_value
-
     def test_return_type_is_dict(self, pgva_tcp_mock):
         result = pgva_tcp_mock.get_internal_sensor_data()
         assert isinstance(result, dict)
 
 
-class TestGetStatusWord:
-    def test_delegates_to_backend(self, pgva_tcp_mock):
-        pgva_tcp_mock.get_status_word()
-        pgva_tcp_mock._mock_backend.get_status_word.assert_called_once_with()
-
-    def test_returns_backend_value(self, pgva_tcp_mock):
-        result = pgva_tcp_mock.get_status_word()
-        assert result == pgva_tcp_mock._mock_backend.get_status_word.return_value
-
-
-class TestGetWarningWord:
-    def test_delegates_to_backend(self, pgva_tcp_mock):
-        pgva_tcp_mock.get_warning_word()
-        pgva_tcp_mock._mock_backend.get_warning_word.assert_called_once_with()
-
-    def test_returns_backend_value(self, pgva_tcp_mock):
-        result = pgva_tcp_mock.get_warning_word()
-        assert result == pgva_tcp_mock._mock_backend.get_warning_word.return_value
-
-
-class TestGetErrorWord:
-    def test_delegates_to_backend(self, pgva_tcp_mock):
-        pgva_tcp_mock.get_error_word()
-        pgva_tcp_mock._mock_backend.get_error_word.assert_called_once_with()
-
-    def test_returns_backend_value(self, pgva_tcp_mock):
-        result = pgva_tcp_mock.get_error_word()
-        assert result == pgva_tcp_mock._mock_backend.get_error_word.return_value
-
-
-class TestGetModbusErrorWord:
-    def test_delegates_to_backend(self, pgva_tcp_mock):
-        pgva_tcp_mock.get_modbus_error_word()
-        pgva_tcp_mock._mock_backend.get_modbus_error_word.assert_called_once_with()
-
-    def test_returns_backend_value(self, pgva_tcp_mock):
-        result = pgva_tcp_mock.get_modbus_error_word()
-        assert result == pgva_tcp_mock._mock_backend.get_modbus_error_word.return_value
-
-
-# ---------------------------------------------------------------------------
-# Toggle methods
-# ---------------------------------------------------------------------------
-
-
-class TestTogglePump:
-    def test_enable_delegates_to_backend(self, pgva_tcp_mock):
-        pgva_tcp_mock.toggle_pump(True)
-        pgva_tcp_mock._mock_backend.toggle_pump.assert_called_once_with(True)
-
-    def test_disable_delegates_to_backend(self, pgva_tcp_mock):
-        pgva_tcp_mock.toggle_pump(False)
-        pgva_tcp_mock._mock_backend.toggle_pump.assert_called_once_with(False)
-
-    def test_returns_none(self, pgva_tcp_mock):
-        result = pgva_tcp_mock.toggle_pump(True)
-        assert result is None
-
-
-class TestToggleTrigger:
-    """toggle_trigger delegates to the backend's toggle_manual_trigger (note name difference)."""
-
-    def test_enable_delegates_to_toggle_manual_trigger(self, pgva_tcp_mock):
-        pgva_tcp_mock.toggle_trigger(True)
-        pgva_tcp_mock._mock_backend.toggle_manual_trigger.assert_called_once_with(True)
-
-    def test_disable_delegates_to_toggle_manual_trigger(self, pgva_tcp_mock):
-        pgva_tcp_mock.toggle_trigger(False)
-        pgva_tcp_mock._mock_backend.toggle_manual_trigger.assert_called_once_with(False)
-
-    def test_returns_none(self, pgva_tcp_mock):
-        result = pgva_tcp_mock.toggle_trigger(True)
-        assert result is None
-
-
-# ---------------------------------------------------------------------------
-# Informational methods
-# ---------------------------------------------------------------------------
-
+class TestGetAllWords:
+    def test_matches_individual_words(self, pgva_tcp_mock):
+        backend = pgva_tcp_mock._backend
+        assert pgva_tcp_mock.get_all_words() == {
+            "Status": backend.get_status_word.return_value,
+            "Warning": backend.get_warning_word.return_value,
+            "Error": backend.get_error_word.return_value,
+            "ModbusError": backend.get_modbus_error_word.return_value,
+        }
 
-class TestPrintDriverInformation:
-    def test_delegates_to_backend(self, pgva_tcp_mock):
-        pgva_tcp_mock.print_driver_information()
-        pgva_tcp_mock._mock_backend.print_driver_information.assert_called_once_with()
 
-    def test_returns_none(self, pgva_tcp_mock):
-        result = pgva_tcp_mock.print_driver_information()
-        assert result is None
+class TestFakeBackendReset:
+    def test_mutated_return_value_does_not_leak(self, pgva_tcp_mock):
+        pgva_tcp_mock.get_status_word()["Status"] = "Busy"
+        pgva_tcp_mock._backend.reset_mock()
+        assert pgva_tcp_mock.get_status_word()["Status"] == "Idle"
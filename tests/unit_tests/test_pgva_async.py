@@ -0,0 +1,216 @@
+"""
+Unit tests for the asyncio front end and its ModbusTCP backend.
+
+``AsyncModbusTcpClient`` is replaced by a ``MagicMock`` whose request methods
+are ``AsyncMock`` objects, so no connection is opened.  Coroutines are driven
+with ``asyncio.run`` to avoid a dependency on an asyncio pytest plugin.
+
+Coverage areas
+--------------
+* ``AsyncPGVA`` — config validation, context manager connect / close
+* ``set_output_pressure`` — pump validation, cached pump state shared per device, failed toggles not
+  cached and range enforcement
+* ``trigger_actuation_valve`` — write without status polling
+* ``run_timed_pressure`` — validation before any request, no actuation without the pressure write
+* ``set_chambers`` — single multiple-register write
+* ``get_internal_sensor_data`` — single block read, separate external sensor read and decoding
+* request errors — Modbus errors logged and returned as None
+* concurrent use of two devices with ``asyncio.gather``
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, call
+
+import pytest
+
+from pgva import AsyncPGVA, PGVASerialConfig, PGVATCPConfig
+from pgva.registers import _PGVARegisters as commands
+
+
+def _make_registers_response(*values: int) -> MagicMock:
+    """Return a MagicMock whose .registers equals *values*."""
+    resp = MagicMock()
+    resp.registers = list(values)
+    return resp
+
+
+def _make_async_client() -> MagicMock:
+    """Return a mock async client that reports firmware 2.0.45, an idle device and an enabled pump."""
+    client = MagicMock()
+    client.connect = AsyncMock(return_value=True)
+    client.read_input_registers = AsyncMock(return_value=_make_registers_response(2, 0, 45))
+    client.read_holding_registers = AsyncMock(return_value=_make_registers_response(1))
+    client.write_register = AsyncMock()
+    client.write_registers = AsyncMock()
+    return client
+
+
+@pytest.fixture()
+def async_pgva(mocker):
+    """Connected ``AsyncPGVA`` whose client is a mock, reachable as ``instance._backend.client``."""
+    mock_client = _make_async_client()
+    mocker.patch("pgva.pgva_communication.AsyncModbusTcpClient", return_value=mock_client)
+    instance = AsyncPGVA(config=PGVATCPConfig(interface="tcp/ip", ip="192.168.0.1"))
+    asyncio.run(instance.connect())
+    mock_client.read_input_registers.return_value = _make_registers_response(0)
+    yield instance
+    # Drop the pump state shared under the device key so the next test reads it again.
+    instance.close()
+
+
+class TestAsyncPGVAConstructor:
+    def test_raises_type_error_for_serial_config(self):
+        config = PGVASerialConfig(interface="serial", com_port="COM1", baudrate=115200)
+        with pytest.raises(TypeError):
+            AsyncPGVA(config=config)
+
+    def test_connect_reads_firmware_version(self, async_pgva):
+        assert async_pgva._backend.version == (2, 0, 45)
+
+    def test_context_manager_connects_and_closes(self, mocker):
+        mock_client = _make_async_client()
+        mocker.patch("pgva.pgva_communication.AsyncModbusTcpClient", return_value=mock_client)
+
+        async def run():
+            async with AsyncPGVA(config=PGVATCPConfig(interface="tcp/ip", ip="192.168.0.1")):
+                mock_client.connect.assert_awaited_once()
+
+        asyncio.run(run())
+        mock_client.close.assert_called_once_with()
+
+
+class TestAsyncSetOutputPressure:
+    def test_writes_pressure(self, async_pgva):
+        asyncio.run(async_pgva.set_output_pressure(-200))
+        async_pgva._backend.client.write_register.assert_awaited_once_with(
+            address=commands.OUTPUT_PRESSURE_MBAR.value,
+            value=-200 + 2**16,
+        )
+
+    def test_out_of_range_raises_value_error(self, async_pgva):
+        with pytest.raises(ValueError):
+            asyncio.run(async_pgva.set_output_pressure(451))
+        async_pgva._backend.client.write_register.assert_not_awaited()
+
+    def test_disabled_pump_skips_write(self, async_pgva):
+        async_pgva._backend.client.read_holding_registers.return_value = _make_registers_response(0)
+        asyncio.run(async_pgva.set_output_pressure(100))
+        async_pgva._backend.client.write_register.assert_not_awaited()
+
+    def test_pump_state_read_once(self, async_pgva):
+        asyncio.run(async_pgva.set_output_pressure(100))
+        asyncio.run(async_pgva.set_output_pressure(200))
+        async_pgva._backend.client.read_holding_registers.assert_awaited_once()
+
+    def test_invalidate_pump_cache_rereads_state(self, async_pgva):
+        asyncio.run(async_pgva.set_output_pressure(100))
+        async_pgva._backend.client.read_holding_registers.return_value = _make_registers_response(0)
+        async_pgva.invalidate_pump_cache()
+        asyncio.run(async_pgva.set_output_pressure(200))
+        async_pgva._backend.client.write_register.assert_awaited_once()
+
+    def test_failed_toggle_rereads_state(self, async_pgva):
+        from pymodbus.exceptions import ModbusException
+
+        asyncio.run(async_pgva.set_output_pressure(100))
+        async_pgva._backend.client.write_register.side_effect = ModbusException("no response")
+        asyncio.run(async_pgva.toggle_pump(False))
+        async_pgva._backend.client.write_register.side_effect = None
+        asyncio.run(async_pgva.set_output_pressure(200))
+        assert async_pgva._backend.client.read_holding_registers.await_count == 2
+
+    def test_pump_state_shared_between_instances(self, async_pgva, mocker):
+        mocker.patch("pgva.pgva_communication.AsyncModbusTcpClient", return_value=_make_async_client())
+        other = AsyncPGVA(config=PGVATCPConfig(interface="tcp/ip", ip="192.168.0.1"))
+        asyncio.run(other.connect())
+        try:
+            asyncio.run(async_pgva.set_output_pressure(100))
+            asyncio.run(other.toggle_pump(False))
+            async_pgva._backend.client.write_register.reset_mock()
+            asyncio.run(async_pgva.set_output_pressure(200))
+            async_pgva._backend.client.write_register.assert_not_awaited()
+        finally:
+            other.close()
+
+    def test_no_wait_writes_without_polling(self, async_pgva):
+        async_pgva._backend.client.read_input_registers.reset_mock()
+        asyncio.run(async_pgva.trigger_actuation_valve(100, wait=False))
+        async_pgva._backend.client.write_register.assert_awaited_once_with(
+            address=commands.VALVE_ACTUATION_TIME.value, value=100
+        )
+        async_pgva._backend.client.read_input_registers.assert_not_awaited()
+
+
+class TestAsyncRunTimedPressure:
+    def test_sets_pressure_then_triggers_valve(self, async_pgva):
+        asyncio.run(async_pgva.run_timed_pressure(100, 250, wait=False))
+        addresses = [c.kwargs["address"] for c in async_pgva._backend.client.write_register.await_args_list]
+        assert addresses == [commands.OUTPUT_PRESSURE_MBAR.value, commands.VALVE_ACTUATION_TIME.value]
+
+    def test_invalid_pressure_raises_before_pump_check(self, async_pgva):
+        with pytest.raises(ValueError):
+            asyncio.run(async_pgva.run_timed_pressure(451, 250, wait=False))
+        async_pgva._backend.client.read_holding_registers.assert_not_awaited()
+
+    def test_disabled_pump_skips_valve(self, async_pgva):
+        async_pgva._backend.client.read_holding_registers.return_value = _make_registers_response(0)
+        asyncio.run(async_pgva.run_timed_pressure(100, 250, wait=False))
+        async_pgva._backend.client.write_register.assert_not_awaited()
+
+    def test_failed_pressure_write_skips_valve(self, async_pgva):
+        from pymodbus.exceptions import ModbusException
+
+        async_pgva._backend.client.write_register.side_effect = ModbusException("no response")
+        asyncio.run(async_pgva.run_timed_pressure(100, 250, wait=False))
+        async_pgva._backend.client.write_register.assert_awaited_once()
+
+
+class TestAsyncRequestErrors:
+    def test_read_error_returns_none(self, async_pgva):
+        from pymodbus.exceptions import ModbusException
+
+        async_pgva._backend.client.read_input_registers.side_effect = ModbusException("no response")
+        assert asyncio.run(async_pgva.get_output_pressure()) is None
+
+
+class TestAsyncSetChambers:
+    def test_writes_both_thresholds_in_one_request(self, async_pgva):
+        asyncio.run(async_pgva.set_chambers(500, -500))
+        async_pgva._backend.client.write_registers.assert_awaited_once()
+        assert async_pgva._backend.client.write_registers.call_args.kwargs["address"] == commands.VACUUM_THRESHOLD.value
+
+
+class TestAsyncSensorData:
+    def test_block_and_external_sensor_reads(self, async_pgva):
+        async_pgva._backend.client.read_input_registers.reset_mock()
+        async_pgva._backend.client.read_input_registers.side_effect = [
+            _make_registers_response(7),
+            _make_registers_response(65136, 500, 100),
+        ]
+        result = asyncio.run(async_pgva.get_internal_sensor_data())
+        assert async_pgva._backend.client.read_input_registers.await_args_list == [
+            call(address=commands.EXTERNAL_SENSOR_VALUE.value, count=1),
+            call(address=commands.VACUUM_ACTUAL_MBAR.value, count=3),
+        ]
+        assert result == {"Extsensor": 7, "VacuumChamber": -400, "PressureChamber": 500, "OutputPressure": 100}
+
+
+class TestConcurrentDevices:
+    def test_gather_drives_both_devices(self, mocker):
+        clients = [_make_async_client(), _make_async_client()]
+        mocker.patch("pgva.pgva_communication.AsyncModbusTcpClient", side_effect=clients)
+
+        async def run():
+            async with (
+                AsyncPGVA(config=PGVATCPConfig(interface="tcp/ip", ip="192.168.0.1")) as pgva_1,
+                AsyncPGVA(config=PGVATCPConfig(interface="tcp/ip", ip="192.168.0.2")) as pgva_2,
+            ):
+                for client in clients:
+                    client.read_input_registers.return_value = _make_registers_response(0)
+                await asyncio.gather(pgva_1.set_output_pressure(100), pgva_2.set_output_pressure(-100))
+
+        asyncio.run(run())
+        clients[0].write_register.assert_awaited_once_with(address=commands.OUTPUT_PRESSURE_MBAR.value, value=100)
+        clients[1].write_register.assert_awaited_once_with(
+            address=commands.OUTPUT_PRESSURE_MBAR.value, value=-100 + 2**16
+        )
@@ -0,0 +1,204 @@
+"""
+Unit tests for the batch front end driving several PGVAs at once.
+
+``AsyncModbusTcpClient`` is replaced by one ``MagicMock`` per device whose
+request methods are ``AsyncMock`` objects, so no connection is opened.  The
+local server tests use the real client against a pymodbus server on
+127.0.0.1 instead, running on its own event loop in a background thread.
+
+Coverage areas
+--------------
+* ``PGVABatchClient`` — config validation, context manager connect / close
+* ``set_output_pressure`` — one write per addressed device, a failing device not abandoning the others
+* ``get_output_pressure`` — results keyed by device id
+* unknown device ids rejected before any request is made, calls before ``connect`` or after ``close``
+  rejected, devices dropped on ``close``
+* real ``AsyncModbusTcpClient`` — construction outside an event loop, connect and read against a
+  local pymodbus server
+"""
+
+import asyncio
+import socket
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pymodbus.datastore import ModbusDeviceContext, ModbusSequentialDataBlock, ModbusServerContext
+from pymodbus.server import ModbusTcpServer
+
+from pgva import PGVABatchClient, PGVASerialConfig, PGVATCPConfig
+from pgva.registers import _PGVARegisters as commands
+
+
+def _make_registers_response(*values: int) -> MagicMock:
+    """Return a MagicMock whose .registers equals *values*."""
+    resp = MagicMock()
+    resp.registers = list(values)
+    return resp
+
+
+def _make_async_client() -> MagicMock:
+    """Return a mock async client that reports firmware 2.0.45, an idle device and an enabled pump."""
+    client = MagicMock()
+    client.connect = AsyncMock(return_value=True)
+    client.read_input_registers = AsyncMock(return_value=_make_registers_response(2, 0, 45))
+    client.read_holding_registers = AsyncMock(return_value=_make_registers_response(1))
+    client.write_register = AsyncMock()
+    client.write_registers = AsyncMock()
+    return client
+
+
+@pytest.fixture()
+def clients(mocker):
+    """Two mock clients, handed out in order to the devices of the batch."""
+    mock_clients = [_make_async_client(), _make_async_client()]
+    mocker.patch("pgva.pgva_communication.AsyncModbusTcpClient", side_effect=mock_clients)
+    return mock_clients
+
+
+@pytest.fixture()
+def modbus_server_port():
+    """Port of a local pymodbus server reporting firmware 2.0.45 and an output pressure of -100 mBar."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    # The device context maps protocol address n to index n + 1 of the data blocks
+    input_registers = ModbusSequentialDataBlock(0, [0] * 300)
+    input_registers.setValues(commands.FIRMWARE_VERSION.value + 1, [2, 0, 45])
+    input_registers.setValues(commands.OUTPUT_PRESSURE_ACTUAL_MBAR.value + 1, [-100 + 2**16])
+    holding_registers = ModbusSequentialDataBlock(0, [0] * 4200)
+    context = ModbusServerContext(devices=ModbusDeviceContext(ir=input_registers, hr=holding_registers), single=True)
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+    servers = []
+
+    async def serve():
+        # Like the client, the server needs a running event loop when it is constructed
+        server = ModbusTcpServer(context, address=("127.0.0.1", port))
+        servers.append(server)
+        await server.serve_forever(background=True)
+        started.set()
+        await server.serving
+
+    thread = threading.Thread(target=loop.run_until_complete, args=(serve(),), daemon=True)
+    thread.start()
+    assert started.wait(5), "local Modbus server did not start"
+    yield port
+    asyncio.run_coroutine_threadsafe(servers[0].shutdown(), loop).result(5)
+    thread.join(5)
+    loop.close()
+
+
+@pytest.fixture()
+def batch(clients):
+    """Connected ``PGVABatchClient`` for devices ``"left"`` and ``"right"``."""
+    instance = PGVABatchClient(
+        {
+            "left": PGVATCPConfig(interface="tcp/ip", ip="192.168.0.1"),
+            "right": PGVATCPConfig(interface="tcp/ip", ip="192.168.0.2"),
+        }
+    )
+    instance.connect()
+    for client in clients:
+        client.read_input_registers.return_value = _make_registers_response(0)
+    yield instance
+    instance.close()
+
+
+class TestBatchConstructor:
+    def test_raises_type_error_for_serial_config(self):
+        with pytest.raises(TypeError):
+            PGVABatchClient({"a": PGVASerialConfig(interface="serial", com_port="COM1", baudrate=115200)})
+
+    def test_context_manager_connects_and_closes(self, clients):
+        with PGVABatchClient(
+            {
+                "left": PGVATCPConfig(interface="tcp/ip", ip="192.168.0.1"),
+                "right": PGVATCPConfig(interface="tcp/ip", ip="192.168.0.2"),
+            }
+        ):
+            for client in clients:
+                client.connect.assert_awaited_once()
+        for client in clients:
+            client.close.assert_called_once_with()
+
+
+class TestBatchSetOutputPressure:
+    def test_writes_each_device(self, batch, clients):
+        batch.set_output_pressure({"left": 100, "right": -100})
+        clients[0].write_register.assert_awaited_once_with(address=commands.OUTPUT_PRESSURE_MBAR.value, value=100)
+        clients[1].write_register.assert_awaited_once_with(
+            address=commands.OUTPUT_PRESSURE_MBAR.value, value=-100 + 2**16
+        )
+
+    def test_only_addressed_devices_are_written(self, batch, clients):
+        batch.set_output_pressure({"right": 200})
+        clients[0].write_register.assert_not_awaited()
+        clients[1].write_register.assert_awaited_once()
+
+    def test_failing_device_does_not_abandon_others(self, batch, clients):
+        async def slow_pump_read(**kwargs):
+            # Suspends the right device, so its write is still pending when the left one fails
+            await asyncio.sleep(0.01)
+            return _make_registers_response(1)
+
+        clients[1].read_holding_registers.side_effect = slow_pump_read
+        with pytest.raises(ValueError):
+            batch.set_output_pressure({"left": 1000, "right": 100})
+        clients[0].write_register.assert_not_awaited()
+        clients[1].write_register.assert_awaited_once_with(address=commands.OUTPUT_PRESSURE_MBAR.value, value=100)
+
+    def test_unknown_device_raises_before_writing(self, batch, clients):
+        with pytest.raises(KeyError):
+            batch.set_output_pressure({"left": 100, "middle": 100})
+        clients[0].write_register.assert_not_awaited()
+
+
+class TestBatchReads:
+    def test_output_pressure_keyed_by_device(self, batch, clients):
+        clients[0].read_input_registers.return_value = _make_registers_response(0, 0, 100)
+        clients[1].read_input_registers.return_value = _make_registers_response(0, 0, 65436)
+        assert batch.get_output_pressure() == {"left": 100, "right": -100}
+
+
+class TestBatchNotConnected:
+    def test_call_before_connect_raises(self, clients):
+        instance = PGVABatchClient({"left": PGVATCPConfig(interface="tcp/ip", ip="192.168.0.1")})
+        with pytest.raises(RuntimeError):
+            instance.get_output_pressure()
+        instance.close()
+
+
+class TestBatchClosed:
+    def test_close_drops_devices(self, batch, clients):
+        batch.close()
+        assert not batch._devices
+        batch.close()
+        for client in clients:
+            client.close.assert_called_once_with()
+
+    def test_call_after_close_raises(self, batch):
+        batch.close()
+        with pytest.raises(RuntimeError, match="closed"):
+            batch.get_output_pressure()
+
+    def test_connect_after_close_raises(self, batch):
+        batch.close()
+        with pytest.raises(RuntimeError, match="closed"):
+            batch.connect()
+
+
+class TestBatchLocalServer:
+    def test_constructs_real_clients_outside_event_loop(self):
+        instance = PGVABatchClient(
+            {
+                "left": PGVATCPConfig(interface="tcp/ip", ip="127.0.0.1"),
+                "right": PGVATCPConfig(interface="tcp/ip", ip="127.0.0.1"),
+            }
+        )
+        instance.close()
+
+    def test_connect_and_read(self, modbus_server_port):
+        config = PGVATCPConfig(interface="tcp/ip", ip="127.0.0.1", port=modbus_server_port)
+        with PGVABatchClient({"left": config, "right": config}) as batch:
+            assert batch.get_output_pressure() == {"left": -100, "right": -100}
@@ -1,27 +1,52 @@
 """
 Unit tests for PGVAModbusClient backend — validation, conversion, and timeout.
 
-These tests exercise the logic inside ``PGVAModbusClient`` (the ABC) via the
+These tests exercise the logic inside ``PGVAModbusClient`` (the base class) via the
 concrete ``PGVAModbusTCP`` subclass so that no actual Modbus/TCP connection is
 opened.  All I/O is replaced by ``MagicMock`` objects.
 
 Coverage areas
 --------------
-* ``_convert_twos_comp`` — parametrised positive / negative / boundary cases
+* ``_twos_complement`` — parametrised positive / negative / boundary cases
+* sensor getters — single block read, external sensor read on its own over mapped registers only,
+  short-lived cache, invalidation on write
+* cached reads — firmware version read once, status words reused within the TTL, blocks keyed by
+  function code, start and count
+* status / warning / error words — field decoding, raw-word check for reset words, failed reads,
+  status and warning / error blocks read over mapped registers only, ``get_all_words``, individual
+  reads on firmware 2.1.3, shared decoded words with ``copy=False``
 * ``set_output_pressure`` — boundary enforcement (valid, below min, above max)
 * ``set_pressure_chamber`` — boundary enforcement
 * ``set_vacuum_chamber`` — boundary enforcement
-* ``set_actuation_time`` — range enforcement
+* ``set_chambers`` — single multiple-register write, validation before writing
+* ``set_and_read_output_pressure`` — reading taken from the final idle poll
+* ``set_output_pressure_ramp`` — validation before writing, single pump check
+* ``set_actuation_time`` — range enforcement, sleep instead of status polling
+* ``run_timed_pressure`` — write order, validation before writing, no actuation without the pressure
+  write
 * ``toggle_manual_trigger`` — always raises NotImplementedError
-* ``_validate_pump_enable`` — pump enabled / disabled / firmware 2.1.3 bypass
-* ``_set_data`` — TimeoutError raised when device remains busy
+* firmware feature flags — recomputed whenever ``version`` is set
+* ``_validate_pump_enable`` — pump enabled / disabled / firmware 2.1.3 bypass, cached state, failed
+  toggles not cached
+* ``print_driver_information`` — sensor read gated on the INFO level
+* ``_set_data`` — two's complement encoding of negative values
+* request errors — Modbus errors logged and returned as None, registers logged by name
+* ``_set_data`` — TimeoutError naming the register raised when device remains busy
+* busy polling — exponential backoff, serial minimum delay, pump writes not polled,
+  prepared status read rebound with the client
+* shared connections — reuse per device for TCP and serial, reference-counted close, reference
+  released when construction fails, read cache
+  cleared by writes through any backend, pump state shared per connection, firmware version read
+  once per connection, socket options
 """
 
-from unittest.mock import MagicMock
+import logging
+import socket
+from unittest.mock import MagicMock, call
 
 import pytest
 
-from pgva.pgva_communication import PGVAModbusTCP
+from pgva.pgva_communication import PGVAModbusTCP, _twos_complement
 from pgva.pgva_config import PGVATCPConfig
 
 
@@ -42,11 +67,11 @@ def tcp_backend(mocker):
     """``PGVAModbusTCP`` with its ``ModbusTcpClient`` replaced by a ``MagicMock``.
 
     After construction the ``instance.version`` attribute is forced to
-    ``[2, 0, 45]`` so individual tests start from a known, deterministic state.
+    ``(2, 0, 45)`` so individual tests start from a known, deterministic state.
     The underlying mock client is accessible as ``instance._mock_client``.
     """
     mock_client = MagicMock()
-    # read_input_registers is called 3 times by get_firmware_version during __init__.
+    # read_input_registers is called once by get_firmware_version during __init__.
     mock_client.read_input_registers.return_value = _make_register_response(0)
     mocker.patch(
         "pgva.pgva_communication.ModbusTcpClient",
@@ -57,39 +82,401 @@ def tcp_backend(mocker):
     backend = PGVAModbusTCP(config=config)
 
     # Override whatever version the mock returned during construction.
-    backend.version = [2, 0, 45]
+    backend.version = (2, 0, 45)
     backend._mock_client = mock_client
-    return backend
+    yield backend
+    # Drop the shared connection so the next test gets a fresh mock client.
+    backend.close()
 
 
 # ---------------------------------------------------------------------------
-# _convert_twos_comp
+# _twos_complement
 # ---------------------------------------------------------------------------
 
 
-class TestConvertTwosComp:
-    """``_convert_twos_comp(val, bits)`` converts raw unsigned register values."""
+class TestTwosComplement:
+    """``_twos_complement(val)`` converts raw unsigned 16-bit register values."""
 
     @pytest.mark.parametrize(
-        "val, bits, expected",
+        "val, expected",
         [
             # --- Positive values (MSB clear) ---
-            (0, 1, 0),  # zero, 1-bit
-            (1, 2, 1),  # 01 in 2-bit — MSB is 0, stays positive
-            (7, 4, 7),  # 0111 — MSB clear
-            (127, 8, 127),  # max positive 8-bit signed
-            (32767, 16, 32767),  # max positive 16-bit signed
+            (0, 0),  # zero
+            (1, 1),
+            (450, 450),  # maximum output pressure
+            (1000, 1000),  # maximum pressure chamber
+            (32767, 32767),  # max positive 16-bit signed
             # --- Negative values (MSB set) ---
-            (128, 8, -128),  # 1000 0000 → -128
-            (200, 8, -56),  # 200 - 256 = -56
-            (255, 8, -1),  # 1111 1111 → -1
-            (32768, 16, -32768),  # 1000 0000 0000 0000 → -32768
-            (65086, 16, -450),  # -450 encoded as unsigned 16-bit
-            (65535, 16, -1),  # all-ones 16-bit → -1
+            (32768, -32768),  # 1000 0000 0000 0000 → -32768
+            (65086, -450),  # -450 encoded as unsigned 16-bit
+            (65136, -400),  # -400 encoded as unsigned 16-bit
+            (65535, -1),  # all-ones 16-bit → -1
         ],
     )
-    def test_conversion(self, tcp_backend, val, bits, expected):
-        assert tcp_backend._convert_twos_comp(val, bits) == expected
+    def test_conversion(self, val, expected):
+        assert _twos_complement(val) == expected
+
+    @pytest.mark.parametrize("val", [0, 1, 450, 32767, 32768, 65086, 65535])
+    def test_round_trips_write_encoding(self, val):
+        assert _twos_complement(val) & 0xFFFF == val
+
+
+# ---------------------------------------------------------------------------
+# Sensor reads — single block read shared by the getters
+# ---------------------------------------------------------------------------
+
+
+def _make_sensor_block(vacuum: int, pressure: int, output: int, external: int = 0):
+    """Return a read_input_registers side effect serving the sensor registers (269-271, 278) and 0 elsewhere."""
+    registers = {269: vacuum, 270: pressure, 271: output, 278: external}
+
+    def read(address, count=1, **kwargs):
+        resp = MagicMock()
+        resp.registers = [registers.get(register, 0) for register in range(address, address + count)]
+        return resp
+
+    return read
+
+
+class TestSensorBlock:
+    def test_internal_sensor_data_reads_block_and_external_sensor(self, tcp_backend):
+        from pgva.registers import _PGVARegisters as commands
+
+        tcp_backend._mock_client.read_input_registers.reset_mock()
+        tcp_backend._mock_client.read_input_registers.side_effect = _make_sensor_block(65136, 500, 100, 7)
+        result = tcp_backend.get_internal_sensor_data()
+        assert tcp_backend._mock_client.read_input_registers.call_args_list == [
+            call(address=commands.EXTERNAL_SENSOR_VALUE.value, count=1),
+            call(address=commands.VACUUM_ACTUAL_MBAR.value, count=3),
+        ]
+        assert result == {"Extsensor": 7, "VacuumChamber": -400, "PressureChamber": 500, "OutputPressure": 100}
+
+    def test_sensor_reads_skip_unmapped_registers(self, tcp_backend):
+        from pgva.registers import _PGVARegisters as commands
+
+        tcp_backend._mock_client.read_input_registers.reset_mock()
+        tcp_backend._mock_client.read_input_registers.side_effect = _make_sensor_block(65136, 500, 100, 7)
+        tcp_backend.get_internal_sensor_data()
+        mapped = set(commands)
+        for c in tcp_backend._mock_client.read_input_registers.call_args_list:
+            start, count = c.kwargs["address"], c.kwargs["count"]
+            assert all(address in mapped for address in range(start, start + count))
+
+    def test_legacy_firmware_skips_external_sensor(self, tcp_backend):
+        tcp_backend.version = (2, 1, 3)
+        tcp_backend._mock_client.read_input_registers.reset_mock()
+        tcp_backend._mock_client.read_input_registers.side_effect = _make_sensor_block(65136, 500, 100)
+        result = tcp_backend.get_internal_sensor_data()
+        tcp_backend._mock_client.read_input_registers.assert_called_once()
+        assert "Extsensor" not in result
+
+    def test_back_to_back_getters_share_one_read(self, tcp_backend):
+        tcp_backend._config.cache_ttl_ms = 50
+        tcp_backend._mock_client.read_input_registers.reset_mock()
+        tcp_backend._mock_client.read_input_registers.side_effect = _make_sensor_block(65136, 500, 65436)
+        assert tcp_backend.get_vacuum_chamber() == -400
+        assert tcp_backend.get_pressure_chamber() == 500
+        assert tcp_backend.get_output_pressure() == -100
+        tcp_backend._mock_client.read_input_registers.assert_called_once()
+
+    def test_write_invalidates_cached_block(self, tcp_backend):
+        tcp_backend._config.cache_ttl_ms = 50
+        tcp_backend._mock_client.read_input_registers.side_effect = _make_sensor_block(65136, 500, 100)
+        tcp_backend.get_pressure_chamber()
+        tcp_backend.set_pressure_chamber(600)
+        tcp_backend._mock_client.read_input_registers.reset_mock()
+        tcp_backend.get_pressure_chamber()
+        tcp_backend._mock_client.read_input_registers.assert_called_once()
+
+    @pytest.mark.parametrize("raw", [0, 450, 32767, 32768, 65086, 65535])
+    def test_block_decoding_matches_single_getters(self, tcp_backend, raw):
+        tcp_backend._mock_client.read_input_registers.side_effect = _make_sensor_block(raw, 500, raw, 7)
+        result = tcp_backend.get_internal_sensor_data()
+        assert result["VacuumChamber"] == tcp_backend.get_vacuum_chamber() == _twos_complement(raw)
+        assert result["OutputPressure"] == tcp_backend.get_output_pressure() == _twos_complement(raw)
+
+    def test_failed_read_returns_none(self, tcp_backend):
+        from pymodbus.exceptions import ModbusException
+
+        tcp_backend._mock_client.read_input_registers.side_effect = ModbusException("no response")
+        assert tcp_backend.get_output_pressure() is None
+        assert tcp_backend.get_internal_sensor_data() == {
+            "Extsensor": None,
+            "VacuumChamber": None,
+            "PressureChamber": None,
+            "OutputPressure": None,
+        }
+
+
+# ---------------------------------------------------------------------------
+# Cached reads — firmware version and status words
+# ---------------------------------------------------------------------------
+
+
+def _make_status_blocks(status: int = 0, modbus_error: int = 0, warning: int = 0, error: int = 0):
+    """Return a read_input_registers side effect serving the registers from STATUS_WORD (262) to ERROR_WORD (282)."""
+    registers = [0] * 21
+    registers[0] = status
+    registers[275 - 262] = modbus_error
+    registers[281 - 262] = warning
+    registers[282 - 262] = error
+
+    def read(address, count=1, **kwargs):
+        resp = MagicMock()
+        resp.registers = registers[address - 262 : address - 262 + count]
+        return resp
+
+    return read
+
+
+class TestCachedReads:
+    def test_firmware_version_is_not_read_again(self, tcp_backend):
+        tcp_backend._mock_client.read_input_registers.reset_mock()
+        assert tcp_backend.get_firmware_version() == (2, 0, 45)
+        tcp_backend._mock_client.read_input_registers.assert_not_called()
+
+    def test_firmware_version_read_as_one_block(self, tcp_backend):
+        from pgva.registers import _PGVARegisters as commands
+
+        tcp_backend.version = ()
+        tcp_backend._mock_client.read_input_registers.reset_mock()
+        tcp_backend._mock_client.read_input_registers.return_value.registers = [2, 1, 4]
+        assert tcp_backend.get_firmware_version() == (2, 1, 4)
+        tcp_backend._mock_client.read_input_registers.assert_called_once_with(
+            address=commands.FIRMWARE_VERSION.value, count=3
+        )
+
+    def test_failed_firmware_version_read_is_retried(self, tcp_backend):
+        from pymodbus.exceptions import ModbusException
+
+        tcp_backend.version = ()
+        tcp_backend._mock_client.read_input_registers.side_effect = ModbusException("no response")
+        assert tcp_backend.get_firmware_version() == (None, None, None)
+        tcp_backend._mock_client.read_input_registers.side_effect = None
+        tcp_backend._mock_client.read_input_registers.return_value.registers = [2, 0, 45]
+        assert tcp_backend.get_firmware_version() == (2, 0, 45)
+
+    def test_status_word_reused_within_ttl(self, tcp_backend):
+        tcp_backend._config.cache_ttl_ms = 50
+        tcp_backend._mock_client.read_input_registers.reset_mock()
+        tcp_backend.get_status_word()
+        tcp_backend.get_status_word()
+        tcp_backend._mock_client.read_input_registers.assert_called_once()
+
+    def test_status_word_read_again_after_ttl(self, tcp_backend, mocker):
+        tcp_backend._config.cache_ttl_ms = 50
+        clock = mocker.patch("pgva.pgva_communication.time.monotonic_ns", return_value=0)
+        tcp_backend._mock_client.read_input_registers.reset_mock()
+        tcp_backend.get_status_word()
+        clock.return_value = 50_000_000
+        tcp_backend.get_status_word()
+        assert tcp_backend._mock_client.read_input_registers.call_count == 2
+
+    def test_blocks_cached_per_start_and_count(self, tcp_backend):
+        from pgva.registers import _PGVARegisters as commands
+
+        tcp_backend._config.cache_ttl_ms = 50
+        tcp_backend._mock_client.read_input_registers.reset_mock()
+        tcp_backend._mock_client.read_input_registers.return_value.registers = [0, 0]
+        tcp_backend._get_cached_block(commands.STATUS_WORD, 1)
+        tcp_backend._get_cached_block(commands.STATUS_WORD, 2)
+        tcp_backend._get_cached_block(commands.STATUS_WORD, 2)
+        assert tcp_backend._mock_client.read_input_registers.call_count == 2
+        assert set(tcp_backend._read_cache) == {(4, commands.STATUS_WORD, 1), (4, commands.STATUS_WORD, 2)}
+
+    def test_cached_block_is_immutable(self, tcp_backend):
+        from pgva.registers import _PGVARegisters as commands
+
+        tcp_backend._config.cache_ttl_ms = 50
+        tcp_backend._mock_client.read_input_registers.return_value.registers = [0]
+        assert isinstance(tcp_backend._get_cached_block(commands.STATUS_WORD), tuple)
+
+    def test_zero_ttl_disables_cache(self, tcp_backend):
+        tcp_backend._config.cache_ttl_ms = 0
+        tcp_backend._mock_client.read_input_registers.reset_mock()
+        tcp_backend._mock_client.read_input_registers.side_effect = _make_status_blocks()
+        tcp_backend.get_warning_word()
+        tcp_backend.get_warning_word()
+        assert tcp_backend._mock_client.read_input_registers.call_count == 2
+
+
+# ---------------------------------------------------------------------------
+# Status, warning and error word decoding
+# ---------------------------------------------------------------------------
+
+
+class TestWordDecoding:
+    def test_status_word_fields(self, tcp_backend):
+        # Busy, pump building vacuum, trigger open, exhaust valve open
+        tcp_backend._mock_client.read_input_registers.side_effect = _make_status_blocks(
+            status=1 | (2 << 1) | (1 << 7) | (1 << 11)
+        )
+        assert tcp_backend.get_status_word() == {
+            "Status": "Busy",
+            "Pump": "Pump is building vacuum",
+            "Pressure": "Pressure in the tank is nominal",
+            "Vacuum": "Vacuum in the tank is nominal",
+            "EEPROM": "No EEPROM write pending",
+            "TargetPressure": "Target pressure in progress",
+            "Trigger": "Trigger is open",
+            "OutputValveControl": "Exhaust valve management disabled",
+            "OutputValve": "Exhaust valve open",
+        }
+
+    def test_undefined_pump_state_is_decoded(self, tcp_backend):
+        tcp_backend._mock_client.read_input_registers.side_effect = _make_status_blocks(status=3 << 1)
+        assert tcp_backend.get_status_word()["Pump"] == "Unknown pump state"
+
+    def test_warning_word_fields(self, tcp_backend):
+        tcp_backend._mock_client.read_input_registers.side_effect = _make_status_blocks(warning=1 << 9)
+        warning_word = tcp_backend.get_warning_word()
+        assert warning_word["ExternalSensor"] == "External Sensor Verification warning"
+        assert all(v == "Reset" for k, v in warning_word.items() if k != "ExternalSensor")
+
+    def test_error_word_fields(self, tcp_backend):
+        tcp_backend._mock_client.read_input_registers.side_effect = _make_status_blocks(error=1 << 2)
+        error_word = tcp_backend.get_error_word()
+        assert list(error_word) == [
+            "PumpTimeout",
+            "TimeoutPressure",
+            "ModbusError",
+            "LowVoltage",
+            "HighVoltage",
+            "TimeoutExternalSensor",
+        ]
+        assert error_word["ModbusError"] == "Modbus error occurred, please read modbus error word"
+
+    @pytest.mark.parametrize("word", [0, 1 << 3, 1 << 15])
+    def test_undefined_warning_bits_read_as_reset(self, tcp_backend, word):
+        tcp_backend._mock_client.read_input_registers.side_effect = _make_status_blocks(warning=word)
+        warning_word = tcp_backend.get_warning_word()
+        assert set(warning_word.values()) == {"Reset"}
+        assert list(warning_word) == [
+            "SupplyVoltage",
+            "VacuumThreshold",
+            "PressureThreshold",
+            "TargetPressure",
+            "VacuumChamber",
+            "Pump",
+            "ExternalSensor",
+        ]
+
+    @pytest.mark.parametrize(
+        "getter", ["get_status_word", "get_warning_word", "get_error_word", "get_modbus_error_word"]
+    )
+    def test_failed_read_gives_none_fields(self, tcp_backend, getter):
+        from pymodbus.exceptions import ModbusException
+
+        tcp_backend._mock_client.read_input_registers.side_effect = ModbusException("no response")
+        word = getattr(tcp_backend, getter)()
+        assert word
+        assert set(word.values()) == {None}
+
+    def test_reset_word_is_a_fresh_copy(self, tcp_backend):
+        tcp_backend._mock_client.read_input_registers.side_effect = _make_status_blocks()
+        tcp_backend.get_error_word()["PumpTimeout"] = "changed"
+        assert tcp_backend.get_error_word()["PumpTimeout"] == "Reset"
+
+    @pytest.mark.parametrize("status", [0, 1 | (1 << 7)])
+    def test_active_word_is_a_fresh_copy(self, tcp_backend, status):
+        tcp_backend._mock_client.read_input_registers.side_effect = _make_status_blocks(status=status)
+        first = tcp_backend.get_status_word()
+        assert first == tcp_backend.get_status_word()
+        assert first is not tcp_backend.get_status_word()
+
+    @pytest.mark.parametrize(
+        "getter", ["get_status_word", "get_warning_word", "get_error_word", "get_modbus_error_word"]
+    )
+    @pytest.mark.parametrize("word", [0, 1])
+    def test_copy_false_reuses_decoded_word(self, tcp_backend, getter, word):
+        tcp_backend._mock_client.read_input_registers.side_effect = _make_status_blocks(
+            status=word, modbus_error=word, warning=word, error=word
+        )
+        shared = getattr(tcp_backend, getter)(copy=False)
+        assert getattr(tcp_backend, getter)(copy=False) is shared
+        assert getattr(tcp_backend, getter)() == shared
+
+    def test_copy_false_ignores_undefined_bits(self, tcp_backend):
+        tcp_backend._config.cache_ttl_ms = 0
+        tcp_backend._mock_client.read_input_registers.side_effect = _make_status_blocks(status=1)
+        shared = tcp_backend.get_status_word(copy=False)
+        tcp_backend._mock_client.read_input_registers.side_effect = _make_status_blocks(status=1 | (1 << 15))
+        assert tcp_backend.get_status_word(copy=False) is shared
+
+    def test_all_words_copy_false_shares_decoded_words(self, tcp_backend):
+        tcp_backend._mock_client.read_input_registers.side_effect = _make_status_blocks(warning=1)
+        words = tcp_backend.get_all_words(copy=False)
+        assert words["Status"] is tcp_backend.get_status_word(copy=False)
+        assert words["Warning"] is tcp_backend.get_warning_word(copy=False)
+
+    def test_active_modbus_error_logged(self, tcp_backend, caplog):
+        tcp_backend._mock_client.read_input_registers.side_effect = _make_status_blocks(modbus_error=1)
+        with caplog.at_level(logging.ERROR, logger="pgva"):
+            modbus_error_word = tcp_backend.get_modbus_error_word()
+        assert modbus_error_word["OutputActuationTime"].startswith("Trigger time is outside of input range")
+        assert "Active Modbus error(s)" in caplog.text
+
+    def test_words_share_one_block_read(self, tcp_backend):
+        from pgva.registers import _PGVARegisters as commands
+
+        tcp_backend._config.cache_ttl_ms = 50
+        tcp_backend._mock_client.read_input_registers.reset_mock()
+        tcp_backend._mock_client.read_input_registers.side_effect = _make_status_blocks(warning=1)
+        tcp_backend.get_status_word()
+        tcp_backend.get_warning_word()
+        tcp_backend.get_error_word()
+        tcp_backend.get_modbus_error_word()
+        assert tcp_backend._mock_client.read_input_registers.call_args_list == [
+            call(address=commands.STATUS_WORD.value, count=14),
+            call(address=commands.WARNING_WORD.value, count=2),
+        ]
+
+    def test_word_blocks_skip_unmapped_registers(self, tcp_backend):
+        from pgva.registers import _PGVARegisters as commands
+
+        tcp_backend._mock_client.read_input_registers.reset_mock()
+        tcp_backend._mock_client.read_input_registers.side_effect = _make_status_blocks()
+        tcp_backend.get_all_words()
+        mapped = set(commands)
+        for c in tcp_backend._mock_client.read_input_registers.call_args_list:
+            start, count = c.kwargs["address"], c.kwargs["count"]
+            assert all(address in mapped for address in range(start, start + count))
+
+    def test_all_words_from_two_reads_without_cache(self, tcp_backend):
+        tcp_backend._config.cache_ttl_ms = 0
+        tcp_backend._mock_client.read_input_registers.reset_mock()
+        tcp_backend._mock_client.read_input_registers.side_effect = _make_status_blocks(
+            status=1, modbus_error=1, warning=1 << 9, error=1 << 2
+        )
+        words = tcp_backend.get_all_words()
+        assert tcp_backend._mock_client.read_input_registers.call_count == 2
+        assert list(words) == ["Status", "Warning", "Error", "ModbusError"]
+        assert words["Status"]["Status"] == "Busy"
+        assert words["Warning"]["ExternalSensor"] == "External Sensor Verification warning"
+        assert words["Error"]["ModbusError"] == "Modbus error occurred, please read modbus error word"
+        assert words["ModbusError"]["OutputActuationTime"] != "Reset"
+
+    def test_legacy_firmware_reads_words_individually(self, tcp_backend):
+        from pgva.registers import _PGVARegisters as commands
+
+        tcp_backend.version = (2, 1, 3)
+        tcp_backend._mock_client.read_input_registers.reset_mock()
+        tcp_backend._mock_client.read_input_registers.return_value = _make_register_response(0)
+        tcp_backend.get_all_words()
+        addresses = [c.kwargs["address"] for c in tcp_backend._mock_client.read_input_registers.call_args_list]
+        assert addresses == [
+            commands.STATUS_WORD,
+            commands.WARNING_WORD,
+            commands.ERROR_WORD,
+            commands.LAST_MODBUS_ERROR,
+        ]
+
+    def test_all_words_failed_read_gives_none_fields(self, tcp_backend):
+        from pymodbus.exceptions import ModbusException
+
+        tcp_backend._mock_client.read_input_registers.side_effect = ModbusException("no response")
+        words = tcp_backend.get_all_words()
+        assert all(set(word.values()) == {None} for word in words.values())
 
 
 # ---------------------------------------------------------------------------
@@ -161,6 +548,28 @@ class TestSetPressureChamber:
             tcp_backend.set_pressure_chamber(1001)
 
 
+class TestChamberConversion:
+    """Precomputed lookup tables must match the arithmetic conversion for every set point."""
+
+    def test_pressure_table_matches_arithmetic(self):
+        import pgva._constants as consts
+
+        for mbar, raw in consts.PRESSURE_MBAR_TO_RAW.items():
+            assert raw == int(mbar * consts.PRESSURE_CHAMBER_CONVERSION_FACTOR)
+
+    def test_vacuum_table_matches_arithmetic(self):
+        import pgva._constants as consts
+
+        for mbar, raw in consts.VACUUM_MBAR_TO_RAW.items():
+            assert raw == int(mbar * consts.VACUUM_CHAMBER_CONVERSION_FACTOR)
+
+    def test_non_integer_set_point_raises_value_error(self, tcp_backend):
+        """Set points are whole mBar; fractional values are rejected."""
+        with pytest.raises(ValueError):
+            tcp_backend.set_pressure_chamber(500.5)
+        tcp_backend._mock_client.write_register.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # set_vacuum_chamber — validation
 # ---------------------------------------------------------------------------
@@ -191,6 +600,108 @@ class TestSetVacuumChamber:
             tcp_backend.set_vacuum_chamber(-901)
 
 
+# ---------------------------------------------------------------------------
+# set_chambers — single multiple-register write
+# ---------------------------------------------------------------------------
+
+
+class TestSetChambers:
+    """Both chamber set points are written in one request starting at VACUUM_THRESHOLD."""
+
+    def test_writes_both_thresholds_in_one_request(self, tcp_backend):
+        from pgva.registers import _PGVARegisters as commands
+
+        tcp_backend._mock_client.read_input_registers.return_value = _make_register_response(0)
+        tcp_backend.set_chambers(500, -500)
+        tcp_backend._mock_client.write_registers.assert_called_once_with(
+            address=commands.VACUUM_THRESHOLD.value,
+            values=[int(-500 / -0.277), int(500 / 0.5543)],
+        )
+        tcp_backend._mock_client.write_register.assert_not_called()
+
+    def test_invalid_pressure_raises_without_writing(self, tcp_backend):
+        with pytest.raises(ValueError):
+            tcp_backend.set_chambers(1001, -500)
+        tcp_backend._mock_client.write_registers.assert_not_called()
+
+    def test_invalid_vacuum_raises_without_writing(self, tcp_backend):
+        with pytest.raises(ValueError):
+            tcp_backend.set_chambers(500, -199)
+        tcp_backend._mock_client.write_registers.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# set_and_read_output_pressure — reading returned by the final idle poll
+# ---------------------------------------------------------------------------
+
+
+class TestSetAndReadOutputPressure:
+    def _status_block(self, status: int, output: int) -> MagicMock:
+        resp = MagicMock()
+        resp.registers = [status] + [0] * 8 + [output]
+        return resp
+
+    def test_returns_reading_from_idle_poll(self, tcp_backend):
+        from pgva.registers import _PGVARegisters as commands
+
+        tcp_backend._mock_client.read_holding_registers.return_value = _make_register_response(1)
+        tcp_backend._mock_client.read_input_registers.reset_mock()
+        tcp_backend._mock_client.read_input_registers.return_value = self._status_block(0, 65436)
+        assert tcp_backend.set_and_read_output_pressure(-100) == -100
+        tcp_backend._mock_client.read_input_registers.assert_called_once_with(
+            address=commands.STATUS_WORD.value,
+            count=commands.OUTPUT_PRESSURE_ACTUAL_MBAR.value - commands.STATUS_WORD.value + 1,
+        )
+
+    def test_uses_last_poll_after_busy(self, tcp_backend):
+        tcp_backend._mock_client.read_holding_registers.return_value = _make_register_response(1)
+        tcp_backend._mock_client.read_input_registers.side_effect = [
+            self._status_block(1, 0),
+            self._status_block(0, 100),
+        ]
+        assert tcp_backend.set_and_read_output_pressure(100) == 100
+
+    def test_disabled_pump_returns_none_without_writing(self, tcp_backend):
+        tcp_backend._mock_client.read_holding_registers.return_value = _make_register_response(0)
+        assert tcp_backend.set_and_read_output_pressure(100) is None
+        tcp_backend._mock_client.write_register.assert_not_called()
+
+    def test_out_of_range_raises_value_error(self, tcp_backend):
+        tcp_backend._mock_client.read_holding_registers.return_value = _make_register_response(1)
+        with pytest.raises(ValueError):
+            tcp_backend.set_and_read_output_pressure(451)
+
+
+# ---------------------------------------------------------------------------
+# set_output_pressure_ramp — validate everything, then write in order
+# ---------------------------------------------------------------------------
+
+
+class TestSetOutputPressureRamp:
+    def test_writes_each_set_point_in_order(self, tcp_backend):
+        tcp_backend._mock_client.read_holding_registers.return_value = _make_register_response(1)
+        tcp_backend.set_output_pressure_ramp([100, -100, 0])
+        values = [c.kwargs["value"] for c in tcp_backend._mock_client.write_register.call_args_list]
+        assert values == [100, -100 + 2**16, 0]
+
+    def test_checks_pump_once(self, tcp_backend):
+        tcp_backend._mock_client.read_holding_registers.return_value = _make_register_response(1)
+        tcp_backend.set_output_pressure_ramp([100, 200, 300])
+        tcp_backend._mock_client.read_holding_registers.assert_called_once()
+
+    def test_invalid_set_point_raises_without_writing(self, tcp_backend):
+        tcp_backend._mock_client.read_holding_registers.return_value = _make_register_response(1)
+        with pytest.raises(ValueError):
+            tcp_backend.set_output_pressure_ramp([100, 451])
+        tcp_backend._mock_client.write_register.assert_not_called()
+
+    def test_dwell_sleeps_between_set_points(self, tcp_backend, mocker):
+        mock_sleep = mocker.patch("pgva.pgva_communication.time.sleep")
+        tcp_backend._mock_client.read_holding_registers.return_value = _make_register_response(1)
+        tcp_backend.set_output_pressure_ramp([100, 200], dwell_ms=50)
+        assert mock_sleep.call_count == 2
+
+
 # ---------------------------------------------------------------------------
 # set_actuation_time — validation
 # ---------------------------------------------------------------------------
@@ -199,28 +710,95 @@ class TestSetVacuumChamber:
 class TestSetActuationTime:
     """Valid range 5–65534 ms; outside raises ValueError."""
 
+    @pytest.fixture(autouse=True)
+    def mock_sleep(self, mocker):
+        return mocker.patch("pgva.pgva_communication.time.sleep")
+
     def test_minimum_boundary_accepted(self, tcp_backend):
-        tcp_backend._mock_client.read_input_registers.return_value = _make_register_response(0)
         tcp_backend.set_actuation_time(5)
 
     def test_large_valid_value_accepted(self, tcp_backend):
-        tcp_backend._mock_client.read_input_registers.return_value = _make_register_response(0)
         tcp_backend.set_actuation_time(1000)
 
+    def test_does_not_poll_status_word(self, tcp_backend):
+        tcp_backend._mock_client.read_input_registers.reset_mock()
+        tcp_backend.set_actuation_time(100)
+        tcp_backend._mock_client.write_register.assert_called_once()
+        tcp_backend._mock_client.read_input_registers.assert_not_called()
+
+    def test_wait_sleeps_for_actuation_time(self, tcp_backend, mock_sleep):
+        from pgva import _constants as consts
+
+        tcp_backend.set_actuation_time(250)
+        mock_sleep.assert_called_once_with(0.25 + consts.VALVE_ACTUATION_MARGIN_S)
+
+    def test_no_wait_returns_without_sleeping(self, tcp_backend, mock_sleep):
+        tcp_backend.set_actuation_time(250, wait=False)
+        tcp_backend._mock_client.write_register.assert_called_once()
+        mock_sleep.assert_not_called()
+
     def test_below_minimum_raises_value_error(self, tcp_backend):
         with pytest.raises(ValueError):
             tcp_backend.set_actuation_time(4)
 
     def test_at_upper_exclusive_boundary_raises_value_error(self, tcp_backend):
-        """65535 is not in range(5, 65535), so it must be rejected."""
+        """65535 is outside ACTUATION_TIME_RANGE, so it must be rejected."""
         with pytest.raises(ValueError):
             tcp_backend.set_actuation_time(65535)
 
+    def test_maximum_boundary_accepted(self, tcp_backend):
+        tcp_backend.set_actuation_time(65534)
+
     def test_zero_raises_value_error(self, tcp_backend):
         with pytest.raises(ValueError):
             tcp_backend.set_actuation_time(0)
 
 
+# ---------------------------------------------------------------------------
+# run_timed_pressure — validation before any write
+# ---------------------------------------------------------------------------
+
+
+class TestRunTimedPressure:
+    @pytest.fixture(autouse=True)
+    def mock_sleep(self, mocker):
+        return mocker.patch("pgva.pgva_communication.time.sleep")
+
+    def test_sets_pressure_then_triggers_valve(self, tcp_backend):
+        from pgva.registers import _PGVARegisters as commands
+
+        tcp_backend._mock_client.read_holding_registers.return_value = _make_register_response(1)
+        tcp_backend._mock_client.read_input_registers.return_value = _make_register_response(0)
+        tcp_backend.run_timed_pressure(100, 250)
+        addresses = [c.kwargs["address"] for c in tcp_backend._mock_client.write_register.call_args_list]
+        assert addresses == [commands.OUTPUT_PRESSURE_MBAR.value, commands.VALVE_ACTUATION_TIME.value]
+
+    def test_invalid_time_raises_without_writing(self, tcp_backend):
+        tcp_backend._mock_client.read_holding_registers.return_value = _make_register_response(1)
+        with pytest.raises(ValueError):
+            tcp_backend.run_timed_pressure(100, 4)
+        tcp_backend._mock_client.write_register.assert_not_called()
+
+    def test_invalid_pressure_raises_before_pump_check(self, tcp_backend):
+        tcp_backend._mock_client.read_holding_registers.return_value = _make_register_response(0)
+        with pytest.raises(ValueError):
+            tcp_backend.run_timed_pressure(451, 250)
+        tcp_backend._mock_client.read_holding_registers.assert_not_called()
+
+    def test_disabled_pump_skips_valve(self, tcp_backend):
+        tcp_backend._mock_client.read_holding_registers.return_value = _make_register_response(0)
+        tcp_backend.run_timed_pressure(100, 250)
+        tcp_backend._mock_client.write_register.assert_not_called()
+
+    def test_failed_pressure_write_skips_valve(self, tcp_backend):
+        from pymodbus.exceptions import ModbusException
+
+        tcp_backend._mock_client.read_holding_registers.return_value = _make_register_response(1)
+        tcp_backend._mock_client.write_register.side_effect = ModbusException("no response")
+        tcp_backend.run_timed_pressure(100, 250)
+        tcp_backend._mock_client.write_register.assert_called_once()
+
+
 # ---------------------------------------------------------------------------
 # toggle_manual_trigger — always NotImplementedError
 # ---------------------------------------------------------------------------
@@ -252,11 +830,168 @@ class TestValidatePumpEnable:
 
     def test_returns_true_for_firmware_2_1_3_regardless_of_register(self, tcp_backend):
         """Firmware 2.1.3 does not support pump enable — always returns True."""
-        tcp_backend.version = [2, 1, 3]
+        tcp_backend.version = (2, 1, 3)
         # Even if holding register says 0, the bypass should fire.
         tcp_backend._mock_client.read_holding_registers.return_value = _make_register_response(0)
         assert tcp_backend._validate_pump_enable() is True
 
+    def test_enable_state_read_once(self, tcp_backend):
+        tcp_backend._mock_client.read_holding_registers.return_value = _make_register_response(1)
+        tcp_backend._validate_pump_enable()
+        tcp_backend._validate_pump_enable()
+        tcp_backend._mock_client.read_holding_registers.assert_called_once()
+
+    def test_toggle_updates_cached_state_without_reading(self, tcp_backend):
+        tcp_backend.toggle_pump(False)
+        assert tcp_backend._validate_pump_enable() is False
+        tcp_backend.toggle_pump(True)
+        assert tcp_backend._validate_pump_enable() is True
+        tcp_backend._mock_client.read_holding_registers.assert_not_called()
+
+    def test_invalidate_reads_state_again(self, tcp_backend):
+        tcp_backend._mock_client.read_holding_registers.return_value = _make_register_response(1)
+        tcp_backend._validate_pump_enable()
+        tcp_backend._mock_client.read_holding_registers.return_value = _make_register_response(0)
+        tcp_backend.invalidate_pump_cache()
+        assert tcp_backend._validate_pump_enable() is False
+        assert tcp_backend._mock_client.read_holding_registers.call_count == 2
+
+    def test_failed_read_is_not_cached(self, tcp_backend):
+        from pymodbus.exceptions import ModbusException
+
+        tcp_backend._mock_client.read_holding_registers.side_effect = [
+            ModbusException("no response"),
+            _make_register_response(1),
+        ]
+        assert tcp_backend._validate_pump_enable() is False
+        assert tcp_backend._validate_pump_enable() is True
+
+    @pytest.mark.parametrize("toggle", ["toggle_pump", "_enable_pump", "_disable_pump"])
+    def test_failed_toggle_is_not_cached(self, tcp_backend, toggle):
+        from pymodbus.exceptions import ModbusException
+
+        tcp_backend._mock_client.read_holding_registers.return_value = _make_register_response(1)
+        tcp_backend._validate_pump_enable()
+        tcp_backend._mock_client.write_register.side_effect = ModbusException("no response")
+        if toggle == "toggle_pump":
+            tcp_backend.toggle_pump(False)
+        else:
+            getattr(tcp_backend, toggle)()
+        tcp_backend._mock_client.read_holding_registers.return_value = _make_register_response(0)
+        assert tcp_backend._validate_pump_enable() is False
+        assert tcp_backend._mock_client.read_holding_registers.call_count == 2
+
+
+class TestFirmwareFeatureFlags:
+    @pytest.mark.parametrize(
+        "version, supported",
+        [
+            ((2, 0, 45), True),
+            ((2, 1, 3), False),
+            ((2, 1, 4), True),
+            ((), True),
+        ],
+    )
+    def test_flags_follow_version(self, tcp_backend, version, supported):
+        tcp_backend.version = version
+        assert tcp_backend._supports_pump_enable is supported
+        assert tcp_backend._has_external_sensor is supported
+
+    def test_version_stored_as_tuple(self, tcp_backend):
+        tcp_backend.version = [2, 1, 3]
+        assert tcp_backend.version == (2, 1, 3)
+        assert tcp_backend._supports_pump_enable is False
+
+
+# ---------------------------------------------------------------------------
+# print_driver_information — sensor read skipped when INFO is disabled
+# ---------------------------------------------------------------------------
+
+
+class TestPrintDriverInformation:
+    def test_skips_sensor_read_when_info_disabled(self, tcp_backend, caplog):
+        caplog.set_level(logging.WARNING, logger="pgva")
+        tcp_backend._mock_client.read_input_registers.reset_mock()
+        tcp_backend.print_driver_information()
+        tcp_backend._mock_client.read_input_registers.assert_not_called()
+
+    def test_reads_sensors_when_info_enabled(self, tcp_backend, caplog):
+        caplog.set_level(logging.INFO, logger="pgva")
+        tcp_backend._mock_client.read_input_registers.reset_mock()
+        tcp_backend._mock_client.read_input_registers.side_effect = _make_sensor_block(65136, 500, 100)
+        tcp_backend.print_driver_information()
+        tcp_backend._mock_client.read_input_registers.assert_called()
+        assert "Driver Information:" in caplog.text
+
+
+# ---------------------------------------------------------------------------
+# _set_data — 16-bit two's complement encoding of written values
+# ---------------------------------------------------------------------------
+
+
+class TestSetDataEncoding:
+    @pytest.mark.parametrize(
+        "val, expected",
+        [
+            (0, 0),
+            (450, 450),
+            (-1, 65535),
+            (-450, 65086),
+            (-900, 64636),
+        ],
+    )
+    def test_single_register_encoding(self, tcp_backend, val, expected):
+        from pgva.registers import _PGVARegisters as commands
+
+        tcp_backend._set_data(commands.OUTPUT_PRESSURE_MBAR, val)
+        assert tcp_backend._mock_client.write_register.call_args.kwargs["value"] == expected
+
+    def test_multiple_register_encoding(self, tcp_backend):
+        from pgva.registers import _PGVARegisters as commands
+
+        tcp_backend._set_data_multiple(commands.VACUUM_THRESHOLD, [-1, 1])
+        assert tcp_backend._mock_client.write_registers.call_args.kwargs["values"] == [65535, 1]
+
+
+# ---------------------------------------------------------------------------
+# Request errors — logged and returned as None
+# ---------------------------------------------------------------------------
+
+
+class TestModbusCallErrors:
+    def test_read_error_returns_none(self, tcp_backend, caplog):
+        from pymodbus.exceptions import ModbusException
+
+        from pgva.registers import _PGVARegisters as commands
+
+        tcp_backend._mock_client.read_input_registers.side_effect = ModbusException("no response")
+        with caplog.at_level(logging.ERROR, logger="pgva"):
+            assert tcp_backend._get_data_block(commands.STATUS_WORD, 1) is None
+        assert "Modbus exception while reading block" in caplog.text
+
+    def test_write_error_returns_none_without_polling(self, tcp_backend):
+        from pymodbus.exceptions import ModbusException
+
+        from pgva.registers import _PGVARegisters as commands
+
+        tcp_backend._mock_client.write_register.side_effect = ModbusException("no response")
+        tcp_backend._mock_client.read_input_registers.reset_mock()
+        assert tcp_backend._set_data(commands.OUTPUT_PRESSURE_MBAR, 100) is None
+        tcp_backend._mock_client.read_input_registers.assert_not_called()
+
+    def test_requests_logged_with_register_names(self, tcp_backend, caplog):
+        from pgva.pgva_communication import _STATUS_WORD_ADDRESS
+
+        with caplog.at_level(logging.DEBUG, logger="pgva"):
+            tcp_backend._get_data_block(_STATUS_WORD_ADDRESS, 1)
+            tcp_backend._get_data_block(276, 1)
+        assert "Reading 1 input registers from: STATUS_WORD (262)" in caplog.text
+        assert "Reading 1 input registers from: 276" in caplog.text
+
+    def test_wrapper_keeps_method_metadata(self):
+        assert PGVAModbusTCP._set_data.__name__ == "_set_data"
+        assert "Method used to write to registers." in PGVAModbusTCP._set_data.__doc__
+
 
 # ---------------------------------------------------------------------------
 # _set_data — TimeoutError when device remains busy
@@ -273,7 +1008,7 @@ class TestSetDataTimeout:
 
         from pgva.registers import _PGVARegisters as commands
 
-        with pytest.raises(TimeoutError):
+        with pytest.raises(TimeoutError, match=r"OUTPUT_PRESSURE_MBAR \(4112\)"):
             tcp_backend._set_data(commands.OUTPUT_PRESSURE_MBAR, 100, timeout=0.05)
 
     def test_completes_without_error_when_device_is_not_busy(self, tcp_backend):
@@ -286,3 +1021,213 @@ class TestSetDataTimeout:
 
         # Should complete without exception.
         tcp_backend._set_data(commands.OUTPUT_PRESSURE_MBAR, 100, timeout=1.0)
+
+
+class TestBusyPollBackoff:
+    def test_delay_doubles_up_to_cap(self, tcp_backend, mocker):
+        from pgva import _constants as consts
+        from pgva.registers import _PGVARegisters as commands
+
+        mock_sleep = mocker.patch("pgva.pgva_communication.time.sleep")
+        tcp_backend._mock_client.read_input_registers.side_effect = [_make_register_response(1)] * 7 + [
+            _make_register_response(0)
+        ]
+        tcp_backend._set_data(commands.OUTPUT_PRESSURE_MBAR, 100)
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert delays == [0.001, 0.002, 0.004, 0.008, 0.016, consts.POLL_DELAY_MAX_S, consts.POLL_DELAY_MAX_S]
+
+    def test_idle_device_is_not_slept_on(self, tcp_backend, mocker):
+        from pgva.registers import _PGVARegisters as commands
+
+        mock_sleep = mocker.patch("pgva.pgva_communication.time.sleep")
+        tcp_backend._set_data(commands.OUTPUT_PRESSURE_MBAR, 100)
+        mock_sleep.assert_not_called()
+
+    def test_poll_uses_client_assigned_later(self, tcp_backend):
+        from pgva.registers import _PGVARegisters as commands
+
+        replacement = MagicMock()
+        replacement.read_input_registers.return_value = _make_register_response(0)
+        tcp_backend.client = replacement
+        tcp_backend._set_data(commands.OUTPUT_PRESSURE_MBAR, 100)
+        replacement.read_input_registers.assert_called_once_with(address=commands.STATUS_WORD, count=1)
+
+    def test_pump_toggle_skips_polling(self, tcp_backend):
+        tcp_backend._mock_client.read_input_registers.reset_mock()
+        tcp_backend.toggle_pump(True)
+        tcp_backend._mock_client.write_register.assert_called_once()
+        tcp_backend._mock_client.read_input_registers.assert_not_called()
+
+    @pytest.mark.parametrize("baudrate, expected", [(9600, 22 * 11 / 9600), (1000000, 0.001)])
+    def test_serial_minimum_delay_follows_baudrate(self, mocker, baudrate, expected):
+        from pgva.pgva_communication import PGVAModbusSerial
+        from pgva.pgva_config import PGVASerialConfig
+
+        mock_client = MagicMock()
+        mock_client.read_input_registers.return_value = _make_register_response(0)
+        mocker.patch("pgva.pgva_communication.ModbusSerialClient", return_value=mock_client)
+        backend = PGVAModbusSerial(PGVASerialConfig(interface="serial", com_port="COM1", baudrate=baudrate))
+        try:
+            assert backend._poll_delay_min == pytest.approx(expected)
+        finally:
+            backend.close()
+
+
+# ---------------------------------------------------------------------------
+# Shared Modbus connections
+# ---------------------------------------------------------------------------
+
+
+class TestSharedConnection:
+    @pytest.fixture()
+    def mock_tcp_class(self, mocker):
+        mock_client = MagicMock()
+        mock_client.read_input_registers.return_value = _make_register_response(0)
+        return mocker.patch("pgva.pgva_communication.ModbusTcpClient", return_value=mock_client)
+
+    def test_same_device_reuses_connection(self, mock_tcp_class):
+        config = PGVATCPConfig(interface="tcp/ip", ip="192.168.0.2", port=502, unit_id=1)
+        first = PGVAModbusTCP(config=config)
+        second = PGVAModbusTCP(config=config)
+        try:
+            mock_tcp_class.assert_called_once_with(host="192.168.0.2", port=502)
+            assert first.client is second.client
+        finally:
+            first.close()
+            second.close()
+
+    def test_connection_closed_after_last_release(self, mock_tcp_class):
+        config = PGVATCPConfig(interface="tcp/ip", ip="192.168.0.2", port=502, unit_id=1)
+        first = PGVAModbusTCP(config=config)
+        second = PGVAModbusTCP(config=config)
+        first.close()
+        first.client.close.assert_not_called()
+        second.close()
+        second.client.close.assert_called_once_with()
+
+    def test_close_is_idempotent(self, mock_tcp_class):
+        config = PGVATCPConfig(interface="tcp/ip", ip="192.168.0.2", port=502, unit_id=1)
+        first = PGVAModbusTCP(config=config)
+        second = PGVAModbusTCP(config=config)
+        first.close()
+        first.close()
+        second.client.close.assert_not_called()
+        second.close()
+
+    def test_write_clears_read_cache_of_every_backend(self, mock_tcp_class):
+        config = PGVATCPConfig(interface="tcp/ip", ip="192.168.0.2", port=502, unit_id=1, cache_ttl_ms=50)
+        first = PGVAModbusTCP(config=config)
+        second = PGVAModbusTCP(config=config)
+        try:
+            first.get_status_word()
+            assert second._read_cache
+            second.set_pressure_chamber(300)
+            mock_tcp_class.return_value.read_input_registers.reset_mock()
+            first.get_status_word()
+            mock_tcp_class.return_value.read_input_registers.assert_called_once()
+        finally:
+            first.close()
+            second.close()
+
+    def test_pump_toggle_seen_by_every_backend(self, mock_tcp_class):
+        mock_tcp_class.return_value.read_holding_registers.return_value = _make_register_response(1)
+        config = PGVATCPConfig(interface="tcp/ip", ip="192.168.0.2", port=502, unit_id=1)
+        first = PGVAModbusTCP(config=config)
+        second = PGVAModbusTCP(config=config)
+        try:
+            assert second._validate_pump_enable() is True
+            first.toggle_pump(False)
+            assert second._validate_pump_enable() is False
+            mock_tcp_class.return_value.read_holding_registers.assert_called_once()
+        finally:
+            first.close()
+            second.close()
+
+    def test_pump_state_dropped_after_last_release(self, mock_tcp_class):
+        mock_tcp_class.return_value.read_holding_registers.return_value = _make_register_response(1)
+        config = PGVATCPConfig(interface="tcp/ip", ip="192.168.0.2", port=502, unit_id=1)
+        first = PGVAModbusTCP(config=config)
+        first.toggle_pump(False)
+        first.close()
+        second = PGVAModbusTCP(config=config)
+        try:
+            assert second._validate_pump_enable() is True
+        finally:
+            second.close()
+
+    def test_failed_construction_releases_connection(self, mock_tcp_class):
+        from pgva.pgva_communication import _client_refcount
+
+        mock_tcp_class.return_value.read_input_registers.side_effect = ConnectionResetError("peer reset")
+        config = PGVATCPConfig(interface="tcp/ip", ip="192.168.0.2", port=502, unit_id=1)
+        backend = PGVAModbusTCP(config=config)
+        mock_tcp_class.return_value.close.assert_called_once_with()
+        assert backend._client_key is None
+        assert ("tcp", "192.168.0.2", 502, 1) not in _client_refcount
+
+    def test_failed_construction_leaves_other_backends_open(self, mock_tcp_class, mocker):
+        config = PGVATCPConfig(interface="tcp/ip", ip="192.168.0.2", port=502, unit_id=1)
+        first = PGVAModbusTCP(config=config)
+        mocker.patch.object(PGVAModbusTCP, "get_firmware_version", side_effect=RuntimeError("unexpected"))
+        with pytest.raises(RuntimeError):
+            PGVAModbusTCP(config=config)
+        first.client.close.assert_not_called()
+        first.close()
+        first.client.close.assert_called_once_with()
+
+    def test_disables_nagle_and_enables_keepalive(self, mock_tcp_class):
+        backend = PGVAModbusTCP(config=PGVATCPConfig(interface="tcp/ip", ip="192.168.0.2"))
+        try:
+            backend.client.socket.setsockopt.assert_any_call(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            backend.client.socket.setsockopt.assert_any_call(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        finally:
+            backend.close()
+
+    def test_missing_socket_is_skipped(self, mock_tcp_class):
+        mock_tcp_class.return_value.socket = None
+        backend = PGVAModbusTCP(config=PGVATCPConfig(interface="tcp/ip", ip="192.168.0.2"))
+        backend.close()
+
+    def test_firmware_version_read_once_per_connection(self, mock_tcp_class):
+        mock_tcp_class.return_value.read_input_registers.return_value.registers = [2, 0, 45]
+        config = PGVATCPConfig(interface="tcp/ip", ip="192.168.0.2", port=502, unit_id=1)
+        first = PGVAModbusTCP(config=config)
+        second = PGVAModbusTCP(config=config)
+        try:
+            assert second.version == (2, 0, 45)
+            mock_tcp_class.return_value.read_input_registers.assert_called_once()
+        finally:
+            first.close()
+            second.close()
+
+    def test_firmware_version_read_again_after_reconnect(self, mock_tcp_class):
+        mock_tcp_class.return_value.read_input_registers.return_value.registers = [2, 0, 45]
+        config = PGVATCPConfig(interface="tcp/ip", ip="192.168.0.2", port=502, unit_id=1)
+        PGVAModbusTCP(config=config).close()
+        PGVAModbusTCP(config=config).close()
+        assert mock_tcp_class.return_value.read_input_registers.call_count == 2
+
+    def test_serial_port_shared_between_backends(self, mocker):
+        from pgva.pgva_communication import PGVAModbusSerial
+        from pgva.pgva_config import PGVASerialConfig
+
+        mock_client = MagicMock()
+        mock_client.read_input_registers.return_value = _make_register_response(0)
+        mock_serial_class = mocker.patch("pgva.pgva_communication.ModbusSerialClient", return_value=mock_client)
+        config = PGVASerialConfig(interface="serial", com_port="COM1", baudrate=115200)
+        first = PGVAModbusSerial(config)
+        second = PGVAModbusSerial(config)
+        mock_serial_class.assert_called_once_with(port="COM1", baudrate=115200)
+        first.close()
+        mock_client.close.assert_not_called()
+        second.close()
+        mock_client.close.assert_called_once_with()
+
+    def test_different_devices_use_separate_connections(self, mock_tcp_class):
+        first = PGVAModbusTCP(config=PGVATCPConfig(interface="tcp/ip", ip="192.168.0.2"))
+        second = PGVAModbusTCP(config=PGVATCPConfig(interface="tcp/ip", ip="192.168.0.3"))
+        try:
+            assert mock_tcp_class.call_count == 2
+        finally:
+            first.close()
+            second.close()
@@ -3,6 +3,7 @@
 import pytest
 
 from pgva import PGVA, PGVATCPConfig, PGVASerialConfig
+from pgva.pgva_config import PGVAConfig
 
 
 class TestPGVATCPConfig:
@@ -21,6 +22,10 @@ class TestPGVATCPConfig:
         config = PGVATCPConfig(interface="tcp/ip", ip="192.168.0.1")
         assert config.unit_id == 1
 
+    def test_default_cache_ttl(self):
+        config = PGVATCPConfig(interface="tcp/ip", ip="192.168.0.1")
+        assert config.cache_ttl_ms == 0
+
     def test_custom_port(self):
         config = PGVATCPConfig(interface="tcp/ip", ip="10.0.0.5", port=5020)
         assert config.port == 5020
@@ -29,6 +34,12 @@ class TestPGVATCPConfig:
         config = PGVATCPConfig(interface="tcp/ip", ip="10.0.0.5", unit_id=3)
         assert config.unit_id == 3
 
+    def test_uses_slots(self):
+        config = PGVATCPConfig(interface="tcp/ip", ip="192.168.0.1")
+        assert not hasattr(config, "__dict__")
+        with pytest.raises(AttributeError):
+            config.hostname = "pgva"
+
 
 class TestPGVASerialConfig:
     """Tests for PGVASerialConfig dataclass field storage."""
@@ -55,6 +66,19 @@ class TestPGVAConstructor:
         with pytest.raises(TypeError):
             PGVA(config=None)
 
+    def test_raises_type_error_for_base_config(self):
+        with pytest.raises(TypeError):
+            PGVA(config=PGVAConfig(interface="tcp/ip"))
+
+    def test_tcp_config_subclass_uses_tcp_backend(self, mocker):
+        class CustomTCPConfig(PGVATCPConfig):
+            pass
+
+        mock_tcp = mocker.patch("pgva.pgva.PGVAModbusTCP")
+        config = CustomTCPConfig(interface="tcp/ip", ip="192.168.0.1")
+        PGVA(config=config)
+        mock_tcp.assert_called_once_with(config=config)
+
     def test_raises_not_implemented_for_serial_config(self):
         config = PGVASerialConfig(interface="serial", com_port="COM1", baudrate=115200)
         with pytest.raises(NotImplementedError):
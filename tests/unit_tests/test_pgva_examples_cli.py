@@ -0,0 +1,77 @@
+"""Unit tests for the ``python -m pgva.examples`` command line."""
+
+import pytest
+
+from pgva.examples.__main__ import main
+
+
+@pytest.fixture()
+def mock_pgva(mocker):
+    """Patch the PGVA class used by the command line and return the instance it creates."""
+    mock_class = mocker.patch("pgva.examples.__main__.PGVA")
+    return mock_class.return_value
+
+
+class TestConnectionOptions:
+    def test_builds_tcp_config_from_arguments(self, mocker):
+        mock_class = mocker.patch("pgva.examples.__main__.PGVA")
+        main(["--ip", "10.0.0.5", "--port", "5020", "--unit-id", "3", "print-info"])
+        config = mock_class.call_args.kwargs["config"]
+        assert (config.ip, config.port, config.unit_id) == ("10.0.0.5", 5020, 3)
+
+    def test_ip_defaults_to_environment(self, mocker, monkeypatch):
+        monkeypatch.setenv("PGVA_IP", "10.0.0.9")
+        mock_class = mocker.patch("pgva.examples.__main__.PGVA")
+        main(["print-info"])
+        assert mock_class.call_args.kwargs["config"].ip == "10.0.0.9"
+
+    def test_no_command_exits(self, mock_pgva):
+        with pytest.raises(SystemExit):
+            main(["--ip", "10.0.0.5"])
+
+    def test_unknown_command_exits(self, mock_pgva):
+        with pytest.raises(SystemExit):
+            main(["set-pressure", "print-info"])
+
+
+class TestCommands:
+    def test_set_output_pressure(self, mock_pgva):
+        mock_pgva.set_and_read_output_pressure.return_value = -100
+        assert main(["set-output-pressure", "--mbar", "-100"]) == 0
+        mock_pgva.set_and_read_output_pressure.assert_called_once_with(-100)
+
+    def test_run_timed_pressure(self, mock_pgva):
+        main(["run-timed-pressure", "--mbar", "100", "--ms", "250"])
+        mock_pgva.run_timed_pressure.assert_called_once_with(100, 250)
+
+    def test_set_chambers(self, mock_pgva):
+        main(["set-chambers", "--pressure", "300", "--vacuum", "-300"])
+        mock_pgva.set_chambers.assert_called_once_with(300, -300)
+
+    def test_toggle_pump(self, mock_pgva):
+        main(["toggle-pump", "off"])
+        mock_pgva.toggle_pump.assert_called_once_with(False)
+
+    def test_missing_required_option_exits(self, mock_pgva):
+        with pytest.raises(SystemExit):
+            main(["set-output-pressure"])
+
+
+class TestChainedCommands:
+    def test_runs_commands_in_order_on_one_instance(self, mocker):
+        mock_class = mocker.patch("pgva.examples.__main__.PGVA")
+        main(["print-info", "set-output-pressure", "--mbar", "100", "read-sensors"])
+        mock_class.assert_called_once()
+        names = [c[0] for c in mock_class.return_value.method_calls]
+        assert names == [
+            "print_driver_information",
+            "set_and_read_output_pressure",
+            "get_internal_sensor_data",
+            "close",
+        ]
+
+    def test_closes_instance_when_a_command_fails(self, mock_pgva):
+        mock_pgva.set_and_read_output_pressure.side_effect = ValueError
+        with pytest.raises(ValueError):
+            main(["set-output-pressure", "--mbar", "999"])
+        mock_pgva.close.assert_called_once_with()
@@ -1,3 +1,5 @@
+import subprocess
+import sys
 from unittest.mock import MagicMock, patch
 
 from pgva import PGVATCPConfig, PGVA
@@ -12,3 +14,14 @@ class TestPGVA:
         pgva = PGVA(pgva_config)
 
         assert isinstance(pgva, PGVA)
+
+    @patch("pgva.pgva.PGVAModbusTCP")
+    def test_instance_uses_slots(self, mock_tcp_class):
+        pgva = PGVA(PGVATCPConfig(interface="tcp/ip", ip="192.168.0.1"))
+        assert not hasattr(pgva, "__dict__")
+
+
+class TestLazyImport:
+    def test_package_import_defers_pymodbus(self):
+        code = "import sys, pgva; assert 'pymodbus' not in sys.modules; pgva.PGVA; assert 'pymodbus' in sys.modules"
+        subprocess.run([sys.executable, "-c", code], check=True)